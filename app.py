@@ -2,21 +2,57 @@
 """
 
 import logging
-from decouple import config
+from decouple import Choices, config
 
 from telegram.ext import Application
 
 from bot.conversations import (
-    CLOSE_MSG_HANDLER,
+    CALLBACK_QUERY_ROUTER_HANDLER,
 )
 from bot.conversations import (
     CHOICE_GAME_HANDLERS,
-    PLAY_GAME_HANDLERS,
+    restore_game,
 )
+from bot.functions.game import (
+    GAME_STORE_KEY,
+    GAME_SWEEP_INTERVAL,
+    flush_game_store,
+    get_game_store,
+    sweep_games
+)
+from bot.functions.game_store import (
+    GAME_STORE_FLUSH_INTERVAL,
+    create_mongo_game_store
+)
+from bot.games.game_id import GAME_ID_GENERATOR
 
 TELEGRAM_TOKEN = config("TELEGRAM_TOKEN")
 # MY_GROUP_ID = config("MY_GROUP_ID", cast=int)
 IS_PRODUCTION = config("IS_PRODUCTION", cast=bool, default=True)
+POLLING_MODE = 'polling'
+WEBHOOK_MODE = 'webhook'
+UPDATE_MODE = config(
+    "UPDATE_MODE",
+    default=POLLING_MODE,
+    cast=Choices([POLLING_MODE, WEBHOOK_MODE]),
+)
+WEBHOOK_LISTEN = config("WEBHOOK_LISTEN", default="127.0.0.1")
+WEBHOOK_PORT = config("WEBHOOK_PORT", cast=int, default=8443)
+WEBHOOK_PATH = config("WEBHOOK_PATH", default="webhook")
+# URL pública (ex: do proxy reverso) registrada no Telegram. Obrigatória no
+# modo webhook, pois o Telegram não alcança o endereço de WEBHOOK_LISTEN.
+WEBHOOK_URL = config("WEBHOOK_URL", default="")
+WEBHOOK_SECRET_TOKEN = config("WEBHOOK_SECRET_TOKEN", default=None)
+# Número de updates processados ao mesmo tempo. As ações de uma mesma
+# partida continuam em ordem graças ao GameActor e ao get_game_lock.
+CONCURRENT_UPDATES = config("CONCURRENT_UPDATES", cast=int, default=64)
+# Cada processo que cria partidas precisa de um GAME_ID_WORKER_ID diferente
+# para que os IDs das partidas não colidam.
+GAME_ID_WORKER_ID = config("GAME_ID_WORKER_ID", cast=int, default=0)
+# Se MONGO_URI for vazia, as partidas ficam somente na memória.
+MONGO_URI = config("MONGO_URI", default="")
+MONGO_DATABASE = config("MONGO_DATABASE", default="ludus")
+MONGO_GAME_COLLECTION = config("MONGO_GAME_COLLECTION", default="games")
 (
     DEFAULT_GROUP,
     CHAT_XP_GROUP,
@@ -43,23 +79,82 @@ logger.addHandler(file_handler)
 logger.addHandler(console_handler)
 
 
-def main() -> None:
-    """Run the bot."""
+async def close_game_store(application: Application):
+    """Write the pending games to MongoDB before shutting down."""
+    store = get_game_store(context=application)
+    if store is not None:
+        await store.flush()
+        store.close()
+
+
+def build_application() -> Application:
+    """Create the Application with all handlers."""
+    GAME_ID_GENERATOR.set_worker_id(GAME_ID_WORKER_ID)
+
     # Create the Application and pass it your bot's token.
-    application = Application.builder().token(TELEGRAM_TOKEN).build()
+    application = (
+        Application.builder()
+        .token(TELEGRAM_TOKEN)
+        .concurrent_updates(CONCURRENT_UPDATES)
+        .post_shutdown(close_game_store)
+        .build()
+    )
 
     # Add Single Handler
-    application.add_handler(CLOSE_MSG_HANDLER)
+    application.add_handler(CALLBACK_QUERY_ROUTER_HANDLER)
 
     # Add Multiple Handlers
     application.add_handlers(CHOICE_GAME_HANDLERS)
-    application.add_handlers(PLAY_GAME_HANDLERS)
 
     # Add Jobs
-    # application.job_queue.run_repeating()
+    application.job_queue.run_repeating(
+        sweep_games,
+        interval=GAME_SWEEP_INTERVAL,
+        first=GAME_SWEEP_INTERVAL,
+        name='SWEEP_GAMES',
+    )
+    if MONGO_URI:
+        application.bot_data[GAME_STORE_KEY] = create_mongo_game_store(
+            uri=MONGO_URI,
+            database=MONGO_DATABASE,
+            collection=MONGO_GAME_COLLECTION,
+            load_function=restore_game,
+        )
+        application.job_queue.run_repeating(
+            flush_game_store,
+            interval=GAME_STORE_FLUSH_INTERVAL,
+            first=GAME_STORE_FLUSH_INTERVAL,
+            name='FLUSH_GAME_STORE',
+        )
+
+    return application
+
+
+def main() -> None:
+    """Run the bot."""
+    if UPDATE_MODE == WEBHOOK_MODE and not WEBHOOK_URL:
+        raise SystemExit(
+            'WEBHOOK_URL precisa ser definida no modo webhook: é a URL '
+            'pública registrada no Telegram.'
+        )
+
+    application = build_application()
 
     # Run the bot until the user presses Ctrl-C
-    application.run_polling()
+    if UPDATE_MODE == WEBHOOK_MODE:
+        logger.info(
+            f'Iniciando webhook em {WEBHOOK_LISTEN}:{WEBHOOK_PORT}'
+            f'/{WEBHOOK_PATH}'
+        )
+        application.run_webhook(
+            listen=WEBHOOK_LISTEN,
+            port=WEBHOOK_PORT,
+            url_path=WEBHOOK_PATH,
+            webhook_url=WEBHOOK_URL,
+            secret_token=WEBHOOK_SECRET_TOKEN,
+        )
+    else:
+        application.run_polling()
 
 
 if __name__ == "__main__":
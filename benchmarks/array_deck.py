@@ -0,0 +1,116 @@
+'''Compara o ArrayDeck (códigos em um array de uint16) com o BaseDeck
+(lista de Card) nas operações das simulações sem interface: criar e
+embaralhar o deck, comprar as cartas de 5 em 5, contar os naipes e
+somar os valores.
+
+Uso:
+    python -m benchmarks.array_deck
+'''
+
+from timeit import repeat
+
+from bot.games.cards.nine_nine import NineNineCard
+from bot.games.decks.array_deck import ArrayDeck
+from bot.games.decks.deck import BaseDeck
+from bot.games.enums.card import NineNineNames, NineNineSuits
+from bot.games.game_random import GameRandom
+
+
+BENCHMARK_NUMBER = 200
+BENCHMARK_REPEAT = 5
+BENCHMARK_TOTAL_DECKS = 4
+BENCHMARK_DRAW_QUANTITY = 5
+
+
+def make_deck(deck_class: type, is_shuffle: bool = True) -> BaseDeck:
+    return deck_class(
+        names=NineNineNames,
+        suits=NineNineSuits,
+        is_shuffle=is_shuffle,
+        total_decks=BENCHMARK_TOTAL_DECKS,
+        card_class=NineNineCard,
+        random=GameRandom(42),
+    )
+
+
+def draw_all(deck_class: type):
+    deck = make_deck(deck_class, is_shuffle=False)
+    while deck:
+        deck.draw(BENCHMARK_DRAW_QUANTITY)
+
+
+def draw_all_codes():
+    deck = make_deck(ArrayDeck, is_shuffle=False)
+    while deck:
+        deck.draw_codes(BENCHMARK_DRAW_QUANTITY)
+
+
+def get_best_time(function) -> float:
+    '''Retorna o melhor tempo médio, em microssegundos, de uma chamada.
+    '''
+
+    time_list = repeat(
+        function,
+        number=BENCHMARK_NUMBER,
+        repeat=BENCHMARK_REPEAT,
+    )
+
+    return min(time_list) / BENCHMARK_NUMBER * 1_000_000
+
+
+def main():
+    deck = make_deck(BaseDeck)
+    array_deck = make_deck(ArrayDeck)
+    assert list(deck) == list(array_deck)
+    assert deck.count_suits() == array_deck.count_suits()
+    assert deck.total_value == array_deck.total_value
+
+    result_list = [
+        (
+            'create + shuffle',
+            get_best_time(lambda: make_deck(BaseDeck)),
+            get_best_time(lambda: make_deck(ArrayDeck)),
+        ),
+        (
+            'shuffle',
+            get_best_time(deck.shuffle),
+            get_best_time(array_deck.shuffle),
+        ),
+        (
+            f'draw {BENCHMARK_DRAW_QUANTITY}',
+            get_best_time(lambda: draw_all(BaseDeck)),
+            get_best_time(lambda: draw_all(ArrayDeck)),
+        ),
+        (
+            f'draw_codes {BENCHMARK_DRAW_QUANTITY}',
+            get_best_time(lambda: draw_all(BaseDeck)),
+            get_best_time(draw_all_codes),
+        ),
+        (
+            'count_suits',
+            get_best_time(deck.count_suits),
+            get_best_time(array_deck.count_suits),
+        ),
+        (
+            'count_names',
+            get_best_time(deck.count_names),
+            get_best_time(array_deck.count_names),
+        ),
+        (
+            'total_value',
+            get_best_time(lambda: deck.total_value),
+            get_best_time(lambda: array_deck.total_value),
+        ),
+    ]
+
+    print(f'{len(deck)} cartas')
+    print(f'{"":>24}{"list (µs)":>12}{"array (µs)":>12}{"speedup":>10}')
+    for name, list_time, array_time in result_list:
+        print(
+            f'{name:>24}{list_time:>12.3f}{array_time:>12.3f}'
+            f'{list_time / array_time:>9.1f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+'''Compara o codec compacto de callback_data com o formato antigo, que era
+decodificado com eval().
+
+Uso:
+    python -m benchmarks.callback_codec
+'''
+
+from timeit import repeat
+
+from bot.games.buttons.callback_codec import (
+    decode_callback_data,
+    encode_callback_data
+)
+from bot.games.enums.command import CallbackKeyEnum
+
+
+BENCHMARK_NUMBER = 20_000
+BENCHMARK_REPEAT = 5
+CALLBACK_KEY_LIST = list(CallbackKeyEnum)
+BENCHMARK_DATA_LIST = [
+    {
+        CallbackKeyEnum.COMMAND: 'PLAY',
+        CallbackKeyEnum.GAME_ID: 140_234_567_890_123,
+        CallbackKeyEnum.HAND_POSITION: 3,
+    },
+    {
+        CallbackKeyEnum.COMMAND: 'SELECT_COLOR',
+        CallbackKeyEnum.GAME_ID: 140_234_567_890_123,
+        CallbackKeyEnum.SELECTED_COLOR: 'GREEN',
+    },
+    {
+        CallbackKeyEnum.COMMAND: 'PLAY',
+        CallbackKeyEnum.GAME_ID: 140_234_567_890_123,
+        CallbackKeyEnum.ROW_INDEX: 4,
+        CallbackKeyEnum.CARD_INDEX: 6,
+    },
+]
+
+
+# Formato antigo (PlayButton antes do callback_codec).
+def eval_encode_callback_data(callback_data: dict) -> str:
+    items = []
+    for key, value in callback_data.items():
+        key_int = CALLBACK_KEY_LIST.index(key)
+        if isinstance(value, str):
+            items.append(f'{key_int}:"{value}"')
+        else:
+            items.append(f'{key_int}:{value}')
+    text = ','.join(items)
+
+    return f'{{{text}}}'
+
+
+def eval_decode_callback_data(callback_data_str: str) -> dict:
+    callback_data: dict = eval(callback_data_str)
+
+    return {
+        CALLBACK_KEY_LIST[key]: value
+        for key, value in callback_data.items()
+    }
+
+
+def get_best_time(function, argument_list: list) -> float:
+    '''Retorna o melhor tempo médio, em microssegundos, de uma chamada.
+    '''
+
+    def run():
+        for argument in argument_list:
+            function(argument)
+
+    time_list = repeat(run, number=BENCHMARK_NUMBER, repeat=BENCHMARK_REPEAT)
+    total_calls = BENCHMARK_NUMBER * len(argument_list)
+
+    return min(time_list) / total_calls * 1_000_000
+
+
+def main():
+    eval_text_list = [
+        eval_encode_callback_data(data) for data in BENCHMARK_DATA_LIST
+    ]
+    codec_text_list = [
+        encode_callback_data(data) for data in BENCHMARK_DATA_LIST
+    ]
+    for data, eval_text, codec_text in zip(
+        BENCHMARK_DATA_LIST, eval_text_list, codec_text_list
+    ):
+        assert eval_decode_callback_data(eval_text) == data
+        assert decode_callback_data(codec_text) == data
+        print(f'{len(eval_text):>3} bytes {eval_text}')
+        print(f'{len(codec_text):>3} bytes {codec_text}')
+
+    result_list = [
+        (
+            'encode',
+            get_best_time(eval_encode_callback_data, BENCHMARK_DATA_LIST),
+            get_best_time(encode_callback_data, BENCHMARK_DATA_LIST),
+        ),
+        (
+            'decode',
+            get_best_time(eval_decode_callback_data, eval_text_list),
+            get_best_time(decode_callback_data, codec_text_list),
+        ),
+    ]
+    print(f'\n{"":>8}{"eval (µs)":>12}{"codec (µs)":>12}{"speedup":>10}')
+    for name, eval_time, codec_time in result_list:
+        print(
+            f'{name:>8}{eval_time:>12.3f}{codec_time:>12.3f}'
+            f'{eval_time / codec_time:>9.1f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
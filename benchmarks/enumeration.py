@@ -0,0 +1,90 @@
+'''Compara o get_enum_index e o get_enum_by_index com as tabelas de
+índices com a versão antiga, que criava a lista de elementos da classe
+Enum a cada chamada.
+
+Uso:
+    python -m benchmarks.enumeration
+'''
+
+from enum import Enum
+from timeit import repeat
+
+from bot.functions.enumeration import get_enum_by_index, get_enum_index
+from bot.games.enums.card import ColorNames, RoyalNames
+from bot.games.enums.warfare import TerritoryNames
+
+
+BENCHMARK_NUMBER = 2_000
+BENCHMARK_REPEAT = 5
+BENCHMARK_ENUM_CLASS_LIST = [RoyalNames, ColorNames, TerritoryNames]
+
+
+# Versão antiga (antes das tabelas de índices).
+def list_get_enum_index(enum_instance: Enum) -> int:
+    if not isinstance(enum_instance, Enum):
+        raise TypeError('"enum_instance" precisa ser uma instancia de Enum.')
+
+    return list(enum_instance.__class__).index(enum_instance)
+
+
+def list_get_enum_by_index(enum_class: Enum, index: int) -> Enum:
+    if not issubclass(enum_class, Enum):
+        raise TypeError('"enum_class" precisa ser uma instancia de Enum.')
+    if not isinstance(index, int):
+        raise TypeError('"index" precisa ser um inteiro.')
+
+    return list(enum_class)[index]
+
+
+def get_best_time(function, argument_list: list) -> float:
+    '''Retorna o melhor tempo médio, em microssegundos, de uma chamada.
+    '''
+
+    def run():
+        for argument in argument_list:
+            function(*argument)
+
+    time_list = repeat(run, number=BENCHMARK_NUMBER, repeat=BENCHMARK_REPEAT)
+    total_calls = BENCHMARK_NUMBER * len(argument_list)
+
+    return min(time_list) / total_calls * 1_000_000
+
+
+def main():
+    result_list = []
+    for enum_class in BENCHMARK_ENUM_CLASS_LIST:
+        member_argument_list = [(member,) for member in enum_class]
+        index_argument_list = [
+            (enum_class, index)
+            for index in range(len(enum_class))
+        ]
+        for member, index in zip(enum_class, range(len(enum_class))):
+            assert list_get_enum_index(member) == get_enum_index(member)
+            assert (
+                list_get_enum_by_index(enum_class, index)
+                is get_enum_by_index(enum_class, index)
+            )
+
+        result_list.extend([
+            (
+                f'{enum_class.__name__}.index',
+                get_best_time(list_get_enum_index, member_argument_list),
+                get_best_time(get_enum_index, member_argument_list),
+            ),
+            (
+                f'{enum_class.__name__}.by_index',
+                get_best_time(list_get_enum_by_index, index_argument_list),
+                get_best_time(get_enum_by_index, index_argument_list),
+            ),
+        ])
+
+    print(f'{"":>24}{"list (µs)":>12}{"table (µs)":>12}{"speedup":>10}')
+    for name, list_time, table_time in result_list:
+        print(
+            f'{name:>24}{list_time:>12.3f}{table_time:>12.3f}'
+            f'{list_time / table_time:>9.1f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,305 @@
+import asyncio
+import json
+import logging
+
+from collections import Counter, defaultdict
+from http import HTTPStatus
+from itertools import count
+from random import Random
+from time import time
+from typing import Dict, Optional, Tuple
+
+from telegram.request import BaseRequest, RequestData
+
+
+FAKE_BOT_ID = 123456789
+FAKE_BOT_USERNAME = 'ludus_bot'
+FAKE_MESSAGE_ID_START = 1000
+RETRY_AFTER_ENDPOINTS = (
+    'sendMessage',
+    'editMessageText',
+    'editMessageReplyMarkup',
+    'deleteMessage',
+)
+MESSAGE_NOT_FOUND_TEXT = 'Bad Request: message to edit not found'
+MESSAGE_NOT_MODIFIED_TEXT = (
+    'Bad Request: message is not modified: specified new message content '
+    'and reply markup are exactly the same as a current content and reply '
+    'markup of the message'
+)
+
+
+class FakeBotApiRequest(BaseRequest):
+    '''Substituto local da API do Telegram para testes de carga.
+
+    Deve ser passado para o ApplicationBuilder (request e get_updates_request)
+    para que o Bot real seja usado sem acesso à rede. Implementa getMe,
+    sendMessage, editMessageText, editMessageReplyMarkup,
+    answerCallbackQuery, deleteMessage e sendChatAction.
+
+    Cada chamada aguarda latency segundos. Com probabilidade
+    retry_after_rate, as chamadas de RETRY_AFTER_ENDPOINTS retornam o erro
+    429 (RetryAfter) com retry_after segundos.
+
+    As mensagens enviadas ficam em messages (chat_id: message_id: message)
+    e o número de chamadas por método fica em call_counter.
+    '''
+
+    def __init__(
+        self,
+        latency: float = 0,
+        retry_after_rate: float = 0,
+        retry_after: int = 1,
+        seed: int = None,
+        bot_username: str = FAKE_BOT_USERNAME,
+    ):
+        if not 0 <= retry_after_rate <= 1:
+            raise ValueError(
+                'retry_after_rate precisa estar entre 0 e 1 '
+                f'({retry_after_rate}).'
+            )
+
+        self.latency = latency
+        self.retry_after_rate = retry_after_rate
+        self.retry_after = retry_after
+        self.random = Random(seed)
+        self.bot_username = bot_username
+        self.message_id_counter = count(FAKE_MESSAGE_ID_START)
+        self.messages: Dict[int, Dict[int, dict]] = defaultdict(dict)
+        self.call_counter = Counter()
+        self.retry_after_counter = Counter()
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'latency={self.latency}, '
+            f'retry_after_rate={self.retry_after_rate}, '
+            f'total_calls={self.total_calls})'
+        )
+
+    async def initialize(self):
+        ...
+
+    async def shutdown(self):
+        ...
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.call_counter.values())
+
+    def get_last_message(self, chat_id: int) -> Optional[dict]:
+        '''Retorna a última mensagem enviada pelo bot no chat.
+        '''
+
+        chat_messages = self.messages.get(chat_id, {})
+        if not chat_messages:
+            return None
+
+        return chat_messages[max(chat_messages)]
+
+    async def do_request(
+        self,
+        url: str,
+        method: str,
+        request_data: Optional[RequestData] = None,
+        *args,
+        **kwargs
+    ) -> Tuple[int, bytes]:
+        endpoint = url.rsplit('/', 1)[-1]
+        parameters = request_data.parameters if request_data else {}
+        self.call_counter[endpoint] += 1
+
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+
+        if (
+            endpoint in RETRY_AFTER_ENDPOINTS and
+            self.random.random() < self.retry_after_rate
+        ):
+            self.retry_after_counter[endpoint] += 1
+            return self.make_error_response(
+                code=HTTPStatus.TOO_MANY_REQUESTS,
+                description=(
+                    'Too Many Requests: '
+                    f'retry after {self.retry_after}'
+                ),
+                retry_after=self.retry_after,
+            )
+
+        endpoint_function = getattr(self, f'fake_{endpoint}', None)
+        if endpoint_function is None:
+            logging.warning(f'FAKE_BOT_API: Método "{endpoint}" não existe.')
+            return self.make_error_response(
+                code=HTTPStatus.BAD_REQUEST,
+                description=f'Bad Request: method "{endpoint}" not found',
+            )
+
+        return endpoint_function(**parameters)
+
+    # RESPONSES
+    def make_response(self, result) -> Tuple[int, bytes]:
+        payload = {'ok': True, 'result': result}
+
+        return HTTPStatus.OK, json.dumps(payload).encode('utf-8')
+
+    def make_error_response(
+        self,
+        code: HTTPStatus,
+        description: str,
+        retry_after: int = None,
+    ) -> Tuple[int, bytes]:
+        payload = {
+            'ok': False,
+            'error_code': int(code),
+            'description': description,
+        }
+        if retry_after is not None:
+            payload['parameters'] = {'retry_after': retry_after}
+
+        return int(code), json.dumps(payload).encode('utf-8')
+
+    def make_message(
+        self,
+        chat_id: int,
+        message_id: int,
+        text: str,
+        reply_markup: dict = None,
+    ) -> dict:
+        chat_type = 'private' if int(chat_id) > 0 else 'group'
+        message = {
+            'message_id': message_id,
+            'date': int(time()),
+            'chat': {'id': int(chat_id), 'type': chat_type},
+            'from': {
+                'id': FAKE_BOT_ID,
+                'is_bot': True,
+                'first_name': 'Ludus',
+                'username': self.bot_username,
+            },
+            'text': text,
+        }
+        if reply_markup:
+            message['reply_markup'] = reply_markup
+
+        return message
+
+    # ENDPOINTS
+    def fake_getMe(self, **kwargs) -> Tuple[int, bytes]:
+        return self.make_response({
+            'id': FAKE_BOT_ID,
+            'is_bot': True,
+            'first_name': 'Ludus',
+            'username': self.bot_username,
+        })
+
+    def fake_sendMessage(
+        self,
+        chat_id: int,
+        text: str,
+        reply_markup: dict = None,
+        **kwargs
+    ) -> Tuple[int, bytes]:
+        chat_id = int(chat_id)
+        message_id = next(self.message_id_counter)
+        message = self.make_message(
+            chat_id=chat_id,
+            message_id=message_id,
+            text=text,
+            reply_markup=reply_markup,
+        )
+        self.messages[chat_id][message_id] = message
+
+        return self.make_response(message)
+
+    def fake_editMessageText(
+        self,
+        chat_id: int,
+        message_id: int,
+        text: str,
+        reply_markup: dict = None,
+        **kwargs
+    ) -> Tuple[int, bytes]:
+        return self.edit_message(
+            chat_id=chat_id,
+            message_id=message_id,
+            text=text,
+            reply_markup=reply_markup,
+        )
+
+    def fake_editMessageReplyMarkup(
+        self,
+        chat_id: int,
+        message_id: int,
+        reply_markup: dict = None,
+        **kwargs
+    ) -> Tuple[int, bytes]:
+        return self.edit_message(
+            chat_id=chat_id,
+            message_id=message_id,
+            reply_markup=reply_markup,
+        )
+
+    def edit_message(
+        self,
+        chat_id: int,
+        message_id: int,
+        text: str = None,
+        reply_markup: dict = None,
+    ) -> Tuple[int, bytes]:
+        '''Edita uma mensagem guardada. Assim como o Telegram, retorna
+        BadRequest se a mensagem não existir ou não for modificada.
+        '''
+
+        chat_id = int(chat_id)
+        message = self.messages.get(chat_id, {}).get(int(message_id))
+        if message is None:
+            return self.make_error_response(
+                code=HTTPStatus.BAD_REQUEST,
+                description=MESSAGE_NOT_FOUND_TEXT,
+            )
+
+        new_text = message['text'] if text is None else text
+        new_message = self.make_message(
+            chat_id=chat_id,
+            message_id=int(message_id),
+            text=new_text,
+            reply_markup=reply_markup,
+        )
+        if (
+            new_message['text'] == message['text'] and
+            new_message.get('reply_markup') == message.get('reply_markup')
+        ):
+            return self.make_error_response(
+                code=HTTPStatus.BAD_REQUEST,
+                description=MESSAGE_NOT_MODIFIED_TEXT,
+            )
+
+        self.messages[chat_id][int(message_id)] = new_message
+
+        return self.make_response(new_message)
+
+    def fake_answerCallbackQuery(self, **kwargs) -> Tuple[int, bytes]:
+        return self.make_response(True)
+
+    def fake_deleteMessage(
+        self,
+        chat_id: int,
+        message_id: int,
+        **kwargs
+    ) -> Tuple[int, bytes]:
+        message = self.messages.get(int(chat_id), {}).pop(
+            int(message_id), None
+        )
+        if message is None:
+            return self.make_error_response(
+                code=HTTPStatus.BAD_REQUEST,
+                description='Bad Request: message to delete not found',
+            )
+
+        return self.make_response(True)
+
+    def fake_sendChatAction(self, **kwargs) -> Tuple[int, bytes]:
+        return self.make_response(True)
+
+    def fake_deleteWebhook(self, **kwargs) -> Tuple[int, bytes]:
+        return self.make_response(True)
@@ -0,0 +1,493 @@
+'''Simula vários usuários jogando ao mesmo tempo usando os handlers reais
+do bot e a API falsa do Telegram (FakeBotApiRequest).
+
+Uso:
+    python -m benchmarks.load_driver --users 8 --board ColorsGameBoard
+'''
+
+import asyncio
+import os
+
+from argparse import ArgumentParser
+from math import ceil
+from random import Random
+from time import perf_counter
+from typing import Callable, Dict, List, Optional
+
+from telegram.ext import Application
+
+from benchmarks.fake_bot_api import FAKE_BOT_USERNAME, FakeBotApiRequest
+from benchmarks.update_injector import (
+    create_callback_query_update,
+    create_command_update,
+    inject_update
+)
+
+# O módulo choice_game exige o BOT_USERNAME ao ser importado.
+os.environ.setdefault('BOT_USERNAME', FAKE_BOT_USERNAME)
+
+from bot.constants.callback import (  # noqa
+    LIST_PARTY_GAME_CALLBACK_DATA,
+    LIST_SINGLE_GAME_CALLBACK_DATA,
+    SELECT_GAME_CALLBACK_DATA,
+    START_GAME_CALLBACK_DATA
+)
+from bot.conversations import (  # noqa
+    CALLBACK_QUERY_ROUTER_HANDLER,
+    CHOICE_GAME_HANDLERS
+)
+from bot.conversations.play_game import PLAY_GAME_ROUTES, play_game  # noqa
+from bot.conversations.router import CallbackQueryRouter  # noqa
+from bot.functions.game import (  # noqa
+    GAME_ACTORS_KEY,
+    GAME_JOURNALS_KEY,
+    get_game_actor_stats,
+    get_game_registry
+)
+from bot.games.boards import board_factory, get_party_board_list  # noqa
+from bot.games.player import Player  # noqa
+
+
+LOAD_BOARD_NAME_LIST = ['ColorsGameBoard', 'ScoundrelBoard']
+LOAD_USER_ID_START = 1001
+DEFAULT_TOTAL_USERS = 8
+DEFAULT_MAX_PLAYS = 30
+DEFAULT_THINK_TIME = 0.5
+DEFAULT_SETTLE_TIME = 1
+MESSAGE_TIMEOUT = 60
+MESSAGE_POLL_TIME = 0.01
+
+
+def get_percentile(value_list: List[float], percent: float) -> float:
+    '''Retorna o percentil (0 a 100) de uma lista de valores usando o
+    método do valor mais próximo.
+    '''
+
+    if not value_list:
+        return 0.0
+
+    sorted_value_list = sorted(value_list)
+    index = ceil(percent / 100 * len(sorted_value_list)) - 1
+
+    return sorted_value_list[max(index, 0)]
+
+
+def build_load_application(fake_request: FakeBotApiRequest) -> Application:
+    '''Cria uma Application com os handlers reais usando a API falsa.
+    '''
+
+    application = (
+        Application.builder()
+        .token('123456789:FAKE')
+        .request(fake_request)
+        .get_updates_request(fake_request)
+        .concurrent_updates(True)
+        .build()
+    )
+    application.add_handler(CALLBACK_QUERY_ROUTER_HANDLER)
+    application.add_handlers(CHOICE_GAME_HANDLERS)
+
+    return application
+
+
+def is_play_callback_data(callback_data: str) -> bool:
+    '''Retorna True se o callback_data for de um botão de jogada, ou seja,
+    se a rota dele no CALLBACK_QUERY_ROUTER for o play_game.
+    '''
+
+    route_key = CallbackQueryRouter.get_route_key(callback_data)
+
+    return PLAY_GAME_ROUTES.get(route_key) is play_game
+
+
+def get_callback_data_list(
+    message: Optional[dict],
+    is_valid: Callable[[str], bool] = None,
+    prefix: str = None,
+) -> List[str]:
+    '''Retorna os callback_data dos botões de uma mensagem que são aceitos
+    pela função is_valid ou começam com o prefix.
+    '''
+
+    if message is None:
+        return []
+
+    reply_markup = message.get('reply_markup') or {}
+    callback_data_list = []
+    for row in reply_markup.get('inline_keyboard', []):
+        for button in row:
+            callback_data = button.get('callback_data')
+            if callback_data is None:
+                continue
+            if is_valid is not None and not is_valid(callback_data):
+                continue
+            if prefix is not None and not callback_data.startswith(prefix):
+                continue
+            callback_data_list.append(callback_data)
+
+    return callback_data_list
+
+
+def has_game_buttons(message: dict) -> bool:
+    '''Retorna True se a mensagem tiver o botão de iniciar a partida ou
+    botões de jogada, ou seja, se ela já for a mensagem da partida.
+    '''
+
+    return bool(
+        get_callback_data_list(message, prefix=START_GAME_CALLBACK_DATA)
+        or get_callback_data_list(message, is_valid=is_play_callback_data)
+    )
+
+
+def has_start_button(message: dict) -> bool:
+    return bool(
+        get_callback_data_list(message, prefix=START_GAME_CALLBACK_DATA)
+    )
+
+
+class LoadDriver:
+    '''Simula total_users usuários jogando partidas de board_name.
+
+    Os usuários são divididos em partidas com o máximo de jogadores da
+    board. Cada usuário abre o menu (/start), o host cria a partida pelos
+    botões, os demais entram pelo convite (/start invite_ID) e todos clicam
+    em botões de jogada aleatórios até a partida terminar ou até max_plays.
+    '''
+
+    def __init__(
+        self,
+        board_name: str = LOAD_BOARD_NAME_LIST[0],
+        total_users: int = DEFAULT_TOTAL_USERS,
+        max_plays: int = DEFAULT_MAX_PLAYS,
+        think_time: float = DEFAULT_THINK_TIME,
+        latency: float = 0,
+        retry_after_rate: float = 0,
+        seed: int = None,
+        journal_dir: str = None,
+    ):
+        self.board_class = board_factory(board_name)
+        self.total_users = total_users
+        self.max_plays = max_plays
+        self.think_time = think_time
+        self.random = Random(seed)
+        self.journal_dir = journal_dir
+        self.fake_request = FakeBotApiRequest(
+            latency=latency,
+            retry_after_rate=retry_after_rate,
+            seed=seed,
+        )
+        self.application = build_load_application(self.fake_request)
+        self.latency_list: List[float] = []
+        self.play_latency_list: List[float] = []
+        self.total_plays = 0
+        self.play_calls = 0
+        self.finished_user_id_set = set()
+
+    @property
+    def players_per_game(self) -> int:
+        board = self.board_class(Player(player_id=0, name='Load'))
+
+        return board.max_total_players
+
+    async def send_update(self, update) -> float:
+        '''Injeta o update na Application e retorna a latência do handler.
+        '''
+
+        start = perf_counter()
+        await inject_update(application=self.application, update=update)
+        handler_latency = perf_counter() - start
+        self.latency_list.append(handler_latency)
+
+        return handler_latency
+
+    def is_game_idle(self, user_id: int) -> bool:
+        '''Retorna True se a partida do usuário não tiver jogadas na fila
+        nem renderizações pendentes.
+        '''
+
+        game = self.get_game(user_id)
+        if game is None:
+            return True
+
+        actor_dict = self.application.bot_data.get(GAME_ACTORS_KEY, {})
+        actor = actor_dict.get(game.id)
+
+        return actor is None or (actor.depth == 0 and not actor.is_rendering)
+
+    async def wait_message(
+        self,
+        user_id: int,
+        is_ready: Callable[[dict], bool] = None,
+        description: str = 'nenhuma mensagem',
+    ) -> dict:
+        '''Consulta a API falsa a cada MESSAGE_POLL_TIME segundos até a
+        partida do usuário ficar ociosa e a última mensagem dele ser aceita
+        pela função is_ready, e retorna essa mensagem.
+        A mensagem pode demorar por causa do atraso da renderização ou de
+        um RetryAfter. Levanta TimeoutError depois de MESSAGE_TIMEOUT
+        segundos.
+        '''
+
+        start = perf_counter()
+        while True:
+            message = self.fake_request.get_last_message(user_id)
+            if (
+                message is not None
+                and self.is_game_idle(user_id)
+                and (is_ready is None or is_ready(message))
+            ):
+                return message
+            if perf_counter() - start > MESSAGE_TIMEOUT:
+                raise TimeoutError(
+                    f'O usuário {user_id} não recebeu {description} em '
+                    f'{MESSAGE_TIMEOUT} segundos. Última mensagem: {message}'
+                )
+            await asyncio.sleep(MESSAGE_POLL_TIME)
+
+    async def click(self, user_id: int, callback_data: str) -> float:
+        message = await self.wait_message(user_id)
+        update = create_callback_query_update(
+            user_id=user_id,
+            data=callback_data,
+            message_id=message['message_id'],
+        )
+
+        return await self.send_update(update)
+
+    def get_game(self, user_id: int):
+        for game in get_game_registry(context=self.application):
+            if game.player_in_game(user_id):
+                return game
+
+        return None
+
+    async def create_game(self, user_id_list: List[int]):
+        '''O primeiro usuário cria a partida e os demais entram pelo
+        convite. A partida é iniciada pelo host quando possível.
+        '''
+
+        host_id, *guest_id_list = user_id_list
+        await self.send_update(
+            create_command_update(user_id=host_id, text='/start')
+        )
+        list_callback_data = (
+            LIST_PARTY_GAME_CALLBACK_DATA
+            if self.board_class in get_party_board_list()
+            else LIST_SINGLE_GAME_CALLBACK_DATA
+        )
+        await self.click(host_id, list_callback_data)
+        await self.click(
+            host_id,
+            f'{SELECT_GAME_CALLBACK_DATA}{self.board_class.__name__}'
+        )
+        game = self.get_game(host_id)
+        if game is None:
+            raise RuntimeError(
+                f'O usuário {host_id} não conseguiu criar a partida '
+                f'{self.board_class.__name__}.'
+            )
+
+        for guest_id in guest_id_list:
+            await self.send_update(
+                create_command_update(
+                    user_id=guest_id,
+                    text=f'/start invite_{game.short_id}'
+                )
+            )
+            await self.wait_message(
+                guest_id,
+                description='a mensagem da partida',
+            )
+
+        message = await self.wait_message(
+            host_id,
+            is_ready=has_game_buttons,
+            description='os botões da partida',
+        )
+        start_data_list = get_callback_data_list(
+            message=message,
+            prefix=START_GAME_CALLBACK_DATA,
+        )
+        if start_data_list:
+            await self.click(host_id, start_data_list[0])
+            await self.wait_message(
+                host_id,
+                is_ready=lambda message: not has_start_button(message),
+                description='o início da partida',
+            )
+
+    async def play(self, user_id: int):
+        '''Clica em botões de jogada aleatórios até o fim da partida ou até
+        max_plays. Enquanto não houver botões de jogada (ex: não é a vez do
+        jogador), o usuário aguarda sem gastar jogadas, e se ficar mais de
+        MESSAGE_TIMEOUT segundos sem eles, levanta TimeoutError. Quando um
+        jogador para, os demais jogadores da partida também param.
+        '''
+
+        total_plays = 0
+        idle_start = perf_counter()
+        while total_plays < self.max_plays:
+            game = self.get_game(user_id)
+            if game is None or game.game_over:
+                break
+            if any(
+                int(player.id) in self.finished_user_id_set
+                for player in game.player_list
+            ):
+                break
+
+            callback_data_list = get_callback_data_list(
+                message=await self.wait_message(user_id),
+                is_valid=is_play_callback_data,
+            )
+            if not callback_data_list:
+                if perf_counter() - idle_start > MESSAGE_TIMEOUT:
+                    raise TimeoutError(
+                        f'O usuário {user_id} ficou {MESSAGE_TIMEOUT} '
+                        f'segundos sem botões de jogada.'
+                    )
+                await asyncio.sleep(MESSAGE_POLL_TIME)
+                continue
+
+            callback_data = self.random.choice(callback_data_list)
+            total_calls = self.fake_request.total_calls
+            handler_latency = await self.click(user_id, callback_data)
+            await asyncio.sleep(self.think_time)
+            total_plays += 1
+            idle_start = perf_counter()
+            self.total_plays += 1
+            self.play_latency_list.append(handler_latency)
+            self.play_calls += self.fake_request.total_calls - total_calls
+
+        self.finished_user_id_set.add(user_id)
+
+    async def run(self) -> Dict[str, float]:
+        '''Executa a simulação e retorna o relatório.
+        '''
+
+        user_id_list = list(
+            range(LOAD_USER_ID_START, LOAD_USER_ID_START + self.total_users)
+        )
+        players_per_game = self.players_per_game
+        game_user_id_lists = [
+            user_id_list[i:i + players_per_game]
+            for i in range(0, len(user_id_list), players_per_game)
+        ]
+
+        await self.application.initialize()
+        await self.application.start()
+        try:
+            start = perf_counter()
+            await asyncio.gather(*(
+                self.create_game(game_user_id_list)
+                for game_user_id_list in game_user_id_lists
+            ))
+            await asyncio.gather(*(
+                self.play(user_id)
+                for user_id in user_id_list
+            ))
+            await asyncio.sleep(DEFAULT_SETTLE_TIME)
+            total_time = perf_counter() - start
+            if self.journal_dir is not None:
+                self.save_journals()
+        finally:
+            await self.application.stop()
+            await self.application.shutdown()
+
+        return self.make_report(total_time=total_time)
+
+    def save_journals(self):
+        '''Grava o diário de cada partida em journal_dir, um arquivo
+        SHORT_ID.journal por partida (ver benchmarks.replay).
+        '''
+
+        os.makedirs(self.journal_dir, exist_ok=True)
+        journal_dict = self.application.bot_data.get(GAME_JOURNALS_KEY, {})
+        for game in get_game_registry(context=self.application):
+            journal = journal_dict.get(game.id)
+            if journal is None:
+                continue
+            path = os.path.join(self.journal_dir, f'{game.short_id}.journal')
+            with open(path, 'wb') as journal_file:
+                journal_file.write(journal.to_bytes())
+
+    def make_report(self, total_time: float) -> Dict[str, float]:
+        total_plays = self.total_plays
+        actor_stats_list = list(
+            get_game_actor_stats(context=self.application).values()
+        )
+        actor_items = sum(stats['items'] for stats in actor_stats_list)
+        actor_renders = sum(stats['renders'] for stats in actor_stats_list)
+
+        return {
+            'board': self.board_class.__name__,
+            'users': self.total_users,
+            'games': ceil(self.total_users / self.players_per_game),
+            'plays': total_plays,
+            'total_time': total_time,
+            'handler_p50': get_percentile(self.latency_list, 50),
+            'handler_p99': get_percentile(self.latency_list, 99),
+            'play_p50': get_percentile(self.play_latency_list, 50),
+            'play_p99': get_percentile(self.play_latency_list, 99),
+            'api_calls': self.fake_request.total_calls,
+            'api_calls_per_play': (
+                self.play_calls / total_plays if total_plays else 0.0
+            ),
+            'retry_after': sum(self.fake_request.retry_after_counter.values()),
+            'actor_renders': actor_renders,
+            'plays_per_render': (
+                actor_items / actor_renders if actor_renders else 0.0
+            ),
+            'actor_max_depth': max(
+                (stats['max_depth'] for stats in actor_stats_list),
+                default=0,
+            ),
+            'actor_max_time': max(
+                (stats['max_time'] for stats in actor_stats_list),
+                default=0.0,
+            ),
+        }
+
+
+def format_report(report: Dict[str, float]) -> str:
+    line_list = []
+    for key, value in report.items():
+        if isinstance(value, float):
+            value = f'{value:.4f}'
+        line_list.append(f'{key:>20}: {value}')
+
+    return '\n'.join(line_list)
+
+
+def main():
+    parser = ArgumentParser(description='Teste de carga do Ludus.')
+    parser.add_argument(
+        '--board',
+        choices=LOAD_BOARD_NAME_LIST,
+        default=LOAD_BOARD_NAME_LIST[0]
+    )
+    parser.add_argument('--users', type=int, default=DEFAULT_TOTAL_USERS)
+    parser.add_argument('--plays', type=int, default=DEFAULT_MAX_PLAYS)
+    parser.add_argument('--think-time', type=float, default=DEFAULT_THINK_TIME)
+    parser.add_argument('--latency', type=float, default=0)
+    parser.add_argument('--retry-after-rate', type=float, default=0)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--journal-dir', default=None)
+    args = parser.parse_args()
+
+    load_driver = LoadDriver(
+        board_name=args.board,
+        total_users=args.users,
+        max_plays=args.plays,
+        think_time=args.think_time,
+        latency=args.latency,
+        retry_after_rate=args.retry_after_rate,
+        seed=args.seed,
+        journal_dir=args.journal_dir,
+    )
+    report = asyncio.run(load_driver.run())
+    print(format_report(report))
+
+
+if __name__ == '__main__':
+    main()
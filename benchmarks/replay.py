@@ -0,0 +1,113 @@
+'''Compara o tempo de uma partida jogada (jogada + textos e teclados de
+todos os jogadores a cada atualização) com o tempo do replay do diário
+(PlayJournal) da mesma partida.
+
+Sem argumentos, as partidas são geradas com jogadas aleatórias. Também
+aceita os arquivos gravados pelo load_driver com --journal-dir.
+
+Uso:
+    python -m benchmarks.replay
+    python -m benchmarks.replay journals/*.journal
+'''
+
+import sys
+
+from random import Random
+from time import perf_counter
+from typing import List, Tuple
+
+from bot.games.boards import ColorsGameBoard, JokerJailBoard, ScoundrelBoard
+from bot.games.boards.board import BaseBoard
+from bot.games.buttons.play_button import PlayButton
+from bot.games.journal import PlayJournal
+from bot.games.player import Player
+
+
+BENCHMARK_SEED = 42
+BENCHMARK_GAMES = 20
+BENCHMARK_MAX_PLAYS = 200
+BENCHMARK_BOARD_LIST = [ColorsGameBoard, JokerJailBoard, ScoundrelBoard]
+
+
+def render_game(board: BaseBoard):
+    '''Cria os textos e teclados enviados a cada atualização da partida.
+    '''
+
+    for player in board.player_list:
+        board.show_board(player=player)
+        board.player_keyboard(player=player).make_keyboard()
+
+
+def play_game(
+    board_class: type,
+    random: Random,
+    max_plays: int = BENCHMARK_MAX_PLAYS,
+) -> Tuple[PlayJournal, float]:
+    '''Joga uma partida com botões aleatórios gravando o diário.
+    Retorna o diário e o tempo total da partida.
+    '''
+
+    start = perf_counter()
+    host = Player(player_id='1', name='Jogador 1')
+    board = board_class(host, seed=random.getrandbits(64))
+    journal = PlayJournal.from_board(board=board)
+    for index in range(2, board.max_total_players + 1):
+        player = Player(player_id=str(index), name=f'Jogador {index}')
+        journal.append_add_player(player=player)
+        board.add_player(player)
+    journal.append_start()
+    board.start()
+    render_game(board)
+
+    for _ in range(max_plays):
+        if board.game_over:
+            break
+        player = board.current_player
+        button_list = board.player_keyboard(player=player).play_button_list
+        if not button_list:
+            break
+        button = random.choice(button_list)
+        play_dict = PlayButton.callback_data_to_dict(button.data_to_str)
+        journal.append_play(board=board, player=player, play_dict=play_dict)
+        board.play(player=player, play_dict=play_dict)
+        render_game(board)
+
+    return journal, perf_counter() - start
+
+
+def main():
+    journal_list: List[PlayJournal] = []
+    play_time = 0.0
+    if len(sys.argv) > 1:
+        for path in sys.argv[1:]:
+            with open(path, 'rb') as journal_file:
+                journal = PlayJournal.from_bytes(journal_file.read())
+            journal_list.append(journal)
+    else:
+        random = Random(BENCHMARK_SEED)
+        for index in range(BENCHMARK_GAMES):
+            board_class = BENCHMARK_BOARD_LIST[
+                index % len(BENCHMARK_BOARD_LIST)
+            ]
+            journal, game_time = play_game(board_class, random)
+            journal_list.append(journal)
+            play_time += game_time
+
+    start = perf_counter()
+    for journal in journal_list:
+        journal.replay()
+    replay_time = perf_counter() - start
+
+    total_entries = sum(len(journal) for journal in journal_list)
+    total_bytes = sum(len(journal.to_bytes()) for journal in journal_list)
+    print(f'{"journals":>16}: {len(journal_list)}')
+    print(f'{"entries":>16}: {total_entries}')
+    print(f'{"bytes":>16}: {total_bytes}')
+    print(f'{"replay (ms)":>16}: {replay_time * 1000:.2f}')
+    if play_time:
+        print(f'{"play (ms)":>16}: {play_time * 1000:.2f}')
+        print(f'{"speedup":>16}: {play_time / replay_time:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
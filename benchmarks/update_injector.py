@@ -0,0 +1,192 @@
+import asyncio
+import json
+import logging
+
+from datetime import datetime
+from itertools import count
+from typing import Optional
+from urllib.request import Request, urlopen
+
+from telegram import CallbackQuery, Chat, Message, MessageEntity, Update, User
+from telegram.constants import ChatType, MessageEntityType
+from telegram.ext import Application
+
+from bot.functions.date_time import get_brazil_time_now
+
+
+WEBHOOK_SECRET_TOKEN_HEADER = 'X-Telegram-Bot-Api-Secret-Token'
+FAKE_UPDATE_ID_START = 1
+FAKE_CALLBACK_QUERY_ID_START = 1
+
+update_id_counter = count(FAKE_UPDATE_ID_START)
+callback_query_id_counter = count(FAKE_CALLBACK_QUERY_ID_START)
+
+
+def create_fake_user(user_id: int, first_name: str = None) -> User:
+    '''Cria um usuário falso para ser usado nos updates injetados.
+    '''
+
+    if first_name is None:
+        first_name = f'Player{user_id}'
+
+    return User(
+        id=user_id,
+        first_name=first_name,
+        is_bot=False,
+        username=first_name.lower(),
+    )
+
+
+def create_fake_message(
+    user: User,
+    message_id: int,
+    text: str = None,
+    chat_id: int = None,
+    date: datetime = None,
+) -> Message:
+    '''Cria uma mensagem falsa no chat privado do usuário (ou no chat_id).
+    Se o texto começar com "/", a mensagem recebe a entidade de comando.
+    '''
+
+    if chat_id is None:
+        chat_id = user.id
+    if date is None:
+        date = get_brazil_time_now()
+
+    chat_type = ChatType.PRIVATE if chat_id > 0 else ChatType.GROUP
+    entities = None
+    if isinstance(text, str) and text.startswith('/'):
+        command_length = len(text.split()[0])
+        entities = [
+            MessageEntity(
+                type=MessageEntityType.BOT_COMMAND,
+                offset=0,
+                length=command_length,
+            )
+        ]
+
+    return Message(
+        message_id=message_id,
+        date=date,
+        chat=Chat(id=chat_id, type=chat_type),
+        from_user=user,
+        text=text,
+        entities=entities,
+    )
+
+
+def create_command_update(
+    user_id: int,
+    text: str,
+    message_id: int = 1,
+    chat_id: int = None,
+    update_id: int = None,
+) -> Update:
+    '''Cria um Update falso de uma mensagem de texto ou comando
+    (ex: "/start invite_123").
+    '''
+
+    if update_id is None:
+        update_id = next(update_id_counter)
+
+    user = create_fake_user(user_id=user_id)
+    message = create_fake_message(
+        user=user,
+        message_id=message_id,
+        text=text,
+        chat_id=chat_id,
+    )
+
+    return Update(update_id=update_id, message=message)
+
+
+def create_callback_query_update(
+    user_id: int,
+    data: str,
+    message_id: int = 1,
+    chat_id: int = None,
+    update_id: int = None,
+) -> Update:
+    '''Cria um Update falso de um clique em um botão (CallbackQuery) na
+    mensagem message_id.
+    '''
+
+    if update_id is None:
+        update_id = next(update_id_counter)
+
+    user = create_fake_user(user_id=user_id)
+    message = create_fake_message(
+        user=user,
+        message_id=message_id,
+        chat_id=chat_id,
+    )
+    callback_query = CallbackQuery(
+        id=str(next(callback_query_id_counter)),
+        from_user=user,
+        chat_instance=str(message.chat_id),
+        message=message,
+        data=data,
+    )
+
+    return Update(update_id=update_id, callback_query=callback_query)
+
+
+async def inject_update(
+    application: Application,
+    update: Update,
+    wait: bool = True,
+):
+    '''Injeta um Update na aplicação sem passar pela rede.
+
+    Se wait for True, processa o update imediatamente e aguarda os
+    handlers terminarem. Caso contrário, coloca o update na update_queue,
+    da mesma forma que o servidor de webhook faz.
+    '''
+
+    # Reconstrói o update a partir do JSON, como o servidor de webhook faz,
+    # para que todos os objetos internos fiquem associados ao bot.
+    update = Update.de_json(update.to_dict(), application.bot)
+    logging.info(f'INJECT_UPDATE(): {update.update_id}')
+    if wait is True:
+        await application.process_update(update)
+    else:
+        await application.update_queue.put(update)
+
+
+def post_webhook_update(
+    url: str,
+    update: Update,
+    secret_token: Optional[str] = None,
+    timeout: float = 5,
+) -> int:
+    '''Envia um Update para o servidor de webhook local (ex:
+    http://127.0.0.1:8443/webhook) e retorna o status HTTP da resposta.
+    '''
+
+    headers = {'Content-Type': 'application/json'}
+    if secret_token is not None:
+        headers[WEBHOOK_SECRET_TOKEN_HEADER] = secret_token
+
+    data = json.dumps(update.to_dict()).encode('utf-8')
+    request = Request(url=url, data=data, headers=headers, method='POST')
+    with urlopen(request, timeout=timeout) as response:
+        return response.status
+
+
+async def async_post_webhook_update(
+    url: str,
+    update: Update,
+    secret_token: Optional[str] = None,
+    timeout: float = 5,
+) -> int:
+    '''Versão assíncrona de post_webhook_update, executada em uma thread
+    para não bloquear o event loop.
+    '''
+
+    return await asyncio.to_thread(
+        post_webhook_update,
+        url=url,
+        update=update,
+        secret_token=secret_token,
+        timeout=timeout,
+    )
@@ -1,3 +1,7 @@
 from bot.conversations.choice_game import CHOICE_GAME_HANDLERS  # noqa
-from bot.conversations.close import CLOSE_MSG_HANDLER  # noqa
-from bot.conversations.play_game import PLAY_GAME_HANDLERS  # noqa
+from bot.conversations.choice_game import CHOICE_GAME_ROUTES  # noqa
+from bot.conversations.choice_game import restore_game  # noqa
+from bot.conversations.close import CLOSE_MSG_ROUTES  # noqa
+from bot.conversations.play_game import PLAY_GAME_ROUTES  # noqa
+from bot.conversations.router import CALLBACK_QUERY_ROUTER  # noqa
+from bot.conversations.router import CALLBACK_QUERY_ROUTER_HANDLER  # noqa
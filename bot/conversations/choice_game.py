@@ -11,7 +11,6 @@ from telegram import (
     Update
 )
 from telegram.ext import (
-    CallbackQueryHandler,
     CommandHandler,
     ContextTypes,
     PrefixHandler
@@ -35,20 +34,30 @@ from bot.functions.buttons import get_close_button
 from bot.functions.chat import (
     edit_message_text,
     send_alert,
-    send_private_message,
-    update_all_player_messages
+    send_answer,
+    send_private_message
+)
+from bot.functions.game import (
+    acquire_game_lock,
+    add_game,
+    is_game_removed,
+    journal_add_player,
+    journal_start,
+    load_game,
+    request_game_render,
+    save_game
 )
-
-from bot.functions.game import add_game, get_game
 from bot.functions.keyboard import reshape_row_buttons
 from bot.functions.keyboard import get_back_button
-from bot.functions.text import create_text_in_box
+from bot.functions.text import create_text_in_box, get_random_game_emoji
 from bot.games.boards import (
     board_factory,
     get_party_board_list,
-    get_solo_board_list
+    get_solo_board_list,
+    snapshot_board_factory
 )
 from bot.games.boards.board import BaseBoard
+from bot.games.game_id import encode_game_id
 from bot.games.player import Player
 
 
@@ -125,6 +134,7 @@ async def list_games(update: Update, context: ContextTypes.DEFAULT_TYPE):
             function_caller='LIST_GAMES()',
             query=query,
             text=text,
+            context=context,
         )
         return
 
@@ -156,31 +166,16 @@ async def select_game(update: Update, context: ContextTypes.DEFAULT_TYPE):
     game_class = board_factory(game_name)
     player = Player(user=user, message_id=message_id)
     game = game_class(player, debug=DEBUG)
-    game_id = game.id
-    invite_keyboard = get_invite_keyboard(game_id)
-    invite_text_formatter = partial(
-        create_text_in_box,
-        header_text=game.DISPLAY_NAME,
-        footer_text='Enviar convite',
-        footer_emoji1='👇',
-        footer_emoji2='👇',
-        clean_func=None,
-    )
-    play_text_formatter = partial(
-        create_text_in_box,
-        header_text=game.DISPLAY_NAME,
-        clean_func=None,
-    )
-    game.set_invite_keyboard(keyboard=invite_keyboard)
-    game.set_invite_text_formatter(formatter=invite_text_formatter)
-    game.set_play_text_formatter(formatter=play_text_formatter)
+    setup_game(game=game)
     add_game(game=game, context=context)
 
-    await update_all_player_messages(
+    await send_answer(
         function_caller='SELECT_GAME()',
-        game=game,
+        query=query,
+        text=None,
         context=context,
     )
+    request_game_render(game=game, context=context)
 
 
 @logging_basic_infos
@@ -193,7 +188,7 @@ async def invite_game(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     if arg_text.startswith('invite_'):
         game_id = arg_text.replace('invite_', '')
-        game = get_game(game_id=game_id, context=context)
+        game = await load_game(game_id=game_id, context=context)
         if game is None:
             text = 'Partida não encontrada.'
             return await send_private_message(
@@ -204,22 +199,31 @@ async def invite_game(update: Update, context: ContextTypes.DEFAULT_TYPE):
             )
 
         player = Player(user=user)
-        if game.is_started and not game.player_in_game(player=player):
-            text = 'Não é possível entrar nessa partida, pois já foi iniciada.'
+        async with acquire_game_lock(game_id=game_id, context=context):
+            if is_game_removed(game=game, context=context):
+                function_caller = 'INVITE_GAME(GAME_NOT_FOUND)'
+                text = 'Partida não encontrada.'
+            elif game.is_started and not game.player_in_game(player=player):
+                function_caller = 'INVITE_GAME(GAME_STARTED)'
+                text = (
+                    'Não é possível entrar nessa partida, '
+                    'pois já foi iniciada.'
+                )
+            else:
+                text = None
+                game.add_player(player=player)
+                journal_add_player(game=game, player=player, context=context)
+                save_game(game=game, context=context)
+
+        if text is not None:
             return await send_private_message(
-                function_caller='INVITE_GAME(GAME_STARTED)',
+                function_caller=function_caller,
                 context=context,
                 text=text,
                 user_id=user_id,
             )
 
-        game.add_player(player=player)
-
-        await update_all_player_messages(
-            function_caller='INVITE_GAME()',
-            game=game,
-            context=context,
-        )
+        request_game_render(game=game, context=context)
     else:
         text = str(args)
         await send_private_message(
@@ -238,7 +242,7 @@ async def start_game(update: Update, context: ContextTypes.DEFAULT_TYPE):
     query = update.callback_query
     data = query.data
     game_id = data.replace(START_GAME_CALLBACK_DATA, '')
-    game = get_game(game_id=game_id, context=context)
+    game = await load_game(game_id=game_id, context=context)
     if game is None:
         text = 'Partida não encontrada.'
         return await edit_message_text(
@@ -250,20 +254,81 @@ async def start_game(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     host_player = game.host
     if host_player is not None and host_player == user_id:
-        game.start()
-        await update_all_player_messages(
+        async with acquire_game_lock(game_id=game_id, context=context):
+            is_removed = is_game_removed(game=game, context=context)
+            if not is_removed:
+                game.start()
+                journal_start(game=game, context=context)
+                save_game(game=game, context=context)
+        if is_removed:
+            return await send_alert(
+                function_caller='START_GAME(GAME_NOT_FOUND)',
+                query=query,
+                text='Partida não encontrada.',
+                context=context,
+            )
+
+        await send_answer(
             function_caller='START_GAME()',
-            game=game,
+            query=query,
+            text=None,
             context=context,
         )
+        request_game_render(game=game, context=context)
     else:
         await send_alert(
             function_caller='START_GAME()',
             query=query,
             text='Apenas o host pode iniciar a partida.',
+            context=context,
         )
 
 
+# GAME FUNCTIONS
+def setup_game(game: BaseBoard):
+    '''Define o teclado de convite e as funções formatadoras da partida.
+    '''
+
+    invite_keyboard = get_invite_keyboard(game.id)
+    # Os emojis são sorteados uma única vez por partida para que o texto
+    # renderizado não mude sem necessidade entre as atualizações.
+    header_emoji1 = get_random_game_emoji()
+    header_emoji2 = get_random_game_emoji()
+    invite_text_formatter = partial(
+        create_text_in_box,
+        header_text=game.DISPLAY_NAME,
+        footer_text='Enviar convite',
+        header_emoji1=header_emoji1,
+        header_emoji2=header_emoji2,
+        footer_emoji1='👇',
+        footer_emoji2='👇',
+        clean_func=None,
+    )
+    play_text_formatter = partial(
+        create_text_in_box,
+        header_text=game.DISPLAY_NAME,
+        header_emoji1=header_emoji1,
+        header_emoji2=header_emoji2,
+        footer_emoji1=get_random_game_emoji(),
+        footer_emoji2=get_random_game_emoji(),
+        clean_func=None,
+    )
+    game.set_invite_keyboard(keyboard=invite_keyboard)
+    game.set_invite_text_formatter(formatter=invite_text_formatter)
+    game.set_play_text_formatter(formatter=play_text_formatter)
+
+
+def restore_game(data: bytes) -> BaseBoard:
+    '''Cria a partida a partir de um snapshot do MongoGameStore. Os emojis
+    do texto são sorteados novamente, pois não fazem parte do snapshot.
+    '''
+
+    game = snapshot_board_factory(bytes(data))
+    setup_game(game=game)
+
+    return game
+
+
 # BUTTONS FUNCTIONS
 def get_choice_type_game_keyboard() -> InlineKeyboardMarkup:
     single_text = '🎯 Solo'
@@ -319,11 +384,12 @@ def get_board_list_keyboard(
 
 def get_invite_keyboard(game_id: int) -> InlineKeyboardMarkup:
     invite_link = get_invite_link(game_id)
+    short_game_id = encode_game_id(game_id)
     copy_button = CopyTextButton(text=invite_link)
     reply_markup = InlineKeyboardMarkup([
         [InlineKeyboardButton(
             "🚀Iniciar Partida",
-            callback_data=f'{START_GAME_CALLBACK_DATA}{game_id}'
+            callback_data=f'{START_GAME_CALLBACK_DATA}{short_game_id}'
         )],
         [InlineKeyboardButton(
             "📨Enviar Convite",
@@ -337,7 +403,8 @@ def get_invite_keyboard(game_id: int) -> InlineKeyboardMarkup:
 
 
 def get_invite_link(game_id: int):
-    return f"https://t.me/{BOT_USERNAME}?start=invite_{game_id}"
+    short_game_id = encode_game_id(game_id)
+    return f"https://t.me/{BOT_USERNAME}?start=invite_{short_game_id}"
 
 
 # HANDLERS
@@ -361,24 +428,14 @@ CHOICE_GAME_HANDLERS = [
         filters=BASIC_COMMAND_IN_PRIVATE_CHAT_FILTER,
         has_args=True
     ),
-    CallbackQueryHandler(
-        choice_type_game,
-        pattern=MAIN_MENU_GAME_CALLBACK_DATA
-    ),
-    CallbackQueryHandler(
-        list_games,
-        pattern=(
-            f'{LIST_SINGLE_GAME_CALLBACK_DATA}'
-            f'|{LIST_DUEL_GAME_CALLBACK_DATA}'
-            f'|{LIST_PARTY_GAME_CALLBACK_DATA}'
-        )
-    ),
-    CallbackQueryHandler(
-        select_game,
-        pattern=SELECT_GAME_CALLBACK_DATA
-    ),
-    CallbackQueryHandler(
-        start_game,
-        pattern=START_GAME_CALLBACK_DATA
-    ),
 ]
+
+# ROUTES
+CHOICE_GAME_ROUTES = {
+    MAIN_MENU_GAME_CALLBACK_DATA: choice_type_game,
+    LIST_SINGLE_GAME_CALLBACK_DATA: list_games,
+    LIST_DUEL_GAME_CALLBACK_DATA: list_games,
+    LIST_PARTY_GAME_CALLBACK_DATA: list_games,
+    SELECT_GAME_CALLBACK_DATA: select_game,
+    START_GAME_CALLBACK_DATA: start_game,
+}
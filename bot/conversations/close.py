@@ -1,10 +1,7 @@
 import logging
 
 from telegram import Update
-from telegram.ext import (
-    CallbackQueryHandler,
-    ContextTypes,
-)
+from telegram.ext import ContextTypes
 
 from bot.constants.callback import COMMAND_CLOSE_CALLBACK_DATA
 from bot.decorators.logging import logging_basic_infos
@@ -29,7 +26,8 @@ async def close(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         await send_answer(
             function_caller=function_caller,
             query=query,
-            text='Fechando conversa...'
+            text='Fechando conversa...',
+            context=context,
         )
         await delete_message(
             function_caller=function_caller,
@@ -38,7 +36,7 @@ async def close(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         )
 
 
-CLOSE_MSG_HANDLER = CallbackQueryHandler(
-    close,
-    pattern=f'^{{"command":"{COMMAND_CLOSE_CALLBACK_DATA}"'
-)
+# ROUTES
+CLOSE_MSG_ROUTES = {
+    COMMAND_CLOSE_CALLBACK_DATA: close,
+}
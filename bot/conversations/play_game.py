@@ -1,33 +1,79 @@
 import logging
+from typing import Optional
 from telegram import Update
-from telegram.ext import (
-    CallbackQueryHandler,
-    ContextTypes
-)
+from telegram.ext import ContextTypes
 
 from bot.decorators.logging import logging_basic_infos
+from bot.functions.buttons import get_callback_payload_store
 from bot.functions.chat import (
     edit_message_text,
     send_alert,
-    send_private_message,
-    update_all_player_messages
+    send_answer,
+    send_private_message
+)
+from bot.functions.game import (
+    acquire_game_lock,
+    is_game_removed,
+    load_game,
+    remove_game,
+    submit_play
 )
-from bot.functions.game import get_game, remove_game
+from bot.games.buttons.payload_store import ExpiredPayloadError
 from bot.games.buttons.play_button import PlayButton
 from bot.games.enums.command import CallbackKeyEnum, CommandEnum
 from bot.games.player import Player
 
 
+EXPIRED_BUTTON_TEXT = (
+    'Esse botão expirou. Use os botões da mensagem mais recente da partida.'
+)
+
+
+async def get_play_dict(
+    function_caller: str,
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE
+) -> Optional[dict]:
+    '''Retorna o dicionário do callback_data do botão. Se o botão tiver um
+    token que não está mais no CallbackPayloadStore (ex: depois de
+    reiniciar o bot), envia um alerta avisando que o botão expirou e
+    retorna None.
+    '''
+
+    query = update.callback_query
+    try:
+        return PlayButton.callback_data_to_dict(
+            query.data,
+            payload_store=get_callback_payload_store(context=context),
+        )
+    except ExpiredPayloadError as error:
+        logging.info(f'{function_caller}: {error}')
+        await send_alert(
+            function_caller=function_caller,
+            query=query,
+            text=EXPIRED_BUTTON_TEXT,
+            context=context,
+        )
+
+        return None
+
+
 @logging_basic_infos
 async def close_game(update: Update, context: ContextTypes.DEFAULT_TYPE):
     logging.info('CLOSE_GAME()')
     user_name = update.effective_user.name
     message_id = update.effective_message.id
     query = update.callback_query
-    data = query.data
-    play_dict = PlayButton.callback_data_to_dict(data)
+    play_dict = await get_play_dict(
+        function_caller='CLOSE_GAME(EXPIRED_BUTTON)',
+        update=update,
+        context=context,
+    )
+    if play_dict is None:
+        return
+
     game_id = play_dict[CallbackKeyEnum.GAME_ID]
-    game = get_game(game_id=game_id, context=context)
+    game = await load_game(game_id=game_id, context=context)
     function_caller = 'CLOSE_GAME()'
 
     if game is None:
@@ -39,12 +85,23 @@ async def close_game(update: Update, context: ContextTypes.DEFAULT_TYPE):
             message_id=message_id,
         )
 
-    remove_game(game_id=game_id, context=context)
+    async with acquire_game_lock(game_id=game_id, context=context):
+        is_removed = is_game_removed(game=game, context=context)
+        if not is_removed:
+            remove_game(game_id=game_id, context=context)
+    if is_removed:
+        return await send_alert(
+            function_caller='CLOSE_GAME(GAME_NOT_FOUND)',
+            query=query,
+            text='Partida não encontrada.',
+            context=context,
+        )
 
     await send_alert(
         function_caller=function_caller,
         query=query,
-        text='Encerrando jogo...'
+        text='Encerrando jogo...',
+        context=context,
     )
 
     text = 'Jogo {game_name} ({game_id}) foi encerrado por {user_name}.'
@@ -53,7 +110,7 @@ async def close_game(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
         new_text = text.format(
             game_name=game.DISPLAY_NAME,
-            game_id=game.id,
+            game_id=game.short_id,
             user_name=user_name,
         )
         if callable(game.play_text_formatter):
@@ -76,10 +133,22 @@ async def help_game(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user_id = update.effective_user.id
     message_id = update.effective_message.id
     query = update.callback_query
-    data = query.data
-    play_dict = PlayButton.callback_data_to_dict(data)
+    play_dict = await get_play_dict(
+        function_caller='HELP_GAME(EXPIRED_BUTTON)',
+        update=update,
+        context=context,
+    )
+    if play_dict is None:
+        return
+
     game_id = play_dict[CallbackKeyEnum.GAME_ID]
-    game = get_game(game_id=game_id, context=context)
+    game = await load_game(game_id=game_id, context=context)
+    await send_answer(
+        function_caller='HELP_GAME()',
+        query=query,
+        text=None,
+        context=context,
+    )
 
     if game is None:
         text = 'Partida não encontrada.'
@@ -114,10 +183,16 @@ async def play_game(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user = update.effective_user
     message_id = update.effective_message.id
     query = update.callback_query
-    data = query.data
-    play_dict = PlayButton.callback_data_to_dict(data)
+    play_dict = await get_play_dict(
+        function_caller='PLAY_GAME(EXPIRED_BUTTON)',
+        update=update,
+        context=context,
+    )
+    if play_dict is None:
+        return
+
     game_id = play_dict[CallbackKeyEnum.GAME_ID]
-    game = get_game(game_id=game_id, context=context)
+    game = await load_game(game_id=game_id, context=context)
 
     if game is None:
         text = 'Partida não encontrada.'
@@ -133,40 +208,40 @@ async def play_game(update: Update, context: ContextTypes.DEFAULT_TYPE):
     logging.info(player)
     logging.info(f'Play Dict: {play_dict}')
     # logging.info(f'{game}')
-    play_response = game.play(player=player, play_dict=play_dict)
+    # A jogada é aplicada pelo GameActor da partida, que também atualiza as
+    # mensagens dos jogadores em segundo plano, agrupando as jogadas feitas
+    # em sequência rápida (ex: selecionar várias pilhas no JokerJail) em
+    # uma única atualização.
+    play_response = await submit_play(
+        game=game,
+        player=player,
+        play_dict=play_dict,
+        context=context,
+    )
 
     if isinstance(play_response, str):
         await send_alert(
             function_caller='PLAY_GAME()',
             query=query,
-            text=play_response
+            text=play_response,
+            context=context,
+        )
+    else:
+        await send_answer(
+            function_caller='PLAY_GAME()',
+            query=query,
+            text=None,
+            context=context,
         )
-
-    await update_all_player_messages(
-        function_caller='PLAY_GAME()',
-        game=game,
-        context=context,
-    )
 
 
-# HANDLERS
-PLAY_GAME_HANDLERS = [
-    CallbackQueryHandler(
-        close_game,
-        pattern=PlayButton.callback_data_to_pattern(CommandEnum.CLOSE)
-    ),
-    CallbackQueryHandler(
-        help_game,
-        pattern=PlayButton.callback_data_to_pattern(CommandEnum.HELP)
-    ),
-    CallbackQueryHandler(
-        play_game,
-        pattern='|'.join((
-            PlayButton.callback_data_to_pattern(CommandEnum.DRAW),
-            PlayButton.callback_data_to_pattern(CommandEnum.PASS),
-            PlayButton.callback_data_to_pattern(CommandEnum.PLAY),
-            PlayButton.callback_data_to_pattern(CommandEnum.SELECT_COLOR),
-            PlayButton.callback_data_to_pattern(CommandEnum.CALCULATE),
-        ))
-    ),
-]
+# ROUTES
+PLAY_GAME_ROUTES = {
+    CommandEnum.CLOSE: close_game,
+    CommandEnum.HELP: help_game,
+    CommandEnum.DRAW: play_game,
+    CommandEnum.PASS: play_game,
+    CommandEnum.PLAY: play_game,
+    CommandEnum.SELECT_COLOR: play_game,
+    CommandEnum.CALCULATE: play_game,
+}
@@ -0,0 +1,114 @@
+import logging
+
+from collections import Counter
+from typing import Callable, Dict, Optional, Union
+
+from telegram import Update
+from telegram.ext import CallbackQueryHandler, ContextTypes
+
+from bot.conversations.choice_game import CHOICE_GAME_ROUTES
+from bot.conversations.close import CLOSE_MSG_ROUTES
+from bot.conversations.play_game import PLAY_GAME_ROUTES
+from bot.functions.buttons import callback_data_to_dict
+from bot.games.buttons.callback_codec import get_callback_data_command
+from bot.games.enums.command import CommandEnum
+
+
+UNKNOWN_ROUTE_KEY = 'UNKNOWN'
+ROUTE_PREFIX_SEPARATOR = '_'
+
+
+class CallbackQueryRouter:
+    '''Handler único para todas as CallbackQuery.
+
+    A rota de cada callback_data é encontrada com uma única leitura:
+    - Botões de jogada (callback_codec): a tag do comando (CommandEnum).
+    - Botões de menu ("@main", "@game_NOME", "@start_ID"): o texto até o
+    primeiro "_" (inclusive) ou o texto inteiro.
+    - Botões de chat em JSON ({"command":"@close",...}): o valor de
+    "command".
+
+    O número de chamadas de cada rota fica em counter.
+    '''
+
+    def __init__(self, *route_dicts: Dict[Union[CommandEnum, str], Callable]):
+        self.route_dict: Dict[Union[CommandEnum, str], Callable] = {}
+        self.counter = Counter()
+        for route_dict in route_dicts:
+            self.add_routes(route_dict)
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'total_routes={len(self.route_dict)}, '
+            f'counter={dict(self.counter)})'
+        )
+
+    def add_routes(self, route_dict: Dict[Union[CommandEnum, str], Callable]):
+        for route_key, callback in route_dict.items():
+            if route_key in self.route_dict:
+                raise ValueError(f'Rota "{route_key}" já foi adicionada.')
+            self.route_dict[route_key] = callback
+
+    @staticmethod
+    def get_route_key(data: str) -> Optional[Union[CommandEnum, str]]:
+        '''Retorna a chave da rota de um callback_data.
+        '''
+
+        if not data:
+            return None
+
+        command = get_callback_data_command(data)
+        if command is not None:
+            return command
+
+        first_char = data[0]
+        if first_char == '@':
+            separator_index = data.find(ROUTE_PREFIX_SEPARATOR)
+            if separator_index == -1:
+                return data
+            return data[:separator_index + 1]
+        if first_char == '{':
+            try:
+                return callback_data_to_dict(data).get('command')
+            except (ValueError, SyntaxError, AttributeError):
+                return None
+
+        return None
+
+    def get_callback(self, data: str) -> Optional[Callable]:
+        route_key = self.get_route_key(data)
+        callback = self.route_dict.get(route_key)
+        if callback is None:
+            self.counter[UNKNOWN_ROUTE_KEY] += 1
+        else:
+            counter_key = getattr(route_key, 'name', route_key)
+            self.counter[counter_key] += 1
+
+        return callback
+
+    async def route(
+        self,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE
+    ):
+        data = update.callback_query.data
+        callback = self.get_callback(data)
+        if callback is None:
+            logging.warning(
+                f'CALLBACK_QUERY_ROUTER: Rota não encontrada: "{data}".'
+            )
+            return None
+
+        return await callback(update, context)
+
+    def make_handler(self) -> CallbackQueryHandler:
+        return CallbackQueryHandler(self.route)
+
+
+CALLBACK_QUERY_ROUTER = CallbackQueryRouter(
+    CLOSE_MSG_ROUTES,
+    CHOICE_GAME_ROUTES,
+    PLAY_GAME_ROUTES,
+)
+CALLBACK_QUERY_ROUTER_HANDLER = CALLBACK_QUERY_ROUTER.make_handler()
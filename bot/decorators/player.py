@@ -3,6 +3,7 @@ import logging
 from telegram import Update
 from telegram.ext import ContextTypes, ConversationHandler
 
+from bot.functions.buttons import callback_data_to_dict
 from bot.functions.chat import send_alert
 
 
@@ -21,7 +22,7 @@ def alert_if_not_chat_owner(
             query = update.callback_query
 
             if query:
-                data = eval(query.data)
+                data = callback_data_to_dict(query.data)
                 data_user_id = data['user_id']
                 if data_user_id != user_id and data_user_id is not None:
                     if isinstance(alert_text, str):
@@ -29,6 +30,7 @@ def alert_if_not_chat_owner(
                             function_caller='@ALERT_IF_NOT_CHAT_OWNER',
                             query=query,
                             text=alert_text,
+                            context=context,
                         )
                     return retry_state
 
@@ -1,18 +1,24 @@
+import json
+
+from ast import literal_eval
 from random import choice
 from typing import List
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.ext import ContextTypes
 
 from bot.constants.callback import (
     COMMAND_CLOSE_CALLBACK_DATA,
     COMMAND_REFRESH_CALLBACK_DATA
 )
 from bot.functions.enums.emoji import EmojiEnum, FaceEmojiEnum
+from bot.games.buttons.payload_store import CallbackPayloadStore
 
 
 LEFT_CLOSE_BUTTON_TEXT = f'{EmojiEnum.CLOSE.value}Fechar'
 RIGHT_CLOSE_BUTTON_TEXT = f'Fechar{EmojiEnum.CLOSE.value}'
 REFRESH_BUTTON_TEXT = f'{EmojiEnum.REFRESH.value}Atualizar'
 DETAIL_BUTTON_TEXT = f'{EmojiEnum.DETAIL.value}Detalhar'
+CALLBACK_PAYLOAD_STORE_KEY = 'callback_payload_store'
 
 
 def get_close_button(
@@ -30,10 +36,10 @@ def get_close_button(
         if right_icon:
             text = RIGHT_CLOSE_BUTTON_TEXT
 
-    callback_data = (
-        f'{{"command":"{COMMAND_CLOSE_CALLBACK_DATA}",'
-        f'"user_id":{user_id}}}'
-    )
+    callback_data = dict_to_callback_data({
+        'command': COMMAND_CLOSE_CALLBACK_DATA,
+        'user_id': user_id,
+    })
 
     return InlineKeyboardButton(
         text=text,
@@ -52,7 +58,10 @@ def get_refresh_close_button(
     '''
 
     button_list = []
-    callback_data = f'{{"{refresh_data}":1,"user_id":{user_id}}}'
+    callback_data = dict_to_callback_data({
+        refresh_data: 1,
+        'user_id': user_id,
+    })
     button_list.append(
         InlineKeyboardButton(
             REFRESH_BUTTON_TEXT,
@@ -60,9 +69,11 @@ def get_refresh_close_button(
         )
     )
     if to_detail:
-        callback_data = (
-            f'{{"{refresh_data}":1,"verbose":"v","user_id":{user_id}}}'
-        )
+        callback_data = dict_to_callback_data({
+            refresh_data: 1,
+            'verbose': 'v',
+            'user_id': user_id,
+        })
         button_list.append(
             InlineKeyboardButton(
                 DETAIL_BUTTON_TEXT,
@@ -107,3 +118,38 @@ def get_refresh_close_keyboard(
             to_detail=to_detail
         )
     ])
+
+
+def dict_to_callback_data(data: dict) -> str:
+    '''Transforma um dicionário no JSON compacto usado no campo data dos
+    botões de chat (fechar, atualizar).
+    '''
+
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+
+
+def callback_data_to_dict(callback_data: str) -> dict:
+    '''Transforma de volta o campo data de um botão de chat em um
+    dicionário sem usar eval. Mensagens antigas podem ter "None" no lugar de
+    "null", então elas são lidas com literal_eval.
+    '''
+
+    try:
+        return json.loads(callback_data)
+    except ValueError:
+        return literal_eval(callback_data)
+
+
+def get_callback_payload_store(
+    context: ContextTypes.DEFAULT_TYPE
+) -> CallbackPayloadStore:
+    '''Retorna o CallbackPayloadStore do bot (ver
+    bot.games.buttons.payload_store), criando-o no bot_data na primeira vez.
+    '''
+
+    store = context.bot_data.get(CALLBACK_PAYLOAD_STORE_KEY)
+    if store is None:
+        store = CallbackPayloadStore()
+        context.bot_data[CALLBACK_PAYLOAD_STORE_KEY] = store
+
+    return store
@@ -1,9 +1,8 @@
+import asyncio
 import logging
 
 from datetime import timedelta
-from random import randint
-from time import sleep
-from typing import Any, Callable, Union
+from typing import Any, Callable, Dict, Union
 from bson import ObjectId
 
 from telegram import (
@@ -15,10 +14,28 @@ from telegram.constants import ChatAction, ChatType, ParseMode
 from telegram.error import BadRequest, Forbidden, RetryAfter, TimedOut
 from telegram.ext import ContextTypes, ConversationHandler
 
-from bot.functions.buttons import get_close_keyboard
+from bot.functions.buttons import (
+    get_callback_payload_store,
+    get_close_keyboard
+)
 from bot.functions.enums.emoji import EmojiEnum
+from bot.functions.enums.priority import OutboxPriorityEnum
+from bot.functions.message_cache import (
+    clear_cached_message_hash,
+    get_cached_message_hash,
+    get_message_hash,
+    set_cached_message_hash
+)
+from bot.functions.rate_limiter import get_rate_limiter
+from bot.functions.retry import (
+    RETRY_MAX_ATTEMPTS,
+    get_retry_time,
+    is_retry_game_removed,
+    wait_retry
+)
 from bot.functions.text import create_text_in_box
 from bot.games.boards.board import BaseBoard
+from bot.games.player import Player
 
 
 CALLBACK_CLOSE = '$close'
@@ -27,6 +44,18 @@ HOURS_DELETE_MESSAGE_FROM_CONTEXT = 4
 CHAT_TYPE_GROUPS = (ChatType.GROUP, ChatType.SUPERGROUP)
 MIN_AUTODELETE_TIME = timedelta(minutes=15)
 HALF_AUTODELETE_TIME = timedelta(minutes=30)
+MAX_CONCURRENT_PLAYER_UPDATES = 10
+MESSAGE_NOT_MODIFIED_ERROR_TEXT = 'message is not modified'
+
+
+# UPDATE STATUS
+UPDATE_STATUS_SENT = 'SENT'
+UPDATE_STATUS_EDITED = 'EDITED'
+UPDATE_STATUS_MARKUP_EDITED = 'MARKUP_EDITED'
+UPDATE_STATUS_SKIPPED = 'SKIPPED'
+UPDATE_STATUS_RESENT = 'RESENT'
+UPDATE_STATUS_DEFERRED = 'DEFERRED'
+UPDATE_STATUS_ERROR = 'ERROR'
 
 
 # TEXTS
@@ -46,18 +75,33 @@ async def call_telegram_message_function(
     context: ContextTypes.DEFAULT_TYPE,
     need_response: bool = False,
     skip_retry: bool = False,
+    game_id: Union[int, str] = None,
+    priority: OutboxPriorityEnum = OutboxPriorityEnum.DEFAULT,
     **kwargs
 ) -> Union[Any, Message]:
     '''Função que chama qualquer função de mensagem do telegram.
     Caso ocorra um erro do tipo RetryAfter ou TimedOut, a função agurdará
     alguns segundos tentará novamente com um número máximo de 3 tentativas.
+    O tempo de espera cresce exponencialmente a cada tentativa e recebe um
+    jitter aleatório (get_retry_time).
 
-    Se need_response for True, a função aguardará para realizar uma nova
-    tentativa, caso contrário, a função será agendada em um job para ser
-    executada posteriormente.
+    Se need_response for True, a função aguardará (sem bloquear o event loop)
+    para realizar uma nova tentativa, caso contrário, a função será agendada
+    em um job para ser executada posteriormente.
 
     Se skip_retry for True, a função não tentará novamente e nem agendará uma
     nova tentativa.
+
+    Todas as chamadas passam pelo OutboundRateLimiter, que respeita os
+    limites global e por chat do Telegram. Um RetryAfter pausa todos os
+    envios para o mesmo chat.
+
+    Se game_id for passado, as novas tentativas pendentes serão canceladas
+    quando a partida for removida (remove_game). Nesse caso, a função
+    retorna None.
+
+    O priority define a faixa da chamada no OutboundRateLimiter. Sob carga,
+    chamadas com maior prioridade (menor valor) são enviadas primeiro.
     '''
 
     logging.info(f'{function_caller}->CALL_TELEGRAM_MESSAGE_FUNCTION()')
@@ -65,30 +109,33 @@ async def call_telegram_message_function(
         function_caller=function_caller,
         function=function,
         context=context,
+        game_id=game_id,
+        priority=priority,
         **kwargs
     )
+    rate_limiter = get_rate_limiter(context)
+    chat_id = kwargs.get('chat_id')
     response = None
     is_error = True
     catched_error = None
-    for i in range(3):
+    for i in range(RETRY_MAX_ATTEMPTS):
         try:
+            await rate_limiter.acquire(chat_id=chat_id, priority=priority)
             response = await function(**kwargs)
             is_error = False
             break
         except (RetryAfter, TimedOut) as error:
             catched_error = error
-            if skip_retry is True:
-                break
-
             if isinstance(error, RetryAfter):
-                sleep_time = error.retry_after + randint(1, 3)
-            elif isinstance(error, TimedOut):
-                sleep_time = 5
+                rate_limiter.pause(seconds=error.retry_after, chat_id=chat_id)
+            if skip_retry is True or i == RETRY_MAX_ATTEMPTS - 1:
+                break
 
+            sleep_time = get_retry_time(error=error, attempt=i)
             error_name = error.__class__.__name__
             if need_response is False:
                 logging.info(
-                    f'{error_name}{i}({sleep_time}): '
+                    f'{error_name}{i}({sleep_time:.2f}): '
                     f'creating JOB "{function.__name__}" '
                 )
                 job_name = (
@@ -107,10 +154,19 @@ async def call_telegram_message_function(
 
             logging.info(
                 f'{error_name}{i}: RETRYING activate "{function.__name__}" '
-                f'from {function_caller} in {sleep_time} seconds.'
+                f'from {function_caller} in {sleep_time:.2f} seconds.'
+            )
+            can_retry = await wait_retry(
+                sleep_time=sleep_time,
+                context=context,
+                game_id=game_id,
             )
-            sleep(sleep_time)
-            continue
+            if can_retry is False:
+                logging.info(
+                    f'{error_name}{i}: CANCELED "{function.__name__}" '
+                    f'from {function_caller}, game {game_id} was removed.'
+                )
+                return None
 
     if is_error is True:
         logging.error(f'ERROR: {function_caller}')
@@ -131,6 +187,8 @@ async def send_private_message(
     close_by_owner: bool = True,
     need_response: bool = False,
     skip_retry: bool = False,
+    game_id: Union[int, str] = None,
+    priority: OutboxPriorityEnum = OutboxPriorityEnum.DEFAULT,
 ) -> Message:
     ''' Tenta enviar mensagem privada, caso não consiga pelo erro "Forbidden"
     envia mensagem para o grupo marcando o nome do jogador.
@@ -160,6 +218,8 @@ async def send_private_message(
             context=context,
             need_response=need_response,
             skip_retry=skip_retry,
+            game_id=game_id,
+            priority=priority,
             **call_telegram_kwargs
         )
 
@@ -186,6 +246,8 @@ async def edit_message_text(
     markdown: bool = False,
     reply_markup: InlineKeyboardMarkup = REPLY_MARKUP_DEFAULT,
     close_by_owner: bool = True,
+    game_id: Union[int, str] = None,
+    priority: OutboxPriorityEnum = OutboxPriorityEnum.DEFAULT,
 ) -> Union[Message, bool]:
     '''Edita uma mensagem usando um Message ou um ContextTypes.
     '''
@@ -211,12 +273,46 @@ async def edit_message_text(
         function=context.bot.edit_message_text,
         context=context,
         need_response=need_response,
+        game_id=game_id,
+        priority=priority,
         **edit_text_kwargs
     )
 
     return response
 
 
+async def edit_message_reply_markup(
+    function_caller: str,
+    context: ContextTypes.DEFAULT_TYPE,
+    message_id: int,
+    chat_id: int = None,
+    need_response: bool = False,
+    reply_markup: InlineKeyboardMarkup = None,
+    game_id: Union[int, str] = None,
+    priority: OutboxPriorityEnum = OutboxPriorityEnum.DEFAULT,
+) -> Union[Message, bool]:
+    '''Edita somente o teclado de uma mensagem.
+    '''
+
+    chat_id = context._chat_id if chat_id is None else chat_id
+    edit_reply_markup_kwargs = dict(
+        chat_id=chat_id,
+        message_id=message_id,
+        reply_markup=reply_markup,
+    )
+    response = await call_telegram_message_function(
+        function_caller=f'{function_caller} -> EDIT_MESSAGE_REPLY_MARKUP()',
+        function=context.bot.edit_message_reply_markup,
+        context=context,
+        need_response=need_response,
+        game_id=game_id,
+        priority=priority,
+        **edit_reply_markup_kwargs
+    )
+
+    return response
+
+
 async def update_all_player_messages(
     function_caller: str,
     game: BaseBoard,
@@ -225,42 +321,191 @@ async def update_all_player_messages(
     markdown: bool = False,
     reply_markup: InlineKeyboardMarkup = None,
     close_by_owner: bool = True,
-    create_text_in_box_kwargs: dict = None
-):
+    create_text_in_box_kwargs: dict = None,
+    max_concurrent_updates: int = MAX_CONCURRENT_PLAYER_UPDATES,
+) -> Dict[str, str]:
+    '''Atualiza as mensagens de todos os jogadores da partida.
+
+    As mensagens são enviadas de forma concorrente, limitadas por um
+    semáforo com até max_concurrent_updates envios simultâneos. Se
+    max_concurrent_updates for 1, as mensagens são enviadas uma a uma.
+
+    Mensagens que não mudaram desde o último envio não são reenviadas e,
+    se somente o teclado mudou, apenas o teclado é editado.
+
+    A mensagem do jogador da vez é enviada com prioridade
+    CURRENT_PLAYER e as demais com prioridade PLAYER.
+
+    Retorna um dicionário com o resultado da atualização de cada jogador
+    (ID do jogador: UPDATE_STATUS).
+    '''
+
     logging.info(f'{function_caller}->UPDATE_ALL_PLAYER_MESSAGES()')
     logging.info(f'  Jogadores: {game.player_list}')
-    for player in game.player_list:
-        logging.info(f'  Atualizando mensagem de {player} em {game.id}.')
-
-        user_id = player.user_id
-        message_id = player.message_id
-        new_text = game.show_board(player=player)
-        if create_text_in_box_kwargs is not None:
-            new_text = create_text_in_box(
-                text=new_text,
-                **create_text_in_box_kwargs
+    if max_concurrent_updates < 1:
+        raise ValueError(
+            'max_concurrent_updates precisa ser maior que 0 '
+            f'({max_concurrent_updates}).'
+        )
+
+    semaphore = asyncio.Semaphore(max_concurrent_updates)
+    update_player_message_kwargs = dict(
+        function_caller=function_caller,
+        game=game,
+        context=context,
+        semaphore=semaphore,
+        need_response=need_response,
+        markdown=markdown,
+        reply_markup=reply_markup,
+        close_by_owner=close_by_owner,
+        create_text_in_box_kwargs=create_text_in_box_kwargs,
+    )
+    # O jogador da vez é atualizado primeiro.
+    current_player = game.current_player
+    player_list = sorted(
+        game.player_list,
+        key=lambda player: player != current_player
+    )
+    result_list = await asyncio.gather(
+        *(
+            update_player_message(
+                player=player,
+                **update_player_message_kwargs
             )
-        player_reply_markup = reply_markup
-        if reply_markup is None:
-            player_keyboard = game.player_keyboard(player=player)
-            player_reply_markup = player_keyboard.make_keyboard()
+            for player in player_list
+        ),
+        return_exceptions=True,
+    )
+
+    summary = {}
+    for player, result in zip(player_list, result_list):
+        if isinstance(result, Exception):
+            logging.error(
+                f'UPDATE_ALL_PLAYER_MESSAGES() ERROR: {player} em {game.id}: '
+                f'{result.__class__.__name__}({result})'
+            )
+            result = UPDATE_STATUS_ERROR
+        summary[player.id] = result
+
+    logging.info(f'  Resumo da atualização de {game.id}: {summary}')
+
+    return summary
+
+
+async def update_player_message(
+    function_caller: str,
+    game: BaseBoard,
+    player: Player,
+    context: ContextTypes.DEFAULT_TYPE,
+    semaphore: asyncio.Semaphore,
+    need_response: bool = False,
+    markdown: bool = False,
+    reply_markup: InlineKeyboardMarkup = None,
+    close_by_owner: bool = True,
+    create_text_in_box_kwargs: dict = None,
+) -> str:
+    '''Atualiza a mensagem de um jogador da partida. Caso a edição falhe
+    com BadRequest, envia uma nova mensagem privada para o jogador, exceto
+    quando a mensagem não foi modificada.
+
+    O hash da mensagem só é guardado depois que o Telegram confirma a
+    edição. Se a edição for adiada para um job (RetryAfter) ou cancelada,
+    o hash é removido, pois o conteúdo da mensagem passa a ser
+    desconhecido, e a próxima atualização edita a mensagem novamente.
+
+    Retorna o UPDATE_STATUS da atualização.
+    '''
+
+    logging.info(f'  Atualizando mensagem de {player} em {game.id}.')
+
+    user_id = player.user_id
+    message_id = player.message_id
+    new_text = game.show_board(player=player)
+    if create_text_in_box_kwargs is not None:
+        new_text = create_text_in_box(
+            text=new_text,
+            **create_text_in_box_kwargs
+        )
+    player_reply_markup = reply_markup
+    if reply_markup is None:
+        player_keyboard = game.player_keyboard(player=player)
+        player_reply_markup = player_keyboard.make_keyboard(
+            payload_store=get_callback_payload_store(context=context)
+        )
+
+    game_id = game.id
+    priority = (
+        OutboxPriorityEnum.CURRENT_PLAYER
+        if player == game.current_player
+        else OutboxPriorityEnum.PLAYER
+    )
+    message_hash = get_message_hash(
+        text=new_text,
+        reply_markup=player_reply_markup
+    )
+    cached_message_hash = get_cached_message_hash(
+        game_id=game_id,
+        player_id=player.id,
+        context=context,
+    )
+    if cached_message_hash == (message_id, *message_hash):
+        logging.info(f'  Mensagem de {player} em {game_id} não mudou.')
+        return UPDATE_STATUS_SKIPPED
 
+    is_only_markup_changed = (
+        cached_message_hash is not None and
+        cached_message_hash[:2] == (message_id, message_hash[0])
+    )
+    set_cached_message_hash_kwargs = dict(
+        game_id=game_id,
+        player_id=player.id,
+        message_hash=message_hash,
+        context=context,
+    )
+    send_private_message_kwargs = dict(
+        function_caller=function_caller,
+        context=context,
+        text=new_text,
+        user_id=user_id,
+        markdown=markdown,
+        reply_markup=player_reply_markup,
+        close_by_owner=close_by_owner,
+        need_response=need_response,
+        game_id=game_id,
+        priority=priority,
+    )
+    async with semaphore:
         if message_id is None:
             response = await send_private_message(
-                function_caller=function_caller,
-                context=context,
-                text=new_text,
-                user_id=user_id,
-                markdown=markdown,
-                reply_markup=player_reply_markup,
-                close_by_owner=close_by_owner,
-                need_response=need_response,
+                **send_private_message_kwargs
             )
+            if not isinstance(response, Message):
+                return UPDATE_STATUS_ERROR
+
             new_message_id = response.message_id
             player.set_message_id(message_id=new_message_id)
-        else:
-            try:
-                await edit_message_text(
+            set_cached_message_hash(
+                message_id=new_message_id,
+                **set_cached_message_hash_kwargs
+            )
+
+            return UPDATE_STATUS_SENT
+
+        try:
+            if is_only_markup_changed is True:
+                response = await edit_message_reply_markup(
+                    function_caller=function_caller,
+                    context=context,
+                    message_id=message_id,
+                    chat_id=user_id,
+                    need_response=need_response,
+                    reply_markup=player_reply_markup,
+                    game_id=game_id,
+                    priority=priority,
+                )
+                update_status = UPDATE_STATUS_MARKUP_EDITED
+            else:
+                response = await edit_message_text(
                     function_caller=function_caller,
                     new_text=new_text,
                     context=context,
@@ -271,24 +516,64 @@ async def update_all_player_messages(
                     markdown=markdown,
                     reply_markup=player_reply_markup,
                     close_by_owner=close_by_owner,
+                    game_id=game_id,
+                    priority=priority,
                 )
-            except BadRequest as e:
-                e_text = e.message
+                update_status = UPDATE_STATUS_EDITED
+
+            if not is_confirmed_edit(response):
                 logging.info(
-                    f'UPDATE_ALL_PLAYER_MESSAGES() BADREQUEST EXCEPT: {e_text}'
+                    f'  Edição da mensagem de {player} em {game_id} '
+                    f'não foi confirmada ({response}).'
                 )
-                response = await send_private_message(
-                    function_caller=function_caller,
+                clear_cached_message_hash(
+                    game_id=game_id,
+                    player_id=player.id,
                     context=context,
-                    text=new_text,
-                    user_id=user_id,
-                    markdown=markdown,
-                    reply_markup=player_reply_markup,
-                    close_by_owner=close_by_owner,
-                    need_response=need_response,
                 )
-                new_message_id = response.message_id
-                player.set_message_id(message_id=new_message_id)
+                return UPDATE_STATUS_DEFERRED
+
+            set_cached_message_hash(
+                message_id=message_id,
+                **set_cached_message_hash_kwargs
+            )
+
+            return update_status
+        except BadRequest as e:
+            e_text = e.message
+            logging.info(
+                f'UPDATE_PLAYER_MESSAGE() BADREQUEST EXCEPT: {e_text}'
+            )
+            if MESSAGE_NOT_MODIFIED_ERROR_TEXT in e_text.lower():
+                set_cached_message_hash(
+                    message_id=message_id,
+                    **set_cached_message_hash_kwargs
+                )
+                return UPDATE_STATUS_SKIPPED
+
+            response = await send_private_message(
+                **send_private_message_kwargs
+            )
+            if not isinstance(response, Message):
+                return UPDATE_STATUS_ERROR
+
+            new_message_id = response.message_id
+            player.set_message_id(message_id=new_message_id)
+            set_cached_message_hash(
+                message_id=new_message_id,
+                **set_cached_message_hash_kwargs
+            )
+
+            return UPDATE_STATUS_RESENT
+
+
+def is_confirmed_edit(response: Union[Message, bool, Any]) -> bool:
+    '''Retorna True se a resposta da edição veio do Telegram (Message ou
+    True), e False se a edição foi adiada para um job
+    (ConversationHandler.END) ou cancelada (None).
+    '''
+
+    return isinstance(response, Message) or response is True
 
 
 # QUERY FUNCTIONS
@@ -335,11 +620,17 @@ async def send_answer(
     function_caller: str,
     query: CallbackQuery,
     text: str,
+    context: ContextTypes.DEFAULT_TYPE = None,
 ):
     '''Envia um answer usando uma query.
+    Se context for passado, o answer passa pelo OutboundRateLimiter na
+    faixa de maior prioridade (ANSWER).
     '''
 
     logging.info(f'{function_caller}->SEND_ANSWER()')
+    if context is not None:
+        rate_limiter = get_rate_limiter(context)
+        await rate_limiter.acquire(priority=OutboxPriorityEnum.ANSWER)
     try:
         await query.answer(text=text, show_alert=False)
     except BadRequest:
@@ -351,11 +642,17 @@ async def send_alert(
     function_caller: str,
     query: CallbackQuery,
     text: str,
+    context: ContextTypes.DEFAULT_TYPE = None,
 ):
     '''Envia um alert usando uma query.
+    Se context for passado, o alert passa pelo OutboundRateLimiter na
+    faixa de maior prioridade (ANSWER).
     '''
 
     logging.info(f'{function_caller}->SEND_ALERT()')
+    if context is not None:
+        rate_limiter = get_rate_limiter(context)
+        await rate_limiter.acquire(priority=OutboxPriorityEnum.ANSWER)
     try:
         await query.answer(text=text, show_alert=True)
     except BadRequest:
@@ -374,5 +671,15 @@ async def job_call_telegram(context: ContextTypes.DEFAULT_TYPE):
     call_telegram_kwargs = job.data
     call_telegram_kwargs['function_caller'] += ' and JOB_CALL_TELEGRAM()'
     logging.info(call_telegram_kwargs['function_caller'])
+    game_id = call_telegram_kwargs.get('game_id')
+    if (
+        game_id is not None and
+        is_retry_game_removed(game_id=game_id, context=context)
+    ):
+        logging.info(
+            f'JOB_CALL_TELEGRAM(): Partida {game_id} foi removida, '
+            f'nova tentativa cancelada.'
+        )
+        return None
 
     await call_telegram_message_function(**call_telegram_kwargs)
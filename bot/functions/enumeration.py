@@ -1,6 +1,40 @@
 import logging
 
-from enum import Enum
+from enum import Enum, EnumMeta
+from typing import Dict, Tuple, Type
+
+
+# Tabelas de cada classe Enum: membro -> índice e índice -> membro.
+ENUM_INDEX_DICT: Dict[Type[Enum], Dict[Enum, int]] = {}
+ENUM_MEMBERS_DICT: Dict[Type[Enum], Tuple[Enum, ...]] = {}
+
+
+class IndexedEnumMeta(EnumMeta):
+    '''Metaclasse que cria as tabelas de índices da classe Enum assim que
+    ela é definida (ex: Names e Suits).
+    '''
+
+    def __new__(metacls, cls, bases, classdict, **kwargs):
+        enum_class = super().__new__(metacls, cls, bases, classdict, **kwargs)
+        if enum_class.__members__:
+            build_enum_index_table(enum_class)
+
+        return enum_class
+
+
+def build_enum_index_table(enum_class: Type[Enum]) -> Tuple[Enum, ...]:
+    ''' Cria as tabelas de índices de uma classe Enum e retorna a tupla
+    com os elementos na ordem de instância.
+    '''
+
+    member_tuple = tuple(enum_class)
+    ENUM_MEMBERS_DICT[enum_class] = member_tuple
+    ENUM_INDEX_DICT[enum_class] = {
+        member: index
+        for index, member in enumerate(member_tuple)
+    }
+
+    return member_tuple
 
 
 def get_enum_index(enum_instance: Enum) -> int:
@@ -11,10 +45,13 @@ def get_enum_index(enum_instance: Enum) -> int:
     if not isinstance(enum_instance, Enum):
         raise TypeError('"enum_instance" precisa ser uma instancia de Enum.')
 
-    enum_list = list(enum_instance.__class__)
-    index = enum_list.index(enum_instance)
+    enum_class = enum_instance.__class__
+    index_dict = ENUM_INDEX_DICT.get(enum_class)
+    if index_dict is None:
+        build_enum_index_table(enum_class)
+        index_dict = ENUM_INDEX_DICT[enum_class]
 
-    return index
+    return index_dict[enum_instance]
 
 
 def get_enum_by_index(enum_class: Enum, index: int) -> Enum:
@@ -27,10 +64,11 @@ def get_enum_by_index(enum_class: Enum, index: int) -> Enum:
     if not isinstance(index, int):
         raise TypeError('"index" precisa ser um inteiro.')
 
-    enum_list = list(enum_class)
-    enum_name = enum_list[index]
+    member_tuple = ENUM_MEMBERS_DICT.get(enum_class)
+    if member_tuple is None:
+        member_tuple = build_enum_index_table(enum_class)
 
-    return enum_name
+    return member_tuple[index]
 
 
 if __name__ == '__main__':
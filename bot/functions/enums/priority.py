@@ -0,0 +1,12 @@
+from enum import IntEnum
+
+
+class OutboxPriorityEnum(IntEnum):
+    '''Prioridade das chamadas para a API do Telegram. Quanto menor o valor,
+    maior a prioridade.
+    '''
+
+    ANSWER = 0
+    CURRENT_PLAYER = 1
+    PLAYER = 2
+    DEFAULT = 3
@@ -1,33 +1,578 @@
-from typing import Union
+import asyncio
+import logging
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, Optional, Union
+from decouple import config
+from telegram.error import TelegramError
 from telegram.ext import ContextTypes
 
+from bot.functions.buttons import get_callback_payload_store
+from bot.functions.chat import edit_message_text, update_all_player_messages
+from bot.functions.game_actor import GameActor
+from bot.functions.game_registry import (
+    EVICTION_REASON_IDLE,
+    GAME_REGISTRY_KEY,
+    GameRegistry
+)
+from bot.functions.game_store import MongoGameStore
+from bot.functions.message_cache import clear_game_message_cache
+from bot.functions.retry import cancel_game_retries
 from bot.games.boards.board import BaseBoard
+from bot.games.buttons.payload_store import clear_game_payloads
+from bot.games.game_id import decode_game_id
+from bot.games.journal import PlayJournal
+from bot.games.player import Player
+
+
+GAME_LOCKS_KEY = 'game_locks'
+GAME_ACTORS_KEY = 'game_actors'
+GAME_STORE_KEY = 'game_store'
+GAME_JOURNALS_KEY = 'game_journals'
+# Guarda o diário (PlayJournal) das ações de cada partida em andamento.
+GAME_JOURNAL = config('GAME_JOURNAL', default=True, cast=bool)
+# Tempo (segundos) sem atividade para que uma partida seja removida.
+GAME_IDLE_TTL = config('GAME_IDLE_TTL', default=3600, cast=float)
+# Tempo (segundos) que uma partida terminada fica disponível.
+GAME_FINISHED_TTL = config('GAME_FINISHED_TTL', default=600, cast=float)
+# Intervalo (segundos) entre as execuções do sweep_games.
+GAME_SWEEP_INTERVAL = config('GAME_SWEEP_INTERVAL', default=60, cast=float)
+# Tempo (segundos) que o GameActor aguarda antes de atualizar as mensagens
+# dos jogadores, agrupando as alterações feitas nesse intervalo.
+UPDATE_COALESCE_TIME = config('UPDATE_COALESCE_TIME', default=0.3, cast=float)
+
+
+def get_game_registry(context: ContextTypes.DEFAULT_TYPE) -> GameRegistry:
+    registry = context.bot_data.get(GAME_REGISTRY_KEY)
+    if registry is None:
+        registry = GameRegistry(
+            idle_ttl=GAME_IDLE_TTL,
+            finished_ttl=GAME_FINISHED_TTL,
+        )
+        context.bot_data[GAME_REGISTRY_KEY] = registry
+
+    return registry
+
+
+def get_game_store(
+    context: ContextTypes.DEFAULT_TYPE
+) -> Optional[MongoGameStore]:
+    '''Retorna o MongoGameStore ou None se as partidas não forem
+    persistidas.
+    '''
+
+    return context.bot_data.get(GAME_STORE_KEY)
 
 
 def add_game(game: BaseBoard, context: ContextTypes.DEFAULT_TYPE):
-    game_id = game.id
-    game_dict = context.bot_data.get('games', {})
-    game_dict[game_id] = game
+    registry = get_game_registry(context=context)
+    registry.add(game=game)
+    open_game_journal(game=game, context=context)
+    save_game(game=game, context=context)
+
+
+def save_game(game: BaseBoard, context: ContextTypes.DEFAULT_TYPE):
+    '''Agenda a gravação da partida no MongoDB (write-behind). Deve ser
+    chamada depois de cada alteração na partida.
+    '''
 
-    if 'games' not in context.bot_data:
-        context.bot_data['games'] = game_dict
+    store = get_game_store(context=context)
+    if store is not None:
+        journal = get_game_journal(game_id=game.id, context=context)
+        store.mark_dirty(game=game, journal=journal)
 
 
 def get_game(
     game_id: Union[int, str],
     context: ContextTypes.DEFAULT_TYPE
-) -> BaseBoard:
-    if isinstance(game_id, str):
-        game_id = int(game_id)
+) -> Optional[BaseBoard]:
+    '''Retorna a partida e atualiza o horário da última atividade dela.
+    Retorna None se a partida não existir ou se o game_id for inválido
+    (ex: um convite adulterado).
+    '''
+
+    try:
+        game_id = decode_game_id(game_id)
+    except ValueError as error:
+        logging.info(f'GET_GAME(): {error}')
+        return None
+
+    registry = get_game_registry(context=context)
+
+    return registry.get(game_id=game_id)
+
+
+async def load_game(
+    game_id: Union[int, str],
+    context: ContextTypes.DEFAULT_TYPE
+) -> Optional[BaseBoard]:
+    '''Retorna a partida da memória ou, se ela não estiver na memória
+    (ex: depois de reiniciar o bot), carrega a partida do MongoDB.
+    Retorna None se a partida não existir ou se o game_id for inválido.
+
+    Se o diário da partida foi gravado junto com o snapshot, a partida é
+    refeita a partir dele (ver replay_game_journal) e o diário continua
+    a partir das ações já gravadas.
+    '''
+
+    try:
+        game_id = decode_game_id(game_id)
+    except ValueError as error:
+        logging.info(f'LOAD_GAME(): {error}')
+        return None
+
+    game = get_game(game_id=game_id, context=context)
+    store = get_game_store(context=context)
+    if game is not None or store is None:
+        return game
+
+    stored_game, journal = await store.load_with_journal(game_id=game_id)
+    # Outro update pode ter carregado a partida durante o await.
+    game = get_game(game_id=game_id, context=context)
+    if game is None and stored_game is not None:
+        logging.info(f'LOAD_GAME(): Partida {game_id} carregada do MongoDB.')
+        game = replay_game_journal(
+            game=stored_game,
+            journal=journal,
+            board_factory=store.load_function,
+        )
+        if game is None:
+            game = stored_game
+            journal = None
+        get_game_registry(context=context).add(game=game)
+        open_game_journal(game=game, context=context, journal=journal)
+
+    return game
 
-    game_dict = context.bot_data.get('games', {})
 
-    return game_dict.get(game_id)
+def replay_game_journal(
+    game: BaseBoard,
+    journal: Optional[PlayJournal],
+    board_factory: Callable[[bytes], BaseBoard],
+) -> Optional[BaseBoard]:
+    '''Refaz a partida carregada do MongoDB a partir do diário gravado
+    junto com o snapshot dela. Os message_id dos jogadores não fazem parte
+    do diário, então são copiados da partida do snapshot.
+
+    Retorna None se não houver diário ou se a partida refeita não for
+    igual à do snapshot. Nesse caso, a partida do snapshot deve ser usada
+    e um novo diário deve ser aberto.
+    '''
+
+    if journal is None:
+        return None
+
+    try:
+        replayed_game = journal.replay(board_factory=board_factory)
+    except Exception as error:
+        logging.error(
+            f'REPLAY_GAME_JOURNAL(): Erro ao refazer a partida {game.id}: '
+            f'{error!r}'
+        )
+        return None
+
+    for player in replayed_game.player_list:
+        stored_player = game.get_player(player)
+        if stored_player is not None:
+            player.message_id = stored_player.message_id
+
+    if replayed_game.to_snapshot() != game.to_snapshot():
+        logging.error(
+            f'REPLAY_GAME_JOURNAL(): Partida {game.id} refeita pelo diário '
+            'é diferente do snapshot.'
+        )
+        return None
+
+    return replayed_game
 
 
 def remove_game(game_id: Union[int, str], context: ContextTypes.DEFAULT_TYPE):
-    if isinstance(game_id, str):
-        game_id = int(game_id)
+    game_id = decode_game_id(game_id)
+
+    registry = get_game_registry(context=context)
+    registry.remove(game_id=game_id)
+    store = get_game_store(context=context)
+    if store is not None:
+        store.mark_removed(game_id=game_id)
+    # Se a partida for removida dentro do Lock (ex: close_game), o Lock só
+    # é descartado quando for liberado (ver acquire_game_lock).
+    release_game_lock(game_id=game_id, context=context)
+    context.bot_data.get(GAME_JOURNALS_KEY, {}).pop(game_id, None)
+    stop_game_actor(game_id=game_id, context=context)
+    cancel_game_retries(game_id=game_id, context=context)
+    clear_game_message_cache(game_id=game_id, context=context)
+    clear_game_payloads(
+        game_id=game_id,
+        store=get_callback_payload_store(context=context),
+    )
+
+
+def is_game_removed(
+    game: BaseBoard,
+    context: ContextTypes.DEFAULT_TYPE
+) -> bool:
+    '''Retorna True se a partida não está mais no GameRegistry (ex: foi
+    removida pelo remove_game depois que o handler a obteve). Deve ser
+    verificado dentro do Lock da partida, antes de alterá-la.
+    '''
+
+    registry = get_game_registry(context=context)
+
+    return registry.get(game_id=game.id, touch=False) is not game
+
+
+def open_game_journal(
+    game: BaseBoard,
+    context: ContextTypes.DEFAULT_TYPE,
+    journal: Optional[PlayJournal] = None
+) -> Optional[PlayJournal]:
+    '''Abre o diário da partida a partir do estado atual dela ou, se
+    journal for passado (ex: o diário carregado do MongoDB), continua
+    esse diário. Retorna None se GAME_JOURNAL for False.
+    '''
+
+    if GAME_JOURNAL is not True:
+        return None
+
+    if journal is None:
+        journal = PlayJournal.from_board(board=game)
+    context.bot_data.setdefault(GAME_JOURNALS_KEY, {})[game.id] = journal
+
+    return journal
+
+
+def get_game_journal(
+    game_id: Union[int, str],
+    context: ContextTypes.DEFAULT_TYPE
+) -> Optional[PlayJournal]:
+    game_id = decode_game_id(game_id)
+
+    return context.bot_data.get(GAME_JOURNALS_KEY, {}).get(game_id)
+
+
+def journal_add_player(
+    game: BaseBoard,
+    player: Player,
+    context: ContextTypes.DEFAULT_TYPE
+):
+    '''Grava no diário a entrada do jogador. Deve ser chamada dentro do
+    Lock da partida, depois que o game.add_player retornar, para que uma
+    ação que levantou um erro não seja gravada.
+    '''
+
+    journal = get_game_journal(game_id=game.id, context=context)
+    if journal is not None:
+        journal.append_add_player(player=player)
+
+
+def journal_start(game: BaseBoard, context: ContextTypes.DEFAULT_TYPE):
+    '''Grava no diário o início da partida. Deve ser chamada dentro do
+    Lock da partida, depois que o game.start retornar.
+    '''
+
+    journal = get_game_journal(game_id=game.id, context=context)
+    if journal is not None:
+        journal.append_start()
+
+
+def play_and_journal(
+    game: BaseBoard,
+    player: Player,
+    play_dict: dict,
+    context: ContextTypes.DEFAULT_TYPE
+) -> Optional[str]:
+    '''Aplica a jogada e a grava no diário depois que o game.play
+    retornar. Se o game.play levantar um erro, a jogada não é gravada.
+    Retorna a resposta do game.play. Deve ser chamada dentro do Lock da
+    partida.
+
+    As jogadas recusadas pelo game.play (ex: fora da vez) também são
+    gravadas, pois adicionam um registro ao log da partida (ver
+    bot.games.journal).
+    '''
+
+    journal = get_game_journal(game_id=game.id, context=context)
+    if journal is None:
+        return game.play(player=player, play_dict=play_dict)
+
+    # O índice do jogador é o da player_list antes da jogada.
+    play_entry = journal.encode_play(
+        board=game,
+        player=player,
+        play_dict=play_dict,
+    )
+    play_response = game.play(player=player, play_dict=play_dict)
+    journal.append_encoded_play(play_entry)
+
+    return play_response
+
+
+def get_game_lock(
+    game_id: Union[int, str],
+    context: ContextTypes.DEFAULT_TYPE
+) -> asyncio.Lock:
+    '''Retorna o Lock da partida. Com o processamento concorrente de
+    updates, as ações que alteram a partida (play, start, add_player)
+    devem ser executadas dentro desse Lock para manter a ordem das jogadas.
+    Os handlers devem usar o acquire_game_lock, que descarta o Lock quando
+    a partida é removida.
+    '''
+
+    game_id = decode_game_id(game_id)
+
+    lock_dict: Dict[int, asyncio.Lock] = context.bot_data.setdefault(
+        GAME_LOCKS_KEY, {}
+    )
+    if game_id not in lock_dict:
+        lock_dict[game_id] = asyncio.Lock()
+
+    return lock_dict[game_id]
+
+
+def release_game_lock(
+    game_id: Union[int, str],
+    context: ContextTypes.DEFAULT_TYPE
+):
+    '''Descarta o Lock de uma partida removida. O Lock é mantido enquanto
+    estiver em uso ou se a partida ainda estiver no GameRegistry.
+    '''
+
+    game_id = decode_game_id(game_id)
+    lock_dict = context.bot_data.get(GAME_LOCKS_KEY, {})
+    lock = lock_dict.get(game_id)
+    if lock is None or lock.locked():
+        return
+    if game_id in get_game_registry(context=context):
+        return
+
+    lock_dict.pop(game_id)
+
+
+@asynccontextmanager
+async def acquire_game_lock(
+    game_id: Union[int, str],
+    context: ContextTypes.DEFAULT_TYPE
+) -> AsyncIterator[asyncio.Lock]:
+    '''Executa o bloco dentro do Lock da partida e, ao liberá-lo,
+    descarta o Lock se a partida tiver sido removida.
+
+    Quem aguardava o Lock descartado ainda o recebe, por isso o bloco deve
+    verificar, com o is_game_removed, se a partida ainda existe.
+    '''
+
+    lock = get_game_lock(game_id=game_id, context=context)
+    try:
+        async with lock:
+            yield lock
+    finally:
+        release_game_lock(game_id=game_id, context=context)
+
+
+def apply_play(
+    game: BaseBoard,
+    player: Player,
+    play_dict: dict,
+    context: ContextTypes.DEFAULT_TYPE
+) -> Optional[str]:
+    '''Aplica a jogada, grava a jogada no diário e agenda a gravação da
+    partida. Retorna a resposta do game.play ou None se a partida foi
+    removida. Deve ser chamada dentro do Lock da partida (ver GameActor).
+    '''
+
+    if is_game_removed(game=game, context=context):
+        logging.info(
+            f'APPLY_PLAY(): Partida {game.id} foi removida, '
+            f'jogada ignorada.'
+        )
+        return None
+
+    play_response = play_and_journal(
+        game=game,
+        player=player,
+        play_dict=play_dict,
+        context=context,
+    )
+    save_game(game=game, context=context)
+
+    return play_response
+
+
+def get_game_actor(
+    game: BaseBoard,
+    context: ContextTypes.DEFAULT_TYPE
+) -> GameActor:
+    '''Retorna o GameActor da partida, criando-o se necessário.
+
+    O actor aplica as jogadas (apply_play) em ordem, dentro do Lock da
+    partida, e atualiza as mensagens de todos os jogadores uma vez para
+    todas as jogadas e renderizações pedidas (request_game_render) em até
+    UPDATE_COALESCE_TIME segundos ou durante o envio da atualização
+    anterior.
+    '''
+
+    actor_dict: Dict[int, GameActor] = context.bot_data.setdefault(
+        GAME_ACTORS_KEY, {}
+    )
+    actor = actor_dict.get(game.id)
+    if actor is None:
+        actor = GameActor(
+            game_id=game.id,
+            apply_function=lambda item: apply_play(
+                game=game,
+                player=item[0],
+                play_dict=item[1],
+                context=context,
+            ),
+            render_function=lambda: update_all_player_messages(
+                function_caller='GAME_ACTOR()',
+                game=game,
+                context=context,
+            ),
+            lock=get_game_lock(game_id=game.id, context=context),
+            render_delay=UPDATE_COALESCE_TIME,
+        )
+        actor_dict[game.id] = actor
+
+    return actor
+
+
+async def submit_play(
+    game: BaseBoard,
+    player: Player,
+    play_dict: dict,
+    context: ContextTypes.DEFAULT_TYPE
+) -> Optional[str]:
+    '''Coloca a jogada na fila do GameActor da partida e retorna a resposta
+    do game.play depois que ela for aplicada. As mensagens dos jogadores
+    são atualizadas em segundo plano pelo actor.
+
+    Retorna None, sem criar um novo actor, se a partida foi removida.
+    '''
+
+    if is_game_removed(game=game, context=context):
+        return None
+
+    actor = get_game_actor(game=game, context=context)
+
+    return await actor.submit((player, play_dict))
+
+
+def request_game_render(
+    game: BaseBoard,
+    context: ContextTypes.DEFAULT_TYPE
+):
+    '''Pede ao GameActor da partida a atualização das mensagens de todos os
+    jogadores depois de uma alteração feita fora dele (ex: select, invite e
+    start). A atualização é feita em segundo plano, junto com a das
+    jogadas. Não faz nada se a partida foi removida.
+    '''
+
+    if is_game_removed(game=game, context=context):
+        return
+
+    actor = get_game_actor(game=game, context=context)
+    actor.request_render()
+
+
+def stop_game_actor(
+    game_id: Union[int, str],
+    context: ContextTypes.DEFAULT_TYPE
+):
+    game_id = decode_game_id(game_id)
+    actor = context.bot_data.get(GAME_ACTORS_KEY, {}).pop(game_id, None)
+    if actor is not None:
+        actor.stop()
+
+
+def get_game_actor_stats(
+    context: ContextTypes.DEFAULT_TYPE
+) -> Dict[int, Dict[str, float]]:
+    '''Retorna as estatísticas (tamanho da fila e tempo de processamento)
+    do GameActor de cada partida.
+    '''
+
+    actor_dict = context.bot_data.get(GAME_ACTORS_KEY, {})
+
+    return {
+        game_id: actor.get_stats()
+        for game_id, actor in actor_dict.items()
+    }
+
+
+async def sweep_games(context: ContextTypes.DEFAULT_TYPE):
+    '''Job do job_queue que remove as partidas abandonadas (sem atividade
+    há GAME_IDLE_TTL segundos) e as terminadas (há GAME_FINISHED_TTL
+    segundos), liberando os caches da partida com o remove_game.
+
+    Os jogadores das partidas abandonadas são avisados. As mensagens das
+    partidas terminadas não são alteradas para manter o resultado final.
+    '''
+
+    registry = get_game_registry(context=context)
+    for game, reason in registry.get_expired_games():
+        if game.id not in registry:
+            continue
+        async with acquire_game_lock(game_id=game.id, context=context):
+            # A partida pode ter recebido uma jogada enquanto o Lock era
+            # aguardado.
+            reason = registry.get_expiration_reason(game_id=game.id)
+            if reason is None:
+                continue
+            remove_game(game_id=game.id, context=context)
+
+        registry.add_eviction(reason=reason)
+        logging.info(
+            f'SWEEP_GAMES(): Partida {game.id} removida ({reason}). '
+            f'{registry.get_stats()}'
+        )
+        if reason == EVICTION_REASON_IDLE:
+            await notify_evicted_game(game=game, context=context)
+
+
+async def notify_evicted_game(
+    game: BaseBoard,
+    context: ContextTypes.DEFAULT_TYPE
+):
+    '''Avisa os jogadores de uma partida removida por inatividade. Os
+    erros do Telegram de um jogador (ex: Forbidden quando ele bloqueou o
+    bot ou BadRequest quando a mensagem foi apagada) são apenas
+    registrados, para não interromper o aviso dos outros jogadores nem o
+    sweep_games.
+    '''
+
+    function_caller = 'NOTIFY_EVICTED_GAME()'
+    text = (
+        f'Jogo {game.DISPLAY_NAME} ({game.short_id}) foi encerrado por '
+        f'inatividade.'
+    )
+    if callable(game.play_text_formatter):
+        text = game.play_text_formatter(text)
+
+    for player in game.player_list:
+        if player.message_id is None:
+            continue
+
+        user_id = player.user_id
+        try:
+            await edit_message_text(
+                function_caller=function_caller,
+                new_text=text,
+                context=context,
+                message_id=player.message_id,
+                chat_id=user_id,
+                user_id=user_id,
+            )
+        except TelegramError as error:
+            logging.warning(
+                f'{function_caller}: Não foi possível avisar {player} da '
+                f'partida {game.id}: {error!r}'
+            )
+
+
+async def flush_game_store(context: ContextTypes.DEFAULT_TYPE):
+    '''Job do job_queue que grava as partidas alteradas no MongoDB.
+    '''
 
-    game_dict = context.bot_data.get('games', {})
-    game_dict.pop(game_id, None)
+    store = get_game_store(context=context)
+    if store is not None:
+        await store.flush()
@@ -0,0 +1,222 @@
+import asyncio
+import logging
+
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from decouple import config
+
+
+# Número máximo de jogadas aplicadas antes de uma renderização.
+GAME_ACTOR_BATCH_SIZE = config('GAME_ACTOR_BATCH_SIZE', default=32, cast=int)
+
+
+class GameActor:
+    '''Fila de jogadas de uma partida processada por uma única task (worker).
+
+    O worker retira da fila todas as jogadas pendentes (até max_batch_size)
+    e aplica cada uma, em ordem, com o apply_function dentro do lock. Depois
+    de cada lote, a partida é marcada para renderização: uma segunda task
+    aguarda render_delay segundos e chama o render_function, uma de cada
+    vez, então as mensagens da partida saem sempre em ordem e as jogadas
+    aplicadas durante a espera ou o envio são agrupadas em uma única
+    renderização. Cada partida tem as suas próprias tasks, então uma
+    partida lenta só atrasa a própria fila.
+
+    O submit retorna o resultado do apply_function assim que a jogada é
+    aplicada, sem aguardar a renderização.
+    '''
+
+    def __init__(
+        self,
+        game_id: int,
+        apply_function: Callable[[Any], Any],
+        render_function: Callable[[], Awaitable],
+        lock: Optional[asyncio.Lock] = None,
+        max_batch_size: int = GAME_ACTOR_BATCH_SIZE,
+        render_delay: float = 0,
+    ):
+        if max_batch_size < 1:
+            raise ValueError(
+                f'max_batch_size precisa ser maior que 0 ({max_batch_size}).'
+            )
+
+        self.game_id = game_id
+        self.apply_function = apply_function
+        self.render_function = render_function
+        self.lock = lock if lock is not None else asyncio.Lock()
+        self.max_batch_size = max_batch_size
+        self.render_delay = render_delay
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.task: Optional[asyncio.Task] = None
+        self.render_task: Optional[asyncio.Task] = None
+        self.is_dirty = False
+        self.total_items = 0
+        self.total_batches = 0
+        self.total_renders = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.render_max_time = 0.0
+        self.max_depth = 0
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'game_id={self.game_id}, '
+            f'depth={self.depth}, '
+            f'total_items={self.total_items}, '
+            f'total_renders={self.total_renders})'
+        )
+
+    def __len__(self) -> int:
+        return self.depth
+
+    @property
+    def depth(self) -> int:
+        '''Número de jogadas aguardando na fila.
+        '''
+
+        return self.queue.qsize()
+
+    @property
+    def is_running(self) -> bool:
+        return self.task is not None and not self.task.done()
+
+    @property
+    def is_rendering(self) -> bool:
+        return self.render_task is not None and not self.render_task.done()
+
+    async def submit(self, item: Any) -> Any:
+        '''Coloca a jogada na fila e retorna o resultado do apply_function
+        depois que ela for aplicada. Se o apply_function levantar um erro,
+        o erro é levantado aqui. Se o actor for parado antes da jogada ser
+        aplicada, retorna None.
+        '''
+
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((item, future))
+        self.max_depth = max(self.max_depth, self.depth)
+        if not self.is_running:
+            self.task = asyncio.create_task(self.run())
+
+        return await future
+
+    def get_batch(self, first_item: Tuple[Any, asyncio.Future]) -> list:
+        item_list = [first_item]
+        while len(item_list) < self.max_batch_size and not self.queue.empty():
+            item_list.append(self.queue.get_nowait())
+
+        return item_list
+
+    async def run(self):
+        '''Loop do worker. Roda até ser cancelado pelo stop.
+        '''
+
+        while True:
+            item_list = self.get_batch(await self.queue.get())
+            start = perf_counter()
+            try:
+                await self.process_batch(item_list)
+            finally:
+                for _, future in item_list:
+                    # Jogadas não aplicadas porque o worker foi cancelado.
+                    if not future.done():
+                        future.set_result(None)
+                    self.queue.task_done()
+
+            batch_time = perf_counter() - start
+            self.total_items += len(item_list)
+            self.total_batches += 1
+            self.total_time += batch_time
+            self.max_time = max(self.max_time, batch_time)
+            self.request_render()
+
+    async def process_batch(
+        self,
+        item_list: List[Tuple[Any, asyncio.Future]]
+    ):
+        async with self.lock:
+            for item, future in item_list:
+                try:
+                    result = self.apply_function(item)
+                except Exception as error:
+                    if not future.done():
+                        future.set_exception(error)
+                    continue
+
+                # O handler que enviou a jogada pode ter sido cancelado.
+                if not future.done():
+                    future.set_result(result)
+
+    def request_render(self):
+        '''Marca a partida para renderização. Se já houver uma
+        renderização em andamento, a partida é renderizada de novo quando
+        ela terminar.
+        '''
+
+        self.is_dirty = True
+        if not self.is_rendering:
+            self.render_task = asyncio.create_task(self.run_render())
+
+    async def run_render(self):
+        while self.is_dirty:
+            await asyncio.sleep(max(self.render_delay, 0))
+            self.is_dirty = False
+            start = perf_counter()
+            try:
+                await self.render_function()
+            except Exception as error:
+                # Ninguém aguarda a renderização, então o erro é apenas
+                # registrado.
+                logging.exception(
+                    f'GAME_ACTOR(): Erro ao renderizar a partida '
+                    f'{self.game_id}: {error!r}'
+                )
+
+            self.total_renders += 1
+            self.render_max_time = max(
+                self.render_max_time,
+                perf_counter() - start,
+            )
+
+    async def join(self):
+        '''Aguarda a fila esvaziar e as renderizações pendentes terminarem.
+        '''
+
+        await self.queue.join()
+        while self.is_rendering:
+            await asyncio.shield(self.render_task)
+
+    def stop(self):
+        '''Cancela o worker, a renderização pendente e as jogadas que
+        ainda estão na fila.
+        '''
+
+        for task in (self.task, self.render_task):
+            if task is not None:
+                task.cancel()
+        self.task = None
+        self.render_task = None
+        self.is_dirty = False
+
+        while not self.queue.empty():
+            _, future = self.queue.get_nowait()
+            if not future.done():
+                future.set_result(None)
+            self.queue.task_done()
+
+    def get_stats(self) -> Dict[str, float]:
+        return {
+            'depth': self.depth,
+            'max_depth': self.max_depth,
+            'items': self.total_items,
+            'batches': self.total_batches,
+            'renders': self.total_renders,
+            'total_time': self.total_time,
+            'max_time': self.max_time,
+            'mean_time': (
+                self.total_time / self.total_batches
+                if self.total_batches else 0.0
+            ),
+            'render_max_time': self.render_max_time,
+        }
@@ -0,0 +1,126 @@
+from collections import Counter
+from time import monotonic
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from bot.games.boards.board import BaseBoard
+
+
+GAME_REGISTRY_KEY = 'games'
+EVICTION_REASON_IDLE = 'idle'
+EVICTION_REASON_FINISHED = 'finished'
+
+
+class GameRegistry:
+    '''Guarda as partidas em andamento e o horário da última atividade de
+    cada uma.
+
+    As partidas sem atividade há mais de idle_ttl segundos ou terminadas
+    há mais de finished_ttl segundos são retornadas por
+    get_expired_games para serem removidas (ver sweep_games).
+    '''
+
+    def __init__(
+        self,
+        idle_ttl: float,
+        finished_ttl: float,
+        time_function: Callable[[], float] = monotonic,
+    ):
+        self.idle_ttl = idle_ttl
+        self.finished_ttl = finished_ttl
+        self.time_function = time_function
+        self.game_dict: Dict[int, BaseBoard] = {}
+        self.last_activity_dict: Dict[int, float] = {}
+        self.evicted_counter = Counter()
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'live_count={self.live_count}, '
+            f'evicted_count={self.evicted_count})'
+        )
+
+    def __len__(self) -> int:
+        return len(self.game_dict)
+
+    def __contains__(self, game_id: int) -> bool:
+        return game_id in self.game_dict
+
+    def __iter__(self) -> Iterator[BaseBoard]:
+        return iter(list(self.game_dict.values()))
+
+    def add(self, game: BaseBoard):
+        self.game_dict[game.id] = game
+        self.touch(game_id=game.id)
+
+    def get(self, game_id: int, touch: bool = True) -> Optional[BaseBoard]:
+        game = self.game_dict.get(game_id)
+        if game is not None and touch is True:
+            self.touch(game_id=game_id)
+
+        return game
+
+    def remove(self, game_id: int) -> Optional[BaseBoard]:
+        self.last_activity_dict.pop(game_id, None)
+
+        return self.game_dict.pop(game_id, None)
+
+    def touch(self, game_id: int):
+        '''Atualiza o horário da última atividade da partida.
+        '''
+
+        if game_id in self.game_dict:
+            self.last_activity_dict[game_id] = self.time_function()
+
+    def get_idle_time(self, game_id: int) -> float:
+        last_activity = self.last_activity_dict.get(game_id)
+        if last_activity is None:
+            return 0.0
+
+        return self.time_function() - last_activity
+
+    def get_expiration_reason(self, game_id: int) -> Optional[str]:
+        '''Retorna o motivo da remoção da partida ou None se ela ainda não
+        expirou.
+        '''
+
+        game = self.game_dict.get(game_id)
+        if game is None:
+            return None
+
+        idle_time = self.get_idle_time(game_id=game_id)
+        if game.game_over and idle_time >= self.finished_ttl:
+            return EVICTION_REASON_FINISHED
+        if idle_time >= self.idle_ttl:
+            return EVICTION_REASON_IDLE
+
+        return None
+
+    def get_expired_games(self) -> List[Tuple[BaseBoard, str]]:
+        expired_game_list = []
+        for game_id, game in list(self.game_dict.items()):
+            reason = self.get_expiration_reason(game_id=game_id)
+            if reason is not None:
+                expired_game_list.append((game, reason))
+
+        return expired_game_list
+
+    def add_eviction(self, reason: str):
+        self.evicted_counter[reason] += 1
+
+    @property
+    def live_count(self) -> int:
+        return len(self.game_dict)
+
+    @property
+    def evicted_count(self) -> int:
+        return sum(self.evicted_counter.values())
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            'live': self.live_count,
+            'evicted': self.evicted_count,
+            **{
+                f'evicted_{reason}': total
+                for reason, total in self.evicted_counter.items()
+            },
+        }
@@ -0,0 +1,286 @@
+import asyncio
+import logging
+
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from bson import Binary
+from decouple import config
+from pymongo import DeleteOne, MongoClient, ReplaceOne
+from pymongo.collection import Collection
+
+from bot.games.boards import snapshot_board_factory
+from bot.games.boards.board import BaseBoard
+from bot.games.journal import PlayJournal
+
+
+# Intervalo (segundos) entre as gravações em lote no MongoDB.
+GAME_STORE_FLUSH_INTERVAL = config(
+    'GAME_STORE_FLUSH_INTERVAL', default=2, cast=float
+)
+GAME_STORE_BATCH_SIZE = config('GAME_STORE_BATCH_SIZE', default=100, cast=int)
+GAME_STORE_MAX_WORKERS = config('GAME_STORE_MAX_WORKERS', default=2, cast=int)
+
+
+def dump_game(game: BaseBoard) -> bytes:
+    return game.to_snapshot()
+
+
+def load_game_data(data: bytes) -> BaseBoard:
+    return snapshot_board_factory(bytes(data))
+
+
+class MongoGameStore:
+    '''Guarda as partidas no MongoDB usando write-behind.
+
+    As partidas continuam na memória (GameRegistry) e as alteradas são
+    marcadas com mark_dirty. O flush serializa essas partidas no event
+    loop (sem await no meio, então o estado gravado é consistente) e
+    envia as gravações em lotes de batch_size para o MongoDB em uma
+    thread do executor, assim o event loop nunca espera pelo banco.
+
+    O diário da partida (PlayJournal), quando existir, é gravado no mesmo
+    documento do snapshot, então os dois sempre correspondem ao mesmo
+    estado da partida.
+
+    Depois de reiniciar o bot, as partidas são carregadas com
+    load_with_journal na primeira vez que forem usadas (ver
+    bot.functions.game.load_game).
+    '''
+
+    def __init__(
+        self,
+        collection: Collection,
+        batch_size: int = GAME_STORE_BATCH_SIZE,
+        max_workers: int = GAME_STORE_MAX_WORKERS,
+        dump_function: Callable[[BaseBoard], bytes] = dump_game,
+        load_function: Callable[[bytes], BaseBoard] = load_game_data,
+    ):
+        if batch_size < 1:
+            raise ValueError(
+                f'batch_size precisa ser maior que 0 ({batch_size}).'
+            )
+
+        self.collection = collection
+        self.batch_size = batch_size
+        self.dump_function = dump_function
+        self.load_function = load_function
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='game_store',
+        )
+        self.dirty_game_dict: Dict[
+            int, Tuple[BaseBoard, Optional[PlayJournal]]
+        ] = {}
+        self.removed_game_id_set: Set[int] = set()
+        self.flush_lock = asyncio.Lock()
+        self.counter = Counter()
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'collection={self.collection.name}, '
+            f'dirty={len(self.dirty_game_dict)}, '
+            f'removed={len(self.removed_game_id_set)}, '
+            f'counter={dict(self.counter)})'
+        )
+
+    def mark_dirty(
+        self,
+        game: BaseBoard,
+        journal: Optional[PlayJournal] = None
+    ):
+        '''Agenda a gravação da partida e do diário dela no próximo flush.
+        '''
+
+        self.removed_game_id_set.discard(game.id)
+        self.dirty_game_dict[game.id] = (game, journal)
+
+    def mark_removed(self, game_id: int):
+        '''Agenda a remoção da partida no próximo flush.
+        '''
+
+        self.dirty_game_dict.pop(game_id, None)
+        self.removed_game_id_set.add(game_id)
+
+    async def run_in_executor(self, function: Callable, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(
+            self.executor,
+            partial(function, *args, **kwargs)
+        )
+
+    def make_document(
+        self,
+        game: BaseBoard,
+        journal: Optional[PlayJournal],
+        updated_at: datetime,
+    ) -> dict:
+        document = {
+            '_id': game.id,
+            'board': game.__class__.__name__,
+            'data': Binary(self.dump_function(game)),
+            'updated_at': updated_at,
+        }
+        if journal is not None:
+            document['journal'] = Binary(journal.to_bytes())
+
+        return document
+
+    def make_operations(
+        self,
+        dirty_game_dict: Dict[int, Tuple[BaseBoard, Optional[PlayJournal]]],
+        removed_game_id_set: Set[int],
+    ) -> List[Any]:
+        updated_at = datetime.now(timezone.utc)
+        operation_list = [
+            ReplaceOne(
+                {'_id': game_id},
+                self.make_document(
+                    game=game,
+                    journal=journal,
+                    updated_at=updated_at,
+                ),
+                upsert=True,
+            )
+            for game_id, (game, journal) in dirty_game_dict.items()
+        ]
+        operation_list.extend(
+            DeleteOne({'_id': game_id})
+            for game_id in removed_game_id_set
+        )
+
+        return operation_list
+
+    async def flush(self) -> int:
+        '''Grava no MongoDB as partidas alteradas e remove as partidas
+        encerradas. Retorna o número de operações enviadas.
+
+        Em caso de erro, as partidas voltam para a fila (a não ser que
+        tenham sido alteradas de novo) e são gravadas no próximo flush.
+        '''
+
+        async with self.flush_lock:
+            dirty_game_dict = self.dirty_game_dict
+            removed_game_id_set = self.removed_game_id_set
+            if not dirty_game_dict and not removed_game_id_set:
+                return 0
+
+            self.dirty_game_dict = {}
+            self.removed_game_id_set = set()
+            operation_list = self.make_operations(
+                dirty_game_dict=dirty_game_dict,
+                removed_game_id_set=removed_game_id_set,
+            )
+            try:
+                for index in range(0, len(operation_list), self.batch_size):
+                    await self.run_in_executor(
+                        self.collection.bulk_write,
+                        operation_list[index:index + self.batch_size],
+                        ordered=False,
+                    )
+                    self.counter['batches'] += 1
+            except Exception as error:
+                self.counter['errors'] += 1
+                logging.error(
+                    f'GAME_STORE_FLUSH(): Erro ao gravar '
+                    f'{len(operation_list)} operações: {error!r}'
+                )
+                self.requeue(
+                    dirty_game_dict=dirty_game_dict,
+                    removed_game_id_set=removed_game_id_set,
+                )
+                return 0
+
+            self.counter['writes'] += len(dirty_game_dict)
+            self.counter['deletes'] += len(removed_game_id_set)
+
+            return len(operation_list)
+
+    def requeue(
+        self,
+        dirty_game_dict: Dict[int, Tuple[BaseBoard, Optional[PlayJournal]]],
+        removed_game_id_set: Set[int],
+    ):
+        for game_id, dirty_game in dirty_game_dict.items():
+            if game_id not in self.removed_game_id_set:
+                self.dirty_game_dict.setdefault(game_id, dirty_game)
+        for game_id in removed_game_id_set:
+            if game_id not in self.dirty_game_dict:
+                self.removed_game_id_set.add(game_id)
+
+    async def load(self, game_id: int) -> Optional[BaseBoard]:
+        '''Carrega a partida do MongoDB. Retorna None se ela não existir ou
+        se estiver marcada para remoção.
+        '''
+
+        game, _ = await self.load_with_journal(game_id=game_id)
+
+        return game
+
+    async def load_with_journal(
+        self,
+        game_id: int
+    ) -> Tuple[Optional[BaseBoard], Optional[PlayJournal]]:
+        '''Carrega a partida e o diário dela do MongoDB. A partida é None
+        se ela não existir ou se estiver marcada para remoção e o diário é
+        None se ele não foi gravado ou não pôde ser lido.
+        '''
+
+        if game_id in self.removed_game_id_set:
+            return None, None
+
+        document = await self.run_in_executor(
+            self.collection.find_one,
+            {'_id': game_id},
+        )
+        if document is None:
+            return None, None
+
+        try:
+            game = self.load_function(document['data'])
+        except (TypeError, ValueError) as error:
+            self.counter['load_errors'] += 1
+            logging.error(
+                f'GAME_STORE_LOAD(): Partida {game_id} não pôde ser '
+                f'carregada: {error!r}'
+            )
+            return None, None
+
+        journal = None
+        journal_data = document.get('journal')
+        if journal_data is not None:
+            try:
+                journal = PlayJournal.from_bytes(bytes(journal_data))
+            except ValueError as error:
+                self.counter['load_errors'] += 1
+                logging.error(
+                    f'GAME_STORE_LOAD(): Diário da partida {game_id} não '
+                    f'pôde ser carregado: {error!r}'
+                )
+
+        self.counter['loads'] += 1
+
+        return game, journal
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+
+def create_mongo_game_store(
+    uri: str,
+    database: str,
+    collection: str,
+    **kwargs
+) -> MongoGameStore:
+    '''Cria o MongoGameStore. O MongoClient só se conecta ao banco na
+    primeira operação, que roda no executor do store.
+    '''
+
+    client = MongoClient(uri)
+
+    return MongoGameStore(collection=client[database][collection], **kwargs)
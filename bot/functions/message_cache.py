@@ -0,0 +1,74 @@
+from typing import Dict, Optional, Tuple, Union
+
+from telegram import InlineKeyboardMarkup
+from telegram.ext import ContextTypes
+
+
+MESSAGE_CACHE_KEY = 'message_cache'
+
+
+def get_message_hash(
+    text: str,
+    reply_markup: Optional[InlineKeyboardMarkup] = None
+) -> Tuple[int, int]:
+    '''Retorna uma tupla com o hash do texto e o hash do teclado de uma
+    mensagem.
+    '''
+
+    return hash(text), hash(reply_markup)
+
+
+def get_cached_message_hash(
+    game_id: Union[int, str],
+    player_id: str,
+    context: ContextTypes.DEFAULT_TYPE,
+) -> Optional[Tuple[int, int, int]]:
+    '''Retorna a tupla (message_id, hash do texto, hash do teclado) da última
+    mensagem enviada para o jogador na partida ou None caso não exista.
+    '''
+
+    cache_dict = context.bot_data.get(MESSAGE_CACHE_KEY, {})
+    game_cache_dict = cache_dict.get(game_id, {})
+
+    return game_cache_dict.get(player_id)
+
+
+def set_cached_message_hash(
+    game_id: Union[int, str],
+    player_id: str,
+    message_id: int,
+    message_hash: Tuple[int, int],
+    context: ContextTypes.DEFAULT_TYPE,
+):
+    '''Guarda o hash da última mensagem enviada para o jogador na partida.
+    '''
+
+    cache_dict: Dict[Union[int, str], dict] = context.bot_data.setdefault(
+        MESSAGE_CACHE_KEY, {}
+    )
+    game_cache_dict = cache_dict.setdefault(game_id, {})
+    game_cache_dict[player_id] = (message_id, *message_hash)
+
+
+def clear_cached_message_hash(
+    game_id: Union[int, str],
+    player_id: str,
+    context: ContextTypes.DEFAULT_TYPE,
+):
+    '''Remove o hash da mensagem do jogador na partida. Usado quando não
+    há como saber o conteúdo atual da mensagem (ex: edição adiada).
+    '''
+
+    cache_dict = context.bot_data.get(MESSAGE_CACHE_KEY, {})
+    cache_dict.get(game_id, {}).pop(player_id, None)
+
+
+def clear_game_message_cache(
+    game_id: Union[int, str],
+    context: ContextTypes.DEFAULT_TYPE,
+):
+    '''Remove os hashes das mensagens de uma partida.
+    '''
+
+    cache_dict = context.bot_data.get(MESSAGE_CACHE_KEY, {})
+    cache_dict.pop(game_id, None)
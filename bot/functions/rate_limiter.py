@@ -0,0 +1,321 @@
+import asyncio
+import logging
+
+from heapq import heappop, heappush
+from itertools import count
+from time import monotonic
+from typing import Dict, List, Optional, Tuple, Union
+
+from telegram.ext import ContextTypes
+
+from bot.functions.enums.priority import OutboxPriorityEnum
+
+
+RATE_LIMITER_KEY = 'rate_limiter'
+GLOBAL_RATE_LIMIT = 30  # Mensagens por segundo para todos os chats.
+CHAT_RATE_LIMIT = 1  # Mensagens por segundo em um chat privado.
+CHAT_BURST_LIMIT = 3
+GROUP_RATE_LIMIT = 20 / 60  # Mensagens por segundo em um grupo.
+GROUP_BURST_LIMIT = 3
+MAX_CHAT_BUCKETS = 1000
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        if rate <= 0:
+            raise ValueError(f'rate precisa ser maior que 0 ({rate}).')
+        if capacity < 1:
+            raise ValueError(
+                f'capacity precisa ser maior ou igual a 1 ({capacity}).'
+            )
+
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = monotonic()
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'rate={self.rate}, '
+            f'capacity={self.capacity}, '
+            f'tokens={self.tokens:.2f})'
+        )
+
+    def refill(self, now: float = None):
+        '''Adiciona os tokens gerados desde a última atualização.
+        '''
+
+        if now is None:
+            now = monotonic()
+
+        elapsed = max(now - self.updated_at, 0)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated_at = now
+
+    def get_wait_time(self, now: float = None) -> float:
+        '''Retorna quantos segundos faltam para haver um token disponível.
+        '''
+
+        self.refill(now)
+        if self.tokens >= 1:
+            return 0
+
+        return (1 - self.tokens) / self.rate
+
+    def consume(self):
+        self.tokens -= 1
+
+    @property
+    def is_full(self) -> bool:
+        self.refill()
+        return self.tokens >= self.capacity
+
+
+class OutboundRateLimiter:
+    '''Controla o envio de chamadas para a API do Telegram respeitando o
+    limite global e o limite de cada chat.
+
+    Quando o Telegram retorna RetryAfter para um chat, todos os envios
+    para esse chat ficam pausados até o fim do tempo informado (pause).
+
+    As chamadas são separadas em faixas de prioridade (OutboxPriorityEnum).
+    Quando há disputa pelo limite global, as chamadas prontas aguardam em
+    um heap ordenado por (prioridade, ordem de chegada), cada uma com um
+    Future. Um único timer (dispatch) acorda o início do heap quando o
+    limite global gera um novo token, então as chamadas em espera não
+    consultam o limiter periodicamente. Chamadas presas pelo limite do
+    próprio chat aguardam fora do heap e não bloqueiam as demais.
+    '''
+
+    def __init__(
+        self,
+        global_rate: float = GLOBAL_RATE_LIMIT,
+        chat_rate: float = CHAT_RATE_LIMIT,
+        chat_burst: float = CHAT_BURST_LIMIT,
+        group_rate: float = GROUP_RATE_LIMIT,
+        group_burst: float = GROUP_BURST_LIMIT,
+    ):
+        self.global_bucket = TokenBucket(
+            rate=global_rate,
+            capacity=global_rate
+        )
+        self.chat_rate = chat_rate
+        self.chat_burst = chat_burst
+        self.group_rate = group_rate
+        self.group_burst = group_burst
+        self.chat_buckets: Dict[str, TokenBucket] = {}
+        self.global_paused_until = 0.0
+        self.chat_paused_until: Dict[str, float] = {}
+        self.waiter_heap: List[Tuple[int, int, asyncio.Future]] = []
+        self.waiter_counter = count()
+        self.dispatch_handle: Optional[asyncio.TimerHandle] = None
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'global_bucket={self.global_bucket}, '
+            f'total_chats={len(self.chat_buckets)})'
+        )
+
+    def get_chat_bucket(self, chat_id: Union[int, str]) -> TokenBucket:
+        '''Retorna o TokenBucket do chat, criando um novo caso não exista.
+        Chats com ID negativo são grupos e usam um limite menor.
+        '''
+
+        chat_key = str(chat_id)
+        if chat_key not in self.chat_buckets:
+            if len(self.chat_buckets) >= MAX_CHAT_BUCKETS:
+                self.prune()
+            if chat_key.startswith('-'):
+                bucket = TokenBucket(
+                    rate=self.group_rate,
+                    capacity=self.group_burst
+                )
+            else:
+                bucket = TokenBucket(
+                    rate=self.chat_rate,
+                    capacity=self.chat_burst
+                )
+            self.chat_buckets[chat_key] = bucket
+
+        return self.chat_buckets[chat_key]
+
+    def get_global_wait_time(self, now: float = None) -> float:
+        '''Retorna quantos segundos faltam para que o limite global libere
+        uma chamada.
+        '''
+
+        if now is None:
+            now = monotonic()
+
+        return max(
+            self.global_paused_until - now,
+            self.global_bucket.get_wait_time(now),
+        )
+
+    def get_chat_wait_time(
+        self,
+        chat_id: Union[int, str] = None,
+        now: float = None
+    ) -> float:
+        '''Retorna quantos segundos faltam para que o limite do chat libere
+        uma chamada.
+        '''
+
+        if chat_id is None:
+            return 0
+        if now is None:
+            now = monotonic()
+
+        chat_key = str(chat_id)
+        chat_bucket = self.get_chat_bucket(chat_id)
+
+        return max(
+            self.chat_paused_until.get(chat_key, 0) - now,
+            chat_bucket.get_wait_time(now),
+        )
+
+    def get_wait_time(self, chat_id: Union[int, str] = None) -> float:
+        '''Retorna quantos segundos faltam para que uma chamada para o chat
+        possa ser enviada.
+        '''
+
+        now = monotonic()
+
+        return max(
+            self.get_global_wait_time(now),
+            self.get_chat_wait_time(chat_id, now),
+        )
+
+    async def acquire(
+        self,
+        chat_id: Union[int, str] = None,
+        priority: OutboxPriorityEnum = OutboxPriorityEnum.DEFAULT,
+    ):
+        '''Aguarda até que uma chamada para o chat possa ser enviada e
+        consome os tokens necessários.
+
+        Chamadas com maior prioridade (menor valor) são liberadas primeiro.
+        '''
+
+        while True:
+            chat_wait_time = self.get_chat_wait_time(chat_id)
+            if chat_wait_time > 0:
+                await asyncio.sleep(chat_wait_time)
+                continue
+
+            if not self.waiter_heap and self.get_global_wait_time() <= 0:
+                self.global_bucket.consume()
+            else:
+                await self.wait_global_token(priority=priority)
+
+            # O chat pode ter sido pausado enquanto a chamada aguardava o
+            # limite global. O token global já foi consumido.
+            chat_wait_time = self.get_chat_wait_time(chat_id)
+            if chat_wait_time > 0:
+                await asyncio.sleep(chat_wait_time)
+            break
+
+        if chat_id is not None:
+            self.get_chat_bucket(chat_id).consume()
+
+    async def wait_global_token(self, priority: OutboxPriorityEnum):
+        '''Coloca a chamada no heap e aguarda o dispatch consumir um token
+        global para ela.
+        '''
+
+        future = asyncio.get_running_loop().create_future()
+        heappush(
+            self.waiter_heap,
+            (int(priority), next(self.waiter_counter), future)
+        )
+        if self.dispatch_handle is None:
+            self.dispatch()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            # O token já consumido para a chamada cancelada é devolvido.
+            if future.done() and not future.cancelled():
+                self.global_bucket.tokens += 1
+                self.dispatch()
+            raise
+
+    def dispatch(self):
+        '''Libera as chamadas do início do heap enquanto houver tokens
+        globais e agenda a próxima execução para quando o próximo token for
+        gerado.
+        '''
+
+        if self.dispatch_handle is not None:
+            self.dispatch_handle.cancel()
+            self.dispatch_handle = None
+
+        while self.waiter_heap:
+            future = self.waiter_heap[0][2]
+            if future.done():
+                heappop(self.waiter_heap)
+                continue
+
+            global_wait_time = self.get_global_wait_time()
+            if global_wait_time > 0:
+                self.dispatch_handle = asyncio.get_running_loop().call_later(
+                    global_wait_time,
+                    self.dispatch,
+                )
+                return
+
+            heappop(self.waiter_heap)
+            self.global_bucket.consume()
+            future.set_result(None)
+
+    def pause(self, seconds: float, chat_id: Union[int, str] = None):
+        '''Pausa os envios para o chat por alguns segundos. Se chat_id for
+        None, pausa os envios para todos os chats.
+        '''
+
+        paused_until = monotonic() + seconds
+        if chat_id is None:
+            logging.info(
+                f'RATE_LIMITER: Pausando todos os chats ({seconds}s).'
+            )
+            self.global_paused_until = max(
+                self.global_paused_until,
+                paused_until
+            )
+        else:
+            chat_key = str(chat_id)
+            logging.info(
+                f'RATE_LIMITER: Pausando chat {chat_key} ({seconds}s).'
+            )
+            self.chat_paused_until[chat_key] = max(
+                self.chat_paused_until.get(chat_key, 0),
+                paused_until
+            )
+
+    def prune(self):
+        '''Remove os buckets e pausas dos chats que estão ociosos.
+        '''
+
+        now = monotonic()
+        for chat_key, bucket in list(self.chat_buckets.items()):
+            if bucket.is_full:
+                self.chat_buckets.pop(chat_key)
+        for chat_key, paused_until in list(self.chat_paused_until.items()):
+            if paused_until <= now:
+                self.chat_paused_until.pop(chat_key)
+
+
+def get_rate_limiter(
+    context: ContextTypes.DEFAULT_TYPE
+) -> OutboundRateLimiter:
+    '''Retorna o OutboundRateLimiter compartilhado por todo o bot.
+    '''
+
+    rate_limiter = context.bot_data.get(RATE_LIMITER_KEY)
+    if not isinstance(rate_limiter, OutboundRateLimiter):
+        rate_limiter = OutboundRateLimiter()
+        context.bot_data[RATE_LIMITER_KEY] = rate_limiter
+
+    return rate_limiter
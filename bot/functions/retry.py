@@ -0,0 +1,127 @@
+import asyncio
+import logging
+
+from random import uniform
+from typing import Dict, Union
+
+from telegram.error import RetryAfter, TimedOut
+from telegram.ext import ContextTypes
+
+from bot.functions.game_registry import GAME_REGISTRY_KEY
+from bot.games.game_id import decode_game_id
+
+
+RETRY_MAX_ATTEMPTS = 3
+RETRY_TIMED_OUT_TIME = 5
+RETRY_JITTER_TIME = 3
+RETRY_MAX_TIME = 60
+RETRY_CANCEL_EVENTS_KEY = 'retry_cancel_events'
+
+
+def get_retry_time(error: Union[RetryAfter, TimedOut], attempt: int) -> float:
+    '''Retorna o tempo de espera em segundos antes de uma nova tentativa.
+
+    O tempo cresce exponencialmente a cada tentativa (attempt começa em 0)
+    e recebe um jitter aleatório para que várias mensagens que falharam ao
+    mesmo tempo não sejam reenviadas todas juntas.
+    Para RetryAfter, o tempo nunca é menor que o retry_after do Telegram.
+    '''
+
+    backoff_time = min(RETRY_TIMED_OUT_TIME * 2 ** attempt, RETRY_MAX_TIME)
+    if isinstance(error, RetryAfter):
+        min_time = error.retry_after
+    else:
+        min_time = backoff_time
+    jitter_time = uniform(0, min(RETRY_JITTER_TIME * 2 ** attempt, min_time))
+
+    return min_time + jitter_time
+
+
+def is_retry_game_removed(
+    game_id: Union[int, str],
+    context: ContextTypes.DEFAULT_TYPE
+) -> bool:
+    '''Retorna True se a partida não está no GameRegistry, ou seja, se ela
+    foi removida (ou nunca existiu) e as novas tentativas dela não devem
+    ser feitas.
+    '''
+
+    registry = context.bot_data.get(GAME_REGISTRY_KEY)
+
+    return registry is None or decode_game_id(game_id) not in registry
+
+
+def get_retry_cancel_event(
+    game_id: Union[int, str],
+    context: ContextTypes.DEFAULT_TYPE
+) -> asyncio.Event:
+    '''Retorna o evento usado para cancelar as novas tentativas pendentes
+    de uma partida.
+    '''
+
+    event_dict: Dict[Union[int, str], asyncio.Event] = (
+        context.bot_data.setdefault(RETRY_CANCEL_EVENTS_KEY, {})
+    )
+    if game_id not in event_dict:
+        event_dict[game_id] = asyncio.Event()
+
+    return event_dict[game_id]
+
+
+async def wait_retry(
+    sleep_time: float,
+    context: ContextTypes.DEFAULT_TYPE,
+    game_id: Union[int, str] = None,
+) -> bool:
+    '''Aguarda sleep_time segundos sem bloquear o event loop.
+
+    Retorna True quando a espera termina e a nova tentativa pode ser feita.
+    Retorna False caso as tentativas da partida (game_id) tenham sido
+    canceladas durante a espera ou se a partida já foi removida. Nesse
+    último caso, nenhum evento é criado, já que o cancel_game_retries da
+    partida não será chamado de novo.
+    '''
+
+    if game_id is None:
+        await asyncio.sleep(sleep_time)
+        return True
+    if is_retry_game_removed(game_id=game_id, context=context):
+        return False
+
+    event = get_retry_cancel_event(game_id=game_id, context=context)
+    if event.is_set():
+        return False
+
+    try:
+        await asyncio.wait_for(event.wait(), timeout=sleep_time)
+    except asyncio.TimeoutError:
+        return True
+
+    return False
+
+
+def cancel_game_retries(
+    game_id: Union[int, str],
+    context: ContextTypes.DEFAULT_TYPE
+):
+    '''Cancela todas as novas tentativas pendentes de uma partida, tanto as
+    que estão aguardando no event loop quanto as agendadas em jobs.
+    '''
+
+    event_dict = context.bot_data.get(RETRY_CANCEL_EVENTS_KEY, {})
+    event = event_dict.pop(game_id, None)
+    if event is not None:
+        event.set()
+
+    job_queue = context.job_queue
+    if job_queue is None:
+        return
+
+    for job in job_queue.jobs():
+        job_data = job.data
+        if isinstance(job_data, dict) and job_data.get('game_id') == game_id:
+            logging.info(
+                f'CANCEL_GAME_RETRIES(): Removendo JOB "{job.name}" '
+                f'da partida {game_id}.'
+            )
+            job.schedule_removal()
@@ -7,6 +7,7 @@ from bot.games.boards.golf_solitaire_board import GolfSolitaireBoard
 from bot.games.boards.jokerjail_board import JokerJailBoard
 from bot.games.boards.nine_nine_board import NineNineBoard
 from bot.games.boards.scoundrel_board import ScoundrelBoard
+from bot.games.snapshot import get_snapshot_board_id
 
 
 def get_solo_board_list() -> List[Type[BaseBoard]]:
@@ -48,3 +49,15 @@ def board_factory(board_name: str) -> Type[BaseBoard]:
         if board_class.__name__ == board_name:
             return board_class
     raise ValueError(f'Board "{board_name}" não encontrada.')
+
+
+def snapshot_board_factory(data: bytes) -> BaseBoard:
+    '''Cria a partida a partir de um snapshot de qualquer board da
+    get_board_list.
+    '''
+
+    board_id = get_snapshot_board_id(data)
+    for board_class in get_board_list():
+        if board_class.SNAPSHOT_ID == board_id:
+            return board_class.from_snapshot(data)
+    raise ValueError(f'Board com SNAPSHOT_ID "{board_id}" não encontrada.')
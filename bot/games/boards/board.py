@@ -7,15 +7,23 @@ from telegram import InlineKeyboardMarkup
 
 from bot.games.constants.text import NORMAL_SECTION_HEAD_1, TEXT_SEPARATOR_1  # noqa
 from bot.games.enums.command import CallbackKeyEnum
+from bot.games.game_id import encode_game_id, new_game_id
+from bot.games.game_random import GameRandom
 from bot.games.log import Log
 from bot.games.play_keyboard import InviteKeyBoard, PlayKeyBoard
 from bot.games.player import Player
 from bot.games.report import Report
+from bot.games.snapshot import SnapshotReader, SnapshotWriter
 
 
 class BaseBoard(ABC):
     DISPLAY_NAME: str = None
     DESCRIPTION: str = None
+    # Identificador da board no snapshot. Não deve ser alterado depois que
+    # houver partidas gravadas.
+    SNAPSHOT_ID: int = None
+    # Verdadeiro enquanto a partida é criada pelo from_snapshot.
+    is_loading_snapshot: bool = False
 
     def __init__(
         self,
@@ -23,6 +31,7 @@ class BaseBoard(ABC):
         min_total_players: int = 1,
         max_total_players: int = 4,
         debug: bool = False,
+        seed: Optional[int] = None,
     ):
         if min_total_players > max_total_players:
             raise ValueError(
@@ -41,7 +50,12 @@ class BaseBoard(ABC):
                 f'Debug deve ser um booleano. (debug: {debug}[{type(debug)}]).'
             )
 
-        self.id = id(self)
+        # No from_snapshot o id é lido do snapshot, então nenhum id novo é
+        # gerado.
+        self.id = None if self.is_loading_snapshot else new_game_id()
+        # Random da partida, repassado para as pilhas e mãos. Se seed for
+        # None, a seed é sorteada.
+        self.random = GameRandom(seed)
         self.turn = 0
         self.turn_direction = 1
         self.current_player_index = 0
@@ -324,6 +338,92 @@ class BaseBoard(ABC):
 
         return output_text
 
+    def to_snapshot(self) -> bytes:
+        '''Retorna o estado da partida no formato binário do
+        bot.games.snapshot.
+
+        O teclado de convite e as funções formatadoras não fazem parte do
+        snapshot e precisam ser definidos novamente depois do from_snapshot.
+        '''
+
+        if self.SNAPSHOT_ID is None:
+            raise TypeError(
+                f'{self.__class__.__name__} não possui SNAPSHOT_ID.'
+            )
+
+        writer = SnapshotWriter(board_id=self.SNAPSHOT_ID)
+        writer.write_bool(self.debug)
+        self.write_snapshot(writer)
+
+        return writer.getvalue()
+
+    @classmethod
+    def from_snapshot(cls, data: bytes) -> 'BaseBoard':
+        '''Cria a partida a partir de um snapshot criado pelo to_snapshot.
+        Levanta ValueError se o snapshot for inválido ou de outra board.
+
+        A partida é criada com is_loading_snapshot, então o __init__ não gera
+        um novo id nem cria e embaralha o baralho, pois eles são lidos do
+        snapshot pelo read_snapshot.
+        '''
+
+        reader = SnapshotReader(data)
+        if cls.SNAPSHOT_ID is None or reader.board_id != cls.SNAPSHOT_ID:
+            raise ValueError(
+                f'Snapshot da board {reader.board_id} não pertence a '
+                f'{cls.__name__} ({cls.SNAPSHOT_ID}).'
+            )
+
+        board = cls.__new__(cls)
+        board.is_loading_snapshot = True
+        board.__init__(debug=reader.read_bool())
+        board.read_snapshot(reader)
+        reader.check_end()
+        board.is_loading_snapshot = False
+
+        return board
+
+    def write_snapshot(self, writer: SnapshotWriter):
+        '''Grava os atributos da partida no snapshot. As subclasses com
+        atributos próprios devem estender esse método e o read_snapshot
+        mantendo a mesma ordem.
+        '''
+
+        writer.write_uint(self.id)
+        writer.write_uint(self.random.seed_value)
+        writer.write_uint(self.random.state)
+        writer.write_int(self.turn)
+        writer.write_int(self.turn_direction)
+        writer.write_uint(self.current_player_index)
+        writer.write_bool(self.is_started)
+        writer.write_uint(len(self.player_list))
+        for player in self.player_list:
+            writer.write_player(player)
+        writer.write_uint(len(self.log.logs))
+        for report in self.log.logs:
+            writer.write_report(report, self.player_list)
+
+    def read_snapshot(self, reader: SnapshotReader):
+        '''Lê os atributos gravados pelo write_snapshot.
+        '''
+
+        self.id = reader.read_uint()
+        self.random.setstate((reader.read_uint(), reader.read_uint()))
+        self.turn = reader.read_int()
+        self.turn_direction = reader.read_int()
+        self.current_player_index = reader.read_uint()
+        self.is_started = reader.read_bool()
+        self.player_list = [
+            reader.read_player()
+            for _ in range(reader.read_uint())
+        ]
+        for player in self.player_list:
+            player.hand.set_random(self.random)
+        self.log.logs = [
+            reader.read_report(self.player_list)
+            for _ in range(reader.read_uint())
+        ]
+
     @abstractmethod
     def start(self):
         '''Perpara todas as variáveis para que o jogo possa iniciar.
@@ -368,6 +468,21 @@ class BaseBoard(ABC):
 
         ...
 
+    @property
+    def seed(self) -> int:
+        '''Retorna a seed do Random da partida.
+        '''
+
+        return self.random.seed_value
+
+    @property
+    def short_id(self) -> str:
+        '''Retorna o ID da partida em base 62, usado nos convites e nos
+        textos mostrados aos jogadores.
+        '''
+
+        return encode_game_id(self.id)
+
     @property
     def game_over(self) -> bool:
         '''Retorna True caso haja ao menos um vencedor.
@@ -410,5 +525,5 @@ class BaseBoard(ABC):
         '''
 
         return NORMAL_SECTION_HEAD_1.format(
-            f'Game - {self.DISPLAY_NAME}: {self.id}'
+            f'Game - {self.DISPLAY_NAME}: {self.short_id}'
         ) + '\n'
@@ -1,7 +1,7 @@
 import logging
 
 from abc import abstractmethod
-from typing import Callable, List
+from typing import Callable, List, Optional, Type
 
 from bot.games.boards.board import BaseBoard
 from bot.games.buttons.play_button import PlayButton
@@ -11,6 +11,7 @@ from bot.games.enums.command import CallbackKeyEnum, CommandEnum
 from bot.games.hands.hand import BaseHand
 from bot.games.play_keyboard import PlayKeyBoard
 from bot.games.player import Player
+from bot.games.snapshot import SnapshotReader, SnapshotWriter
 
 
 class BaseCardGameBoard(BaseBoard):
@@ -29,12 +30,14 @@ class BaseCardGameBoard(BaseBoard):
         min_total_players: int = 1,
         max_total_players: int = 4,
         debug: bool = False,
+        seed: Optional[int] = None,
     ):
         super().__init__(
             *players,
             min_total_players=min_total_players,
             max_total_players=max_total_players,
             debug=debug,
+            seed=seed,
         )
         if not isinstance(is_shuffle_deck, bool):
             raise TypeError('is_shuffle_deck precisa ser um booleano.')
@@ -75,14 +78,45 @@ class BaseCardGameBoard(BaseBoard):
             'is_passing',
         ])
 
+    # SNAPSHOT FUNCTIONS #####################################################
+    def write_snapshot(self, writer: SnapshotWriter):
+        super().write_snapshot(writer)
+        writer.write_cards(self.draw_pile.card_stack.items)
+        writer.write_uint(len(self.discard_piles))
+        for discard_pile in self.discard_piles:
+            writer.write_cards(discard_pile.card_stack.items)
+        writer.write_bool(self.is_passing)
+
+    def read_snapshot(self, reader: SnapshotReader):
+        super().read_snapshot(reader)
+        self.draw_pile.card_stack.items = reader.read_cards()
+        self.discard_piles = []
+        for _ in range(reader.read_uint()):
+            discard_pile = BaseDeck(is_shuffle=False, random=self.random)
+            discard_pile.card_stack.items = reader.read_cards()
+            self.discard_piles.append(discard_pile)
+        self.is_passing = reader.read_bool()
+
     # CREATE FUNCTIONS #######################################################
+    def new_draw_pile(self, deck_class: Type[BaseDeck]) -> BaseDeck:
+        '''Retorna o deck que será usado na Pilha de Compras.
+        No from_snapshot, as cartas são lidas do snapshot, então retorna uma
+        pilha vazia em vez de criar as cartas do deck_class.
+        '''
+
+        if self.is_loading_snapshot is True:
+            return BaseDeck(is_shuffle=False)
+
+        return deck_class(is_shuffle=False)
+
     def create_draw_pile(self, draw_pile: BaseDeck):
         '''Cria a Pilha de Compras.
         Embaralha a Pilha de Compras se self.is_shuffle_deck for True.
         '''
 
         self.draw_pile = draw_pile
-        if self.is_shuffle_deck is True:
+        self.draw_pile.set_random(self.random)
+        if self.is_shuffle_deck is True and self.is_loading_snapshot is False:
             self.draw_pile.shuffle()
 
     def create_hands(self):
@@ -90,7 +124,7 @@ class BaseCardGameBoard(BaseBoard):
         '''
 
         for player in self.player_list:
-            player_hand = BaseHand(**self.hand_kwargs)
+            player_hand = BaseHand(**self.hand_kwargs, random=self.random)
             player.set_hand(player_hand)
 
     def create_discard_pile(self):
@@ -98,7 +132,7 @@ class BaseCardGameBoard(BaseBoard):
         '''
 
         self.discard_piles = [
-            BaseDeck()
+            BaseDeck(is_shuffle=False, random=self.random)
             for _ in range(self.total_discard_pile)
         ]
 
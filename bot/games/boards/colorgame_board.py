@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from bot.games.boards.cardgame_board import BaseCardGameBoard
 from bot.games.buttons.play_button import PlayButton
 from bot.games.cards.card import Card
@@ -7,14 +7,21 @@ from bot.games.enums.card import WILD_SUITS, ColorNames, ColorSuits
 from bot.games.enums.command import CallbackKeyEnum, CommandEnum
 from bot.games.play_keyboard import PlayKeyBoard
 from bot.games.player import Player
+from bot.games.snapshot import SnapshotReader, SnapshotWriter
 
 
 class ColorsGameBoard(BaseCardGameBoard):
     DISPLAY_NAME: str = '🎨Colors'
     DESCRIPTION: str = 'DESCRIÇÃO E REGRAS DO COLORS PRECISAM SER DEFINIDAS.'
-
-    def __init__(self, *players: Player, debug: bool = False):
-        draw_pile = ColorDeck()
+    SNAPSHOT_ID: int = 1
+
+    def __init__(
+        self,
+        *players: Player,
+        debug: bool = False,
+        seed: Optional[int] = None,
+    ):
+        draw_pile = self.new_draw_pile(ColorDeck)
         super().__init__(
             draw_pile,
             *players,
@@ -26,6 +33,7 @@ class ColorsGameBoard(BaseCardGameBoard):
             min_total_players=2,
             max_total_players=4,
             debug=debug,
+            seed=seed,
         )
         self.pending_draw = 0
         self.selecting_color = False
@@ -49,6 +57,17 @@ class ColorsGameBoard(BaseCardGameBoard):
 
         return text
 
+    # SNAPSHOT FUNCTIONS #####################################################
+    def write_snapshot(self, writer: SnapshotWriter):
+        super().write_snapshot(writer)
+        writer.write_uint(self.pending_draw)
+        writer.write_bool(self.selecting_color)
+
+    def read_snapshot(self, reader: SnapshotReader):
+        super().read_snapshot(reader)
+        self.pending_draw = reader.read_uint()
+        self.selecting_color = reader.read_bool()
+
     # ABSTRACT METHODS #######################################################
     def player_keyboard(self, player: Player) -> PlayKeyBoard:
         if all((
@@ -164,27 +183,28 @@ class ColorsGameBoard(BaseCardGameBoard):
             self.next_turn(player=player, skip=False)
 
     def is_playable_card(self, card: Card) -> bool:
+        card_face = card.active_face
         for discard_pile in self.discard_piles:
             if discard_pile.is_empty:
                 return True
 
             peeked_card_list = discard_pile.peek()
-            top_card = peeked_card_list[0]
+            top_card_face = peeked_card_list[0].active_face
 
             # Testa o empilhamento de carta PLUS
             if self.pending_draw > 0:
                 if (
-                    card.plus_value > 0 and
-                    card.plus_value >= top_card.plus_value
+                    card_face.plus_value > 0 and
+                    card_face.plus_value >= top_card_face.plus_value
                 ):
                     return True
                 continue
 
             # Caso normal: tem que bater cor ou nome
             if (
-                card.suit == top_card.suit or
-                card.name == top_card.name or
-                card.is_wild
+                card_face.is_wild or
+                card_face.suit == top_card_face.suit or
+                card_face.name == top_card_face.name
             ):
                 return True
 
@@ -9,14 +9,21 @@ from bot.games.decks.royal import RoyalDeck
 from bot.games.enums.command import CallbackKeyEnum, CommandEnum
 from bot.games.play_keyboard import PlayKeyBoard
 from bot.games.player import Player
+from bot.games.snapshot import SnapshotReader, SnapshotWriter
 
 
 class GolfSolitaireBoard(BaseCardGameBoard):
     DISPLAY_NAME: str = "🏌️‍♂️Golf Solitaire"
     DESCRIPTION: str = ""
-
-    def __init__(self, *players: Player, debug: bool = False):
-        draw_pile = RoyalDeck()
+    SNAPSHOT_ID: int = 2
+
+    def __init__(
+        self,
+        *players: Player,
+        debug: bool = False,
+        seed: Optional[int] = None,
+    ):
+        draw_pile = self.new_draw_pile(RoyalDeck)
         super().__init__(
             draw_pile,
             *players,
@@ -28,12 +35,14 @@ class GolfSolitaireBoard(BaseCardGameBoard):
             min_total_players=1,
             max_total_players=1,
             debug=debug,
+            seed=seed,
         )
         self.enemy = Player(player_id="0000000000", name="Solitaire")
         self.num_rows = 5
         self.num_card_per_row = 7
         self.board: List[List[Card]] = []
-        self.create_board()
+        if self.is_loading_snapshot is False:
+            self.create_board()
 
         self.debug_attr_list.extend(
             [
@@ -211,6 +220,17 @@ class GolfSolitaireBoard(BaseCardGameBoard):
                 row.extend(card_list)
             self.board.append(row)
 
+    # SNAPSHOT FUNCTIONS #####################################################
+    def write_snapshot(self, writer: SnapshotWriter):
+        super().write_snapshot(writer)
+        writer.write_uint(len(self.board))
+        for row in self.board:
+            writer.write_cards(row)
+
+    def read_snapshot(self, reader: SnapshotReader):
+        super().read_snapshot(reader)
+        self.board = [reader.read_cards() for _ in range(reader.read_uint())]
+
     # ABSTRACT METHODS #######################################################
     def player_keyboard(self, player: Player) -> PlayKeyBoard:
         if self.is_started is not True:
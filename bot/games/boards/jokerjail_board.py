@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from bot.games.boards.cardgame_board import BaseCardGameBoard
 from bot.games.buttons.play_button import PlayButton
 from bot.games.cards.card import Card
@@ -8,6 +8,7 @@ from bot.games.enums.card import FullRoyalNames, FullRoyalSuits, RoyalNames
 from bot.games.enums.command import CallbackKeyEnum, CommandEnum
 from bot.games.play_keyboard import PlayKeyBoard
 from bot.games.player import Player
+from bot.games.snapshot import SnapshotReader, SnapshotWriter
 
 
 class JokerJailBoard(BaseCardGameBoard):
@@ -64,9 +65,15 @@ class JokerJailBoard(BaseCardGameBoard):
         '    - Use cartas do monte reserva só quando realmente necessário, '
         'pois elas adicionam obstáculos extras até serem removidas.'
     )
-
-    def __init__(self, *players: Player, debug: bool = False):
-        draw_pile = RoyalDeck()
+    SNAPSHOT_ID: int = 3
+
+    def __init__(
+        self,
+        *players: Player,
+        debug: bool = False,
+        seed: Optional[int] = None,
+    ):
+        draw_pile = self.new_draw_pile(RoyalDeck)
         super().__init__(
             draw_pile,
             *players,
@@ -78,6 +85,7 @@ class JokerJailBoard(BaseCardGameBoard):
             min_total_players=1,
             max_total_players=1,
             debug=debug,
+            seed=seed,
         )
         self.joker_card = Card(
             name=FullRoyalNames.JOKER,
@@ -135,7 +143,7 @@ class JokerJailBoard(BaseCardGameBoard):
 
     def create_discard_pile(self):
         self.discard_piles = [
-            BaseDeck()
+            BaseDeck(is_shuffle=False, random=self.random)
             for _ in range(self.total_discard_pile)
         ]
 
@@ -190,6 +198,17 @@ class JokerJailBoard(BaseCardGameBoard):
 
         return f'Cartas selecionadas: {selected_cards}'
 
+    # SNAPSHOT FUNCTIONS #####################################################
+    def write_snapshot(self, writer: SnapshotWriter):
+        super().write_snapshot(writer)
+        writer.write_uint_list(self.selected_card_indexes)
+        writer.write_bool(self.draw_from_empty_pile)
+
+    def read_snapshot(self, reader: SnapshotReader):
+        super().read_snapshot(reader)
+        self.selected_card_indexes = reader.read_uint_list()
+        self.draw_from_empty_pile = reader.read_bool()
+
     # ABSTRACT METHODS #######################################################
     def player_keyboard(self, player: Player) -> PlayKeyBoard:
         if self.is_started is not True:
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from bot.games.boards.cardgame_board import BaseCardGameBoard
 from bot.games.cards.card import Card
 from bot.games.decks.deck import BaseDeck
@@ -10,9 +12,15 @@ from bot.games.player import Player
 class NineNineBoard(BaseCardGameBoard):
     DISPLAY_NAME: str = "💯99"
     DESCRIPTION: str = ""
-
-    def __init__(self, *players: Player, debug: bool = False):
-        draw_pile = NineNineDeck()
+    SNAPSHOT_ID: int = 4
+
+    def __init__(
+        self,
+        *players: Player,
+        debug: bool = False,
+        seed: Optional[int] = None,
+    ):
+        draw_pile = self.new_draw_pile(NineNineDeck)
         super().__init__(
             draw_pile,
             *players,
@@ -24,6 +32,7 @@ class NineNineBoard(BaseCardGameBoard):
             min_total_players=2,
             max_total_players=10,
             debug=debug,
+            seed=seed,
         )
 
         self.debug_attr_list.extend([])
@@ -91,12 +100,10 @@ class NineNineBoard(BaseCardGameBoard):
 
     @property
     def total_score(self) -> int:
-        result = 0
         discard_pile = self.discard_pile
         if discard_pile:
-            for card in discard_pile:
-                result += card.value
-        return result
+            return discard_pile.total_value
+        return 0
 
     @property
     def current_player_has_4_nine_nine(self):
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from bot.games.boards.cardgame_board import BaseCardGameBoard
 from bot.games.cards.scoundrel import ScoundrelCard
 from bot.games.decks.deck import BaseDeck
@@ -7,6 +7,7 @@ from bot.games.enums.card import RoyalNames, RoyalSuits
 from bot.games.enums.command import CallbackKeyEnum, CommandEnum
 from bot.games.play_keyboard import PlayKeyBoard
 from bot.games.player import Player
+from bot.games.snapshot import SnapshotReader, SnapshotWriter
 
 
 class ScoundrelBoard(BaseCardGameBoard):
@@ -91,9 +92,15 @@ class ScoundrelBoard(BaseCardGameBoard):
         'derrotar todas as cartas de Inimigos da Masmorra (VITÓRIA).'
 
     )
-
-    def __init__(self, *players: Player, debug: bool = False):
-        draw_pile = ScoundrelDeck()
+    SNAPSHOT_ID: int = 5
+
+    def __init__(
+        self,
+        *players: Player,
+        debug: bool = False,
+        seed: Optional[int] = None,
+    ):
+        draw_pile = self.new_draw_pile(ScoundrelDeck)
         super().__init__(
             draw_pile,
             *players,
@@ -105,6 +112,7 @@ class ScoundrelBoard(BaseCardGameBoard):
             min_total_players=1,
             max_total_players=1,
             debug=debug,
+            seed=seed,
         )
         self.hp = 20
         self.max_hp = 20
@@ -223,6 +231,21 @@ class ScoundrelBoard(BaseCardGameBoard):
 
         return f'Campo: {text}'
 
+    # SNAPSHOT FUNCTIONS #####################################################
+    def write_snapshot(self, writer: SnapshotWriter):
+        super().write_snapshot(writer)
+        writer.write_int(self.hp)
+        writer.write_int(self.max_hp)
+        writer.write_bool(self.skipped_room)
+        writer.write_bool(self.healed_this_turn)
+
+    def read_snapshot(self, reader: SnapshotReader):
+        super().read_snapshot(reader)
+        self.hp = reader.read_int()
+        self.max_hp = reader.read_int()
+        self.skipped_room = reader.read_bool()
+        self.healed_this_turn = reader.read_bool()
+
     # ABSTRACT METHODS #######################################################
     def player_keyboard(self, player: Player) -> PlayKeyBoard:
         keyboard = super().player_keyboard(player=player)
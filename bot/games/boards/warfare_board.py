@@ -1,5 +1,6 @@
 import logging
 
+from typing import Optional
 from bot.games.boards.cardgame_board import BaseCardGameBoard
 from bot.games.decks.warfare import TerritoriesDeck
 from bot.games.player import Player
@@ -11,8 +12,13 @@ class WarfareBoard(BaseCardGameBoard):
     DISPLAY_NAME: str = "🌎Warfare"
     DESCRIPTION: str = "DESCRIÇÃO E REGRAS DO WARFARE PRECISAM SER DEFINIDAS."
 
-    def __init__(self, *players: Player, debug: bool = False):
-        draw_pile = TerritoriesDeck()
+    def __init__(
+        self,
+        *players: Player,
+        debug: bool = False,
+        seed: Optional[int] = None,
+    ):
+        draw_pile = self.new_draw_pile(TerritoriesDeck)
         super().__init__(
             draw_pile,
             *players,
@@ -24,4 +30,5 @@ class WarfareBoard(BaseCardGameBoard):
             min_total_players=3,
             max_total_players=6,
             debug=debug,
+            seed=seed,
         )
@@ -0,0 +1,219 @@
+'''Codec compacto usado no campo callback_data dos botões de jogada.
+
+Formato (versão 1):
+    "#" + VERSÃO + TAG DO COMANDO + CAMPOS
+
+Cada campo é um caractere com o índice da chave em CallbackKeyEnum seguido
+do valor. Inteiros são gravados como varint em base 62 (zigzag, para
+aceitar negativos) e strings como varint do tamanho seguido do texto.
+Chaves de valores string usam o índice + VARINT_BASE, assim o tipo do
+valor não ocupa um caractere a mais.
+
+Varint em base 62: os 31 primeiros caracteres do alfabeto são dígitos
+finais e os 31 últimos são dígitos que indicam que o número continua.
+'''
+
+import re
+
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, Union
+
+from bot.games.enums.command import CallbackKeyEnum, CommandEnum
+
+
+CALLBACK_CODEC_PREFIX = '#'
+CALLBACK_CODEC_VERSION = '1'
+CALLBACK_CODEC_HEADER = f'{CALLBACK_CODEC_PREFIX}{CALLBACK_CODEC_VERSION}'
+# Cabeçalho dos tokens criados pelo payload_store.
+CALLBACK_TOKEN_VERSION = 't'
+CALLBACK_TOKEN_HEADER = f'{CALLBACK_CODEC_PREFIX}{CALLBACK_TOKEN_VERSION}'
+CALLBACK_HEADER_LENGTH = len(CALLBACK_CODEC_HEADER)
+BASE62_ALPHABET = (
+    '0123456789'
+    'abcdefghijklmnopqrstuvwxyz'
+    'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+)
+VARINT_BASE = len(BASE62_ALPHABET) // 2
+FINAL_DIGITS = BASE62_ALPHABET[:VARINT_BASE]
+CONTINUATION_DIGITS = BASE62_ALPHABET[VARINT_BASE:VARINT_BASE * 2]
+
+# Tabelas pré-calculadas para que a decodificação seja feita por consulta
+# direta em dicionários.
+CHAR_TO_DIGIT: Dict[str, Tuple[int, bool]] = {
+    **{char: (index, False) for index, char in enumerate(FINAL_DIGITS)},
+    **{char: (index, True) for index, char in enumerate(CONTINUATION_DIGITS)},
+}
+CALLBACK_KEY_LIST = list(CallbackKeyEnum)
+COMMAND_LIST = list(CommandEnum)
+COMMAND_TO_TAG: Dict[CommandEnum, str] = {
+    command: BASE62_ALPHABET[index]
+    for index, command in enumerate(COMMAND_LIST)
+}
+# Aceita tanto o CommandEnum quanto o nome do comando.
+COMMAND_TO_TAG.update({
+    command.name: tag
+    for command, tag in list(COMMAND_TO_TAG.items())
+})
+TAG_TO_COMMAND_NAME: Dict[str, str] = {
+    tag: command.name
+    for command, tag in COMMAND_TO_TAG.items()
+    if isinstance(command, CommandEnum)
+}
+TAG_TO_COMMAND: Dict[str, CommandEnum] = {
+    tag: command
+    for command, tag in COMMAND_TO_TAG.items()
+    if isinstance(command, CommandEnum)
+}
+KEY_TO_INT_CHAR: Dict[CallbackKeyEnum, str] = {
+    key: BASE62_ALPHABET[index]
+    for index, key in enumerate(CALLBACK_KEY_LIST)
+}
+KEY_TO_STR_CHAR: Dict[CallbackKeyEnum, str] = {
+    key: BASE62_ALPHABET[index + VARINT_BASE]
+    for index, key in enumerate(CALLBACK_KEY_LIST)
+}
+CHAR_TO_KEY: Dict[str, Tuple[CallbackKeyEnum, type]] = {
+    **{char: (key, int) for key, char in KEY_TO_INT_CHAR.items()},
+    **{char: (key, str) for key, char in KEY_TO_STR_CHAR.items()},
+}
+
+
+@lru_cache(maxsize=1024)
+def encode_varint(number: int) -> str:
+    '''Codifica um inteiro (positivo ou negativo) em um varint base 62.
+    '''
+
+    number = number * 2 if number >= 0 else -number * 2 - 1
+    digits = []
+    while number >= VARINT_BASE:
+        number, digit = divmod(number, VARINT_BASE)
+        digits.append(CONTINUATION_DIGITS[digit])
+    digits.append(FINAL_DIGITS[number])
+
+    return ''.join(digits)
+
+
+def decode_varint(text: str, index: int) -> Tuple[int, int]:
+    '''Decodifica um varint base 62 que começa na posição index do texto.
+    Retorna o número e a posição seguinte ao varint.
+    '''
+
+    number = 0
+    multiplier = 1
+    while True:
+        digit, has_next = CHAR_TO_DIGIT[text[index]]
+        number += digit * multiplier
+        multiplier *= VARINT_BASE
+        index += 1
+        if not has_next:
+            break
+
+    number = number // 2 if number % 2 == 0 else -(number + 1) // 2
+
+    return number, index
+
+
+def get_command_enum(command: Union[CommandEnum, str]) -> CommandEnum:
+    if isinstance(command, str):
+        command = CommandEnum[command.upper()]
+    if not isinstance(command, CommandEnum):
+        raise TypeError(
+            'Command precisa ser uma instância de CommandEnum '
+            'ou uma striing válida de CommandEnum.'
+        )
+
+    return command
+
+
+def encode_callback_data(callback_data: dict) -> str:
+    '''Transforma um dicionário com chaves CallbackKeyEnum em uma string
+    compacta. A chave COMMAND é obrigatória e os valores das demais chaves
+    devem ser int ou str.
+    '''
+
+    command = callback_data[CallbackKeyEnum.COMMAND]
+    command_tag = COMMAND_TO_TAG.get(command)
+    if command_tag is None:
+        command_tag = COMMAND_TO_TAG[get_command_enum(command)]
+
+    items = [CALLBACK_CODEC_HEADER, command_tag]
+    for key, value in callback_data.items():
+        value_type = type(value)
+        if value_type is int:
+            items.append(KEY_TO_INT_CHAR[key])
+            items.append(encode_varint(value))
+        elif value_type is str:
+            if key is CallbackKeyEnum.COMMAND:
+                continue
+            items.append(KEY_TO_STR_CHAR[key])
+            items.append(encode_varint(len(value)))
+            items.append(value)
+        elif key is not CallbackKeyEnum.COMMAND:
+            raise TypeError(
+                f'O valor de {key} precisa ser int ou str '
+                f'({value}[{value_type}]).'
+            )
+
+    return ''.join(items)
+
+
+def decode_callback_data(text: str) -> dict:
+    '''Transforma de volta uma string criada por encode_callback_data em um
+    dicionário com chaves CallbackKeyEnum.
+    '''
+
+    if not text.startswith(CALLBACK_CODEC_HEADER):
+        raise ValueError(f'callback_data inválido: "{text}".')
+
+    try:
+        index = len(CALLBACK_CODEC_HEADER)
+        callback_data = {
+            CallbackKeyEnum.COMMAND: TAG_TO_COMMAND_NAME[text[index]]
+        }
+        index += 1
+        text_length = len(text)
+        while index < text_length:
+            key, value_type = CHAR_TO_KEY[text[index]]
+            value, index = decode_varint(text, index + 1)
+            if value_type is str:
+                end_index = index + value
+                if value < 0 or end_index > text_length:
+                    raise ValueError('Tamanho da string inválido.')
+                value = text[index:end_index]
+                index = end_index
+            callback_data[key] = value
+    except (KeyError, IndexError, ValueError) as error:
+        raise ValueError(
+            f'callback_data inválido: "{text}" ({error!r}).'
+        ) from error
+
+    return callback_data
+
+
+def get_callback_data_command(text: str) -> Optional[CommandEnum]:
+    '''Retorna o CommandEnum de um callback_data (ou de um token do
+    payload_store) lendo somente a tag do comando, sem decodificar os
+    campos. Retorna None se o texto não foi criado pelo codec.
+    '''
+
+    header = text[:CALLBACK_HEADER_LENGTH]
+    if header != CALLBACK_CODEC_HEADER and header != CALLBACK_TOKEN_HEADER:
+        return None
+
+    return TAG_TO_COMMAND.get(
+        text[CALLBACK_HEADER_LENGTH:CALLBACK_HEADER_LENGTH + 1]
+    )
+
+
+def get_callback_data_pattern(command: Union[CommandEnum, str]) -> str:
+    '''Retorna o pattern (regex) que identifica os callback_data de um
+    comando, inclusive os tokens do payload_store.
+    '''
+
+    command = get_command_enum(command)
+
+    return (
+        f'^{re.escape(CALLBACK_CODEC_PREFIX)}'
+        f'[{CALLBACK_CODEC_VERSION}{CALLBACK_TOKEN_VERSION}]'
+        f'{re.escape(COMMAND_TO_TAG[command])}'
+    )
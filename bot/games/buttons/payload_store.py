@@ -0,0 +1,211 @@
+'''Armazena no servidor os callback_data que não cabem no botão.
+
+O Telegram aceita no máximo 64 bytes no callback_data. Quando o texto
+criado pelo callback_codec passa de PAYLOAD_STORE_MIN_LENGTH bytes, ele é
+guardado em um CallbackPayloadStore e o botão recebe somente um token:
+    "#" + TOKEN_VERSION + TAG DO COMANDO + GAME_ID + TOKEN
+
+A tag do comando continua no token para que o roteamento
+(get_callback_data_command) não precise consultar o armazenamento.
+
+O CallbackPayloadStore do bot fica no bot_data (ver
+bot.functions.buttons.get_callback_payload_store). Os tokens são separados
+por partida, limitados por LRU a PAYLOAD_STORE_MAX_SIZE por partida e
+removidos com clear_game_payloads (chamado pelo remove_game). Os tokens não
+são salvos com a partida, então depois de reiniciar o bot os botões antigos
+com tokens levantam ExpiredPayloadError.
+'''
+
+import logging
+
+from collections import OrderedDict
+from itertools import count
+from typing import Dict, Iterator, Optional, Union
+
+from bot.games.buttons.callback_codec import (
+    CALLBACK_TOKEN_HEADER,
+    COMMAND_TO_TAG,
+    decode_callback_data,
+    decode_varint,
+    encode_callback_data,
+    encode_varint,
+    get_command_enum
+)
+from bot.games.enums.command import CallbackKeyEnum
+from bot.games.game_id import decode_game_id
+
+
+MAX_CALLBACK_DATA_LENGTH = 64
+PAYLOAD_STORE_MIN_LENGTH = MAX_CALLBACK_DATA_LENGTH
+PAYLOAD_STORE_MAX_SIZE = 256
+
+
+class ExpiredPayloadError(ValueError):
+    '''O token do callback_data é inválido ou foi descartado do
+    CallbackPayloadStore (ex: LRU, partida removida ou bot reiniciado).
+    '''
+
+
+class GamePayloads:
+    '''Tokens de uma partida em ordem de uso (LRU).
+    '''
+
+    def __init__(self):
+        self.token_to_payload: OrderedDict[int, str] = OrderedDict()
+        self.payload_to_token: Dict[str, int] = {}
+        self.token_counter: Iterator[int] = count()
+
+    def __len__(self) -> int:
+        return len(self.token_to_payload)
+
+
+class CallbackPayloadStore:
+    '''Guarda os callback_data longos por partida e devolve tokens curtos.
+
+    Um mesmo payload recebe sempre o mesmo token enquanto estiver
+    guardado, assim os teclados recriados a cada jogada não ocupam novos
+    tokens. Quando uma partida passa de max_size tokens, os menos usados
+    são descartados e os botões antigos com esses tokens deixam de
+    funcionar.
+    '''
+
+    def __init__(self, max_size: int = PAYLOAD_STORE_MAX_SIZE):
+        if max_size < 1:
+            raise ValueError(f'max_size precisa ser maior que 0 ({max_size}).')
+
+        self.max_size = max_size
+        self.game_payloads: Dict[int, GamePayloads] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'max_size={self.max_size}, '
+            f'total_games={len(self.game_payloads)}, '
+            f'total_payloads={len(self)})'
+        )
+
+    def __len__(self) -> int:
+        return sum(
+            len(game_payloads)
+            for game_payloads in self.game_payloads.values()
+        )
+
+    def store(self, game_id: int, payload: str) -> int:
+        '''Guarda o payload da partida e retorna o token dele.
+        '''
+
+        game_payloads = self.game_payloads.get(game_id)
+        if game_payloads is None:
+            game_payloads = self.game_payloads[game_id] = GamePayloads()
+
+        token = game_payloads.payload_to_token.get(payload)
+        if token is not None:
+            game_payloads.token_to_payload.move_to_end(token)
+            return token
+
+        token = next(game_payloads.token_counter)
+        game_payloads.token_to_payload[token] = payload
+        game_payloads.payload_to_token[payload] = token
+        while len(game_payloads) > self.max_size:
+            _, old_payload = game_payloads.token_to_payload.popitem(last=False)
+            del game_payloads.payload_to_token[old_payload]
+
+        return token
+
+    def load(self, game_id: int, token: int) -> str:
+        '''Retorna o payload do token da partida.
+        Levanta KeyError se o token não existir ou tiver sido descartado.
+        '''
+
+        game_payloads = self.game_payloads[game_id]
+        payload = game_payloads.token_to_payload[token]
+        game_payloads.token_to_payload.move_to_end(token)
+
+        return payload
+
+    def clear_game(self, game_id: int):
+        self.game_payloads.pop(game_id, None)
+
+    def clear(self):
+        self.game_payloads.clear()
+
+
+def is_payload_token(text: str) -> bool:
+    return text.startswith(CALLBACK_TOKEN_HEADER)
+
+
+def encode_callback_payload(
+    callback_data: dict,
+    store: Optional[CallbackPayloadStore] = None,
+    min_length: int = PAYLOAD_STORE_MIN_LENGTH,
+) -> str:
+    '''Codifica o callback_data com o callback_codec. Se o texto tiver mais
+    de min_length bytes e o callback_data tiver GAME_ID, o texto é guardado
+    no store e o token é retornado no lugar dele.
+    Sem store, o texto é sempre retornado inteiro (ex: para comparar os
+    botões).
+    '''
+
+    payload = encode_callback_data(callback_data)
+    game_id = callback_data.get(CallbackKeyEnum.GAME_ID)
+    if (
+        store is None or
+        not isinstance(game_id, int) or
+        len(payload.encode('utf-8')) <= min_length
+    ):
+        return payload
+
+    command = callback_data[CallbackKeyEnum.COMMAND]
+    command_tag = COMMAND_TO_TAG.get(command)
+    if command_tag is None:
+        command_tag = COMMAND_TO_TAG[get_command_enum(command)]
+    token = store.store(game_id=game_id, payload=payload)
+    logging.debug(
+        f'ENCODE_CALLBACK_PAYLOAD(): Payload de {len(payload)} caracteres '
+        f'guardado na partida {game_id} com o token {token}.'
+    )
+
+    return ''.join((
+        CALLBACK_TOKEN_HEADER,
+        command_tag,
+        encode_varint(game_id),
+        encode_varint(token),
+    ))
+
+
+def decode_callback_payload(
+    text: str,
+    store: Optional[CallbackPayloadStore] = None,
+) -> dict:
+    '''Decodifica um texto criado por encode_callback_payload, buscando o
+    payload no store quando o texto for um token.
+    Levanta ExpiredPayloadError se o token for inválido, tiver sido
+    descartado ou se não houver store.
+    '''
+
+    if not is_payload_token(text):
+        return decode_callback_data(text)
+
+    try:
+        if store is None:
+            raise KeyError('Nenhum CallbackPayloadStore informado.')
+        index = len(CALLBACK_TOKEN_HEADER) + 1
+        game_id, index = decode_varint(text, index)
+        token, index = decode_varint(text, index)
+        if index != len(text):
+            raise ValueError('Caracteres extras no token.')
+        payload = store.load(game_id=game_id, token=token)
+    except (KeyError, IndexError, ValueError) as error:
+        raise ExpiredPayloadError(
+            f'Token de callback_data inválido ou expirado: "{text}" '
+            f'({error!r}).'
+        ) from error
+
+    return decode_callback_data(payload)
+
+
+def clear_game_payloads(
+    game_id: Union[int, str],
+    store: CallbackPayloadStore,
+):
+    store.clear_game(game_id=decode_game_id(game_id))
@@ -1,8 +1,12 @@
 
-import re
-
-from typing import TYPE_CHECKING, Union
-
+from typing import TYPE_CHECKING, Optional, Union
+
+from bot.games.buttons.callback_codec import get_callback_data_pattern
+from bot.games.buttons.payload_store import (
+    CallbackPayloadStore,
+    decode_callback_payload,
+    encode_callback_payload
+)
 from bot.games.enums.command import CallbackKeyEnum, CommandEnum
 
 from telegram import InlineKeyboardButton
@@ -71,64 +75,57 @@ class PlayButton:
                 f'\nOs valores válidos são: {CallbackKeyEnum._member_names_}.'
             )
 
-    def make_button(self) -> InlineKeyboardButton:
+    def make_button(
+        self,
+        payload_store: Optional[CallbackPayloadStore] = None,
+    ) -> InlineKeyboardButton:
         text = self.text
-        callback_data = self.data_to_str
+        callback_data = self.make_callback_data(payload_store=payload_store)
 
         return InlineKeyboardButton(text=text, callback_data=callback_data)
 
     # CALLBACK FUNCTIONS
     @classmethod
-    def callback_data_to_string(cls, callback_data: dict) -> str:
+    def callback_data_to_string(
+        cls,
+        callback_data: dict,
+        payload_store: Optional[CallbackPayloadStore] = None,
+    ) -> str:
         '''Transforma um dicionário em uma string compactada usada no
-        campo data de um botão.
+        campo data de um botão (ver callback_codec). Se houver
+        payload_store, os textos longos são trocados por um token dele.
         '''
 
-        items = []
-        for key, value in callback_data.items():
-            key_int = PlayButton.CALLBACK_KEY_LIST.index(key)
-            if isinstance(value, str):
-                items.append(f'{key_int}:"{value}"')
-            else:
-                items.append(f'{key_int}:{value}')
-        text = ','.join(items)
-        text = f'{{{text}}}'
-
-        return text
+        return encode_callback_payload(callback_data, store=payload_store)
 
     @classmethod
-    def callback_data_to_dict(cls, callback_data_str: str) -> dict:
+    def callback_data_to_dict(
+        cls,
+        callback_data_str: str,
+        payload_store: Optional[CallbackPayloadStore] = None,
+    ) -> dict:
         '''Transforma de volta uma string compactada usada no campo data
-        de um botão em um dicionário.
+        de um botão em um dicionário. Levanta ExpiredPayloadError se a
+        string for um token que não está no payload_store.
         '''
 
-        callback_data: dict = eval(callback_data_str)
-        callback_data = {
-            PlayButton.CALLBACK_KEY_LIST[key]: value
-            for key, value in callback_data.items()
-        }
-
-        return callback_data
+        return decode_callback_payload(callback_data_str, store=payload_store)
 
     def str_to_data(self, data: str) -> dict:
         return self.callback_data_to_dict(data)
 
     @classmethod
     def callback_data_to_pattern(cls, command: Union[CommandEnum, str]) -> str:
-        if isinstance(command, str):
-            command = CommandEnum[command.upper()]
-        if not isinstance(command, CommandEnum):
-            raise TypeError(
-                'Command precisa ser uma instância de CommandEnum '
-                'ou uma striing válida de CommandEnum.'
-            )
-
-        data = {CallbackKeyEnum.COMMAND: command.name}
-
-        return re.escape(cls.callback_data_to_string(data)[:-1])
+        return get_callback_data_pattern(command)
 
     @property
     def data_to_str(self) -> str:
+        return self.make_callback_data()
+
+    def make_callback_data(
+        self,
+        payload_store: Optional[CallbackPayloadStore] = None,
+    ) -> str:
         data = {
             CallbackKeyEnum.COMMAND: self.command.name,
             CallbackKeyEnum.GAME_ID: self.game.id,
@@ -139,7 +136,10 @@ class PlayButton:
         }
         data.update(callback_data_dict)
 
-        return PlayButton.callback_data_to_string(data)
+        return PlayButton.callback_data_to_string(
+            data,
+            payload_store=payload_store,
+        )
 
 
 if __name__ == '__main__':
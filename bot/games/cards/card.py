@@ -1,31 +1,27 @@
-from enum import Enum
-import re
-from typing import List, Union
-from bot.functions.enumeration import get_enum_index
-from bot.games.enums.card import (
-    BLACK_SUITS,
-    RED_SUITS,
-    WILD_SUITS,
-    ColorNames,
-    FlipColorNames,
-    FullRoyalNames,
-    Names,
-    RoyalNames,
-    SpanishNames,
-    StrippedSpanishNames,
-    Suits
+from typing import FrozenSet, Union
+from bot.games.cards.card_category import (
+    get_category_names,
+    get_name_category
 )
+from bot.games.cards.card_face import WILD_TERMS, CardFace, get_card_face
+from bot.games.enums.card import CardTraitEnum, Names, Suits
 
 
 class Card:
+    '''Carta com a face (CardFace) compartilhada por todas as cartas com o
+    mesmo nome e naipe. Os valores WILD ficam na própria carta e, quando
+    definidos, os valores da carta vêm da face do nome e naipe WILD.
+    '''
+
+    __slots__ = ('face', 'wild_name', 'wild_suit')
+
     def __init__(self, name: Names, suit: Suits):
         if not isinstance(name, Names):
             raise TypeError('name precisa ser um Enum do tipo Names.')
         if not isinstance(suit, Suits):
             raise TypeError('suit precisa ser um Enum do tipo Suits.')
 
-        self.real_name = name
-        self.real_suit = suit
+        self.face = get_card_face(name, suit)
         self.wild_name = None
         self.wild_suit = None
 
@@ -96,25 +92,43 @@ class Card:
         self.wild_name = None
         self.wild_suit = None
 
+    @property
+    def real_name(self) -> Names:
+        return self.face.name
+
+    @property
+    def real_suit(self) -> Suits:
+        return self.face.suit
+
+    @property
+    def active_face(self) -> CardFace:
+        '''Face com o nome e o naipe atuais da carta (WILD, se definidos).
+        '''
+
+        if self.wild_name is None and self.wild_suit is None:
+            return self.face
+
+        return get_card_face(self.name, self.suit)
+
     @property
     def text(self) -> str:
-        return f'{self.suit.value}{self.name.value}'
+        return self.active_face.text
 
     @property
     def value(self) -> int:
-        return get_enum_index(self.name)
+        return self.active_face.value
 
     @property
     def suit_value(self) -> int:
-        return get_enum_index(self.suit)
+        return self.active_face.suit_value
 
     @property
     def plus_value(self) -> int:
-        value_text = self.name.value
-        plus_match = re.search(r'\+(\d+)', value_text)
-        if plus_match:
-            return int(plus_match.group(1))
-        return 0
+        return self.active_face.plus_value
+
+    @property
+    def traits(self) -> CardTraitEnum:
+        return self.active_face.traits
 
     @property
     def name(self):
@@ -126,151 +140,43 @@ class Card:
 
     @property
     def wild_terms(self) -> str:
-        return '|'.join((suit.name for suit in WILD_SUITS))
+        return WILD_TERMS
 
     @property
     def is_wild(self) -> bool:
-        return bool(re.search(self.wild_terms, self.suit.name, re.I))
+        return self.active_face.is_wild
 
     @property
     def is_black(self) -> bool:
-        return self.suit in BLACK_SUITS
+        return self.active_face.is_black
 
     @property
     def is_red(self) -> bool:
-        return self.suit in RED_SUITS
+        return self.active_face.is_red
 
     @property
-    def number_card_names(self) -> List[Enum]:
-        if isinstance(self.name, RoyalNames):
-            return [
-                RoyalNames.TWO, RoyalNames.THREE, RoyalNames.FOUR,
-                RoyalNames.FIVE, RoyalNames.SIX, RoyalNames.SEVEN,
-                RoyalNames.EIGHT, RoyalNames.NINE, RoyalNames.TEN
-            ]
-        elif isinstance(self.name, FullRoyalNames):
-            return [
-                FullRoyalNames.TWO, FullRoyalNames.THREE, FullRoyalNames.FOUR,
-                FullRoyalNames.FIVE, FullRoyalNames.SIX, FullRoyalNames.SEVEN,
-                FullRoyalNames.EIGHT, FullRoyalNames.NINE, FullRoyalNames.TEN
-            ]
-        elif isinstance(self.name, SpanishNames):
-            return [
-                SpanishNames.ONE, SpanishNames.TWO, SpanishNames.THREE,
-                SpanishNames.FOUR, SpanishNames.FIVE, SpanishNames.SIX,
-                SpanishNames.SEVEN, SpanishNames.EIGHT, SpanishNames.NINE,
-                SpanishNames.KNAVE, SpanishNames.KNIGHT, SpanishNames.KING
-            ]
-        elif isinstance(self.name, StrippedSpanishNames):
-            return [
-                StrippedSpanishNames.ONE, StrippedSpanishNames.TWO,
-                StrippedSpanishNames.THREE, StrippedSpanishNames.FOUR,
-                StrippedSpanishNames.FIVE, StrippedSpanishNames.SIX,
-                StrippedSpanishNames.SEVEN, StrippedSpanishNames.KNAVE,
-                StrippedSpanishNames.KNIGHT, StrippedSpanishNames.KING
-            ]
-        elif isinstance(self.name, ColorNames):
-            return [
-                ColorNames.ZERO, ColorNames.ONE, ColorNames.TWO,
-                ColorNames.THREE, ColorNames.FOUR, ColorNames.FIVE,
-                ColorNames.SIX, ColorNames.SEVEN, ColorNames.EIGHT,
-                ColorNames.NINE,
-            ]
-        elif isinstance(self.name, FlipColorNames):
-            return [
-                FlipColorNames.ZERO, FlipColorNames.ONE, FlipColorNames.TWO,
-                FlipColorNames.THREE, FlipColorNames.FOUR, FlipColorNames.FIVE,
-                FlipColorNames.SIX, FlipColorNames.SEVEN, FlipColorNames.EIGHT,
-                FlipColorNames.NINE,
-            ]
-        else:
-            raise ValueError(
-                f'Não foi possível encontrar os números de {self.name}.'
-            )
+    def category(self) -> CardTraitEnum:
+        '''Categorias do nome da carta (ver bot.games.cards.card_category).
+        '''
+
+        return get_name_category(self.name)
 
     @property
-    def figure_card_names(self) -> List[Enum]:
-        if isinstance(self.name, RoyalNames):
-            return [RoyalNames.JACK, RoyalNames.QUEEN, RoyalNames.KING]
-        elif isinstance(self.name, FullRoyalNames):
-            return [
-                FullRoyalNames.JACK, FullRoyalNames.QUEEN, FullRoyalNames.KING
-            ]
-        elif isinstance(self.name, SpanishNames):
-            return [SpanishNames.KNAVE, SpanishNames.KNIGHT, SpanishNames.KING]
-        elif isinstance(self.name, StrippedSpanishNames):
-            return [
-                StrippedSpanishNames.KNAVE, StrippedSpanishNames.KNIGHT,
-                StrippedSpanishNames.KING
-            ]
-        elif isinstance(self.name, ColorNames):
-            return []
-        elif isinstance(self.name, FlipColorNames):
-            return []
-        else:
-            raise ValueError(
-                f'Não foi possível encontrar os números de {self.name}.'
-            )
+    def number_card_names(self) -> FrozenSet[Names]:
+        return get_category_names(self.name.__class__, CardTraitEnum.NUMBER)
 
     @property
-    def special_card_names(self) -> List[Enum]:
-        if isinstance(self.name, RoyalNames):
-            return [RoyalNames.ACE]
-        elif isinstance(self.name, FullRoyalNames):
-            return [FullRoyalNames.ACE]
-        elif isinstance(self.name, SpanishNames):
-            return []
-        elif isinstance(self.name, StrippedSpanishNames):
-            return []
-        elif isinstance(self.name, ColorNames):
-            return []
-        elif isinstance(self.name, FlipColorNames):
-            return []
-        else:
-            raise ValueError(
-                f'Não foi possível encontrar os números de {self.name}.'
-            )
+    def figure_card_names(self) -> FrozenSet[Names]:
+        return get_category_names(self.name.__class__, CardTraitEnum.FIGURE)
 
     @property
-    def extra_card_names(self) -> List[Enum]:
-        if isinstance(self.name, RoyalNames):
-            return []
-        elif isinstance(self.name, FullRoyalNames):
-            return [FullRoyalNames.JOKER]
-        elif isinstance(self.name, SpanishNames):
-            return []
-        elif isinstance(self.name, StrippedSpanishNames):
-            return []
-        elif isinstance(self.name, ColorNames):
-            return []
-        elif isinstance(self.name, FlipColorNames):
-            return []
-        else:
-            raise ValueError(
-                f'Não foi possível encontrar os números de {self.name}.'
-            )
+    def special_card_names(self) -> FrozenSet[Names]:
+        return get_category_names(self.name.__class__, CardTraitEnum.SPECIAL)
 
     @property
-    def action_card_names(self) -> List[Enum]:
-        if isinstance(self.name, RoyalNames):
-            return []
-        elif isinstance(self.name, FullRoyalNames):
-            return []
-        elif isinstance(self.name, SpanishNames):
-            return []
-        elif isinstance(self.name, StrippedSpanishNames):
-            return []
-        elif isinstance(self.name, ColorNames):
-            return [
-                ColorNames.BLOCK, ColorNames.REVERSE,
-                ColorNames.PLUS_TWO, ColorNames.PLUS_FOUR
-            ]
-        elif isinstance(self.name, FlipColorNames):
-            return [
-                FlipColorNames.BLOCK_ALL, FlipColorNames.REVERSE,
-                FlipColorNames.PLUS_FIVE, FlipColorNames.PLUS_COLOR
-            ]
-        else:
-            raise ValueError(
-                f'Não foi possível encontrar os números de {self.name}.'
-            )
+    def extra_card_names(self) -> FrozenSet[Names]:
+        return get_category_names(self.name.__class__, CardTraitEnum.EXTRA)
+
+    @property
+    def action_card_names(self) -> FrozenSet[Names]:
+        return get_category_names(self.name.__class__, CardTraitEnum.ACTION)
@@ -0,0 +1,182 @@
+'''Registro das categorias dos nomes das cartas.
+
+Cada classe Names registra, com o register_card_category, os nomes de
+cada categoria (NUMBER, FIGURE, SPECIAL, EXTRA e ACTION do CardTraitEnum).
+Um nome pode estar em mais de uma categoria (ex: SpanishNames.KING é
+número e figura).
+
+As classes devem ser registradas antes da criação das cartas, pois as
+características são guardadas nas faces das cartas (ver
+bot.games.cards.card_face). As classes do jogo são registradas no final
+deste módulo.
+'''
+
+from typing import Dict, FrozenSet, Iterable, Type
+
+from bot.games.enums.card import (
+    CardTraitEnum,
+    ColorNames,
+    FlipColorNames,
+    FullRoyalNames,
+    Names,
+    NineNineNames,
+    RoyalNames,
+    SpanishNames,
+    StrippedSpanishNames
+)
+
+
+NO_CARD_CATEGORY = CardTraitEnum(0)
+CARD_CATEGORY_DICT: Dict[
+    Type[Names], Dict[CardTraitEnum, FrozenSet[Names]]
+] = {}
+NAME_CATEGORY_DICT: Dict[Names, CardTraitEnum] = {}
+
+
+def register_card_category(
+    names_class: Type[Names],
+    number: Iterable[Names] = (),
+    figure: Iterable[Names] = (),
+    special: Iterable[Names] = (),
+    extra: Iterable[Names] = (),
+    action: Iterable[Names] = (),
+):
+    '''Registra os nomes de cada categoria de uma classe Names.
+    '''
+
+    if not isinstance(names_class, type) or not issubclass(names_class, Names):
+        raise TypeError('names_class precisa ser uma subclasse de Names.')
+
+    category_dict = {
+        CardTraitEnum.NUMBER: frozenset(number),
+        CardTraitEnum.FIGURE: frozenset(figure),
+        CardTraitEnum.SPECIAL: frozenset(special),
+        CardTraitEnum.EXTRA: frozenset(extra),
+        CardTraitEnum.ACTION: frozenset(action),
+    }
+    for name_set in category_dict.values():
+        for name in name_set:
+            if not isinstance(name, names_class):
+                raise TypeError(
+                    f'{name} precisa ser um Enum do tipo {names_class}.'
+                )
+
+    CARD_CATEGORY_DICT[names_class] = category_dict
+    for name in names_class:
+        category = NO_CARD_CATEGORY
+        for trait, name_set in category_dict.items():
+            if name in name_set:
+                category |= trait
+        NAME_CATEGORY_DICT[name] = category
+
+
+def get_category_names(
+    names_class: Type[Names],
+    category: CardTraitEnum
+) -> FrozenSet[Names]:
+    '''Retorna os nomes de uma categoria da classe Names.
+    Levanta ValueError se a classe não foi registrada.
+    '''
+
+    category_dict = CARD_CATEGORY_DICT.get(names_class)
+    if category_dict is None:
+        raise ValueError(
+            f'Não foi possível encontrar as categorias de {names_class}.'
+        )
+
+    return category_dict[category]
+
+
+def get_name_category(name: Names) -> CardTraitEnum:
+    '''Retorna as categorias do nome ou CardTraitEnum(0) se a classe do
+    nome não foi registrada.
+    '''
+
+    return NAME_CATEGORY_DICT.get(name, NO_CARD_CATEGORY)
+
+
+# REGISTRY
+register_card_category(
+    RoyalNames,
+    number=(
+        RoyalNames.TWO, RoyalNames.THREE, RoyalNames.FOUR,
+        RoyalNames.FIVE, RoyalNames.SIX, RoyalNames.SEVEN,
+        RoyalNames.EIGHT, RoyalNames.NINE, RoyalNames.TEN
+    ),
+    figure=(RoyalNames.JACK, RoyalNames.QUEEN, RoyalNames.KING),
+    special=(RoyalNames.ACE,),
+)
+register_card_category(
+    FullRoyalNames,
+    number=(
+        FullRoyalNames.TWO, FullRoyalNames.THREE, FullRoyalNames.FOUR,
+        FullRoyalNames.FIVE, FullRoyalNames.SIX, FullRoyalNames.SEVEN,
+        FullRoyalNames.EIGHT, FullRoyalNames.NINE, FullRoyalNames.TEN
+    ),
+    figure=(FullRoyalNames.JACK, FullRoyalNames.QUEEN, FullRoyalNames.KING),
+    special=(FullRoyalNames.ACE,),
+    extra=(FullRoyalNames.JOKER,),
+)
+register_card_category(
+    SpanishNames,
+    number=(
+        SpanishNames.ONE, SpanishNames.TWO, SpanishNames.THREE,
+        SpanishNames.FOUR, SpanishNames.FIVE, SpanishNames.SIX,
+        SpanishNames.SEVEN, SpanishNames.EIGHT, SpanishNames.NINE,
+        SpanishNames.KNAVE, SpanishNames.KNIGHT, SpanishNames.KING
+    ),
+    figure=(SpanishNames.KNAVE, SpanishNames.KNIGHT, SpanishNames.KING),
+)
+register_card_category(
+    StrippedSpanishNames,
+    number=(
+        StrippedSpanishNames.ONE, StrippedSpanishNames.TWO,
+        StrippedSpanishNames.THREE, StrippedSpanishNames.FOUR,
+        StrippedSpanishNames.FIVE, StrippedSpanishNames.SIX,
+        StrippedSpanishNames.SEVEN, StrippedSpanishNames.KNAVE,
+        StrippedSpanishNames.KNIGHT, StrippedSpanishNames.KING
+    ),
+    figure=(
+        StrippedSpanishNames.KNAVE, StrippedSpanishNames.KNIGHT,
+        StrippedSpanishNames.KING
+    ),
+)
+register_card_category(
+    ColorNames,
+    number=(
+        ColorNames.ZERO, ColorNames.ONE, ColorNames.TWO,
+        ColorNames.THREE, ColorNames.FOUR, ColorNames.FIVE,
+        ColorNames.SIX, ColorNames.SEVEN, ColorNames.EIGHT,
+        ColorNames.NINE,
+    ),
+    action=(
+        ColorNames.BLOCK, ColorNames.REVERSE,
+        ColorNames.PLUS_TWO, ColorNames.PLUS_FOUR
+    ),
+)
+register_card_category(
+    FlipColorNames,
+    number=(
+        FlipColorNames.ZERO, FlipColorNames.ONE, FlipColorNames.TWO,
+        FlipColorNames.THREE, FlipColorNames.FOUR, FlipColorNames.FIVE,
+        FlipColorNames.SIX, FlipColorNames.SEVEN, FlipColorNames.EIGHT,
+        FlipColorNames.NINE,
+    ),
+    action=(
+        FlipColorNames.BLOCK_ALL, FlipColorNames.REVERSE,
+        FlipColorNames.PLUS_FIVE, FlipColorNames.PLUS_COLOR
+    ),
+)
+register_card_category(
+    NineNineNames,
+    number=(
+        NineNineNames.ZERO, NineNineNames.ONE, NineNineNames.TWO,
+        NineNineNames.THREE, NineNineNames.FOUR, NineNineNames.FIVE,
+        NineNineNames.SIX, NineNineNames.SEVEN, NineNineNames.EIGHT,
+        NineNineNames.NINE, NineNineNames.TEN,
+    ),
+    action=(
+        NineNineNames.NINE_NINE, NineNineNames.REVERSE,
+        NineNineNames.DOUBLE_PLAY, NineNineNames.MINUS_TEN,
+    ),
+)
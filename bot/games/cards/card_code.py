@@ -0,0 +1,95 @@
+'''Códigos inteiros (uint16) das cartas, usados pelo ArrayStack.
+
+Cada trio (classe da carta, Names, Suits) recebe um código na primeira vez
+em que é usado. O código é a posição do trio em CARD_CODE_LIST, e as
+listas CARD_CODE_*_LIST guardam, na mesma posição, a face, o value e o
+suit_value da carta, então contagens e somas podem ser feitas direto nos
+códigos, sem criar as cartas.
+
+Os códigos valem só durante a execução (dependem da ordem de uso), então
+não devem ser salvos (ver bot.games.snapshot para o formato persistente).
+Apenas as classes de CODE_CARD_CLASS_LIST podem ser codificadas, pois as
+outras (FlipCard e FlexCard) guardam mais estado que o nome e o naipe.
+Os valores WILD das cartas não são guardados no código.
+'''
+
+from typing import Dict, List, Tuple, Type
+
+from bot.games.cards.card import Card
+from bot.games.cards.card_face import CardFace, get_card_face
+from bot.games.cards.nine_nine import NineNineCard
+from bot.games.cards.scoundrel import ScoundrelCard
+from bot.games.enums.card import Names, Suits
+
+
+CARD_CODE_TYPECODE = 'H'
+MAX_CARD_CODE = 0xFFFF
+CODE_CARD_CLASS_LIST: List[Type[Card]] = [
+    Card,
+    ScoundrelCard,
+    NineNineCard,
+]
+CARD_CODE_DICT: Dict[Tuple[Type[Card], Names, Suits], int] = {}
+CARD_CODE_CLASS_LIST: List[Type[Card]] = []
+CARD_CODE_FACE_LIST: List[CardFace] = []
+CARD_CODE_VALUE_LIST: List[int] = []
+CARD_CODE_SUIT_VALUE_LIST: List[int] = []
+
+
+def get_card_code(card_class: Type[Card], name: Names, suit: Suits) -> int:
+    '''Retorna o código do trio (card_class, name, suit), registrando-o
+    se for a primeira vez que ele é usado.
+    '''
+
+    key = (card_class, name, suit)
+    code = CARD_CODE_DICT.get(key)
+    if code is not None:
+        return code
+
+    if card_class not in CODE_CARD_CLASS_LIST:
+        raise TypeError(
+            f'card_class precisa ser uma das classes de '
+            f'CODE_CARD_CLASS_LIST, não {card_class}.'
+        )
+
+    code = len(CARD_CODE_CLASS_LIST)
+    if code > MAX_CARD_CODE:
+        raise OverflowError(
+            f'Não há mais códigos de cartas disponíveis ({MAX_CARD_CODE}).'
+        )
+
+    card = card_class(name=name, suit=suit)
+    CARD_CODE_CLASS_LIST.append(card_class)
+    CARD_CODE_FACE_LIST.append(get_card_face(name, suit))
+    CARD_CODE_VALUE_LIST.append(card.value)
+    CARD_CODE_SUIT_VALUE_LIST.append(card.suit_value)
+    CARD_CODE_DICT[key] = code
+
+    return code
+
+
+def encode_card(card: Card) -> int:
+    '''Retorna o código da carta. Os valores WILD são descartados.
+    '''
+
+    if not isinstance(card, Card):
+        raise TypeError(f'Espera um Card, obteve {type(card)}({card})')
+
+    return get_card_code(card.__class__, card.real_name, card.real_suit)
+
+
+def decode_card(code: int) -> Card:
+    '''Cria uma nova carta a partir do código.
+
+    O trio do código já foi validado pelo get_card_code, então a carta é
+    criada sem o __init__, preenchendo direto os __slots__ do Card (as
+    classes de CODE_CARD_CLASS_LIST não têm outros atributos).
+    '''
+
+    card_class = CARD_CODE_CLASS_LIST[code]
+    card = card_class.__new__(card_class)
+    card.face = CARD_CODE_FACE_LIST[code]
+    card.wild_name = None
+    card.wild_suit = None
+
+    return card
@@ -0,0 +1,140 @@
+'''Faces (nome + naipe) compartilhadas pelas cartas (flyweight).
+
+Cada par (Names, Suits) tem uma única CardFace, criada na primeira vez em
+que o par é usado e guardada em CARD_FACE_DICT. A face guarda os valores
+que não mudam durante a partida (índices, texto, cor e características),
+então as cartas não precisam recalculá-los a cada acesso.
+
+As características (CardTraitEnum) e o valor "+N" de cada elemento de
+Names e Suits também são calculados uma única vez e guardados em
+NAME_TRAITS_DICT, SUIT_TRAITS_DICT e PLUS_VALUE_DICT.
+'''
+
+import re
+
+from typing import Dict, Tuple
+
+from bot.functions.enumeration import get_enum_index
+from bot.games.cards.card_category import get_name_category
+from bot.games.enums.card import (
+    BLACK_SUITS,
+    RED_SUITS,
+    WILD_SUITS,
+    CardTraitEnum,
+    Names,
+    Suits
+)
+
+
+WILD_TERMS = '|'.join((suit.name for suit in WILD_SUITS))
+PLUS_VALUE_PATTERN = re.compile(r'\+(\d+)')
+NAME_TRAITS_DICT: Dict[Names, CardTraitEnum] = {}
+SUIT_TRAITS_DICT: Dict[Suits, CardTraitEnum] = {}
+PLUS_VALUE_DICT: Dict[Names, int] = {}
+CARD_FACE_DICT: Dict[Tuple[Names, Suits], 'CardFace'] = {}
+
+
+def get_plus_value(name: Names) -> int:
+    '''Retorna o N dos nomes "+N" (ex: ColorNames.PLUS_TWO) ou 0.
+    '''
+
+    plus_value = PLUS_VALUE_DICT.get(name)
+    if plus_value is None:
+        plus_match = PLUS_VALUE_PATTERN.search(name.value)
+        plus_value = int(plus_match.group(1)) if plus_match else 0
+        PLUS_VALUE_DICT[name] = plus_value
+
+    return plus_value
+
+
+def get_name_traits(name: Names) -> CardTraitEnum:
+    '''Retorna as características do nome: categorias (NUMBER, FIGURE,
+    SPECIAL, EXTRA e ACTION, ver bot.games.cards.card_category) e PLUS.
+    '''
+
+    traits = NAME_TRAITS_DICT.get(name)
+    if traits is None:
+        traits = get_name_category(name)
+        if get_plus_value(name) > 0:
+            traits |= CardTraitEnum.PLUS
+        NAME_TRAITS_DICT[name] = traits
+
+    return traits
+
+
+def get_suit_traits(suit: Suits) -> CardTraitEnum:
+    '''Retorna as características do naipe: WILD, BLACK e RED.
+    '''
+
+    traits = SUIT_TRAITS_DICT.get(suit)
+    if traits is None:
+        traits = CardTraitEnum(0)
+        if re.search(WILD_TERMS, suit.name, re.I):
+            traits |= CardTraitEnum.WILD
+        if suit in BLACK_SUITS:
+            traits |= CardTraitEnum.BLACK
+        if suit in RED_SUITS:
+            traits |= CardTraitEnum.RED
+        SUIT_TRAITS_DICT[suit] = traits
+
+    return traits
+
+
+class CardFace:
+    '''Valores imutáveis de um par (name, suit).
+    Use get_card_face para obter a face compartilhada.
+    '''
+
+    __slots__ = (
+        'name',
+        'suit',
+        'value',
+        'suit_value',
+        'text',
+        'traits',
+        'plus_value',
+        'is_wild',
+        'is_black',
+        'is_red',
+    )
+
+    def __init__(self, name: Names, suit: Suits):
+        traits = get_name_traits(name) | get_suit_traits(suit)
+        set_attribute = super().__setattr__
+        set_attribute('name', name)
+        set_attribute('suit', suit)
+        set_attribute('value', get_enum_index(name))
+        set_attribute('suit_value', get_enum_index(suit))
+        set_attribute('text', f'{suit.value}{name.value}')
+        set_attribute('traits', traits)
+        set_attribute('plus_value', get_plus_value(name))
+        set_attribute('is_wild', CardTraitEnum.WILD in traits)
+        set_attribute('is_black', CardTraitEnum.BLACK in traits)
+        set_attribute('is_red', CardTraitEnum.RED in traits)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{self.__class__.__name__} é imutável.')
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.text})'
+
+    def __reduce__(self):
+        return get_card_face, (self.name, self.suit)
+
+    def __copy__(self) -> 'CardFace':
+        return self
+
+    def __deepcopy__(self, memo: dict) -> 'CardFace':
+        return self
+
+
+def get_card_face(name: Names, suit: Suits) -> CardFace:
+    '''Retorna a CardFace compartilhada do par (name, suit).
+    '''
+
+    key = (name, suit)
+    face = CARD_FACE_DICT.get(key)
+    if face is None:
+        face = CARD_FACE_DICT[key] = CardFace(name, suit)
+
+    return face
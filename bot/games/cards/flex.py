@@ -7,6 +7,8 @@ from bot.games.enums.card import Names, Suits
 
 
 class FlexCard(Card):
+    __slots__ = ('flex',)
+
     def __init__(
         self,
         name: Names,
@@ -2,10 +2,19 @@ import logging
 import re
 
 from bot.games.cards.card import Card
+from bot.games.cards.card_face import CardFace, get_card_face
 from bot.games.enums.card import Names, Suits
 
 
 class FlipCard(Card):
+    __slots__ = (
+        'flip_name',
+        'flip_suit',
+        'flip_wild_name',
+        'flip_wild_suit',
+        'is_flipped',
+    )
+
     def __init__(
         self,
         name: Names,
@@ -60,6 +69,13 @@ class FlipCard(Card):
         self.flip_wild_name = None
         self.flip_wild_suit = None
 
+    @property
+    def active_face(self) -> CardFace:
+        if self.is_flipped is False:
+            return super().active_face
+
+        return get_card_face(self.name, self.suit)
+
     def get_name(self) -> Names:
         return (
             self.wild_name
@@ -4,6 +4,7 @@ from bot.games.enums.card import NineNineNames
 
 
 class NineNineCard(Card):
+    __slots__ = ()
 
     @property
     def zero_names(self) -> Tuple[NineNineNames]:
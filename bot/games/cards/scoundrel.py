@@ -3,6 +3,8 @@ from bot.games.enums.card import RoyalNames, RoyalSuits
 
 
 class ScoundrelCard(Card):
+    __slots__ = ()
+
     @property
     def value(self):
         if self.name == RoyalNames.ACE:
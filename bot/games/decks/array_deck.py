@@ -0,0 +1,77 @@
+'''Deck com as cartas guardadas como códigos inteiros (ver
+bot.games.cards.card_code) em um ArrayStack.
+
+Embaralhar, comprar, contar e somar trabalham direto no array de uint16,
+e as cartas só são criadas quando saem do deck (draw, peek, iteração).
+Usado nas simulações e análises sem interface, onde o deck é embaralhado
+e contado muitas vezes e poucas cartas precisam ser exibidas.
+
+O ganho está em criar o deck, no draw_codes e nas consultas agregadas
+(count_*, total_value), que não criam cartas. O draw cria as cartas que
+saem e o shuffle usa o mesmo Random.shuffle do BaseDeck, então os dois
+ficam próximos do BaseDeck (ver benchmarks.array_deck).
+'''
+
+from array import array
+from collections import Counter
+from random import Random
+from typing import Optional, Type
+
+from bot.games.cards.card import Card
+from bot.games.cards.card_code import (
+    CARD_CODE_FACE_LIST,
+    CARD_CODE_VALUE_LIST,
+    get_card_code
+)
+from bot.games.decks.deck import BaseDeck
+from bot.games.enums.card import Names, Suits
+from bot.games.structure.array_stack import ArrayStack
+
+
+class ArrayDeck(BaseDeck):
+    '''BaseDeck com o ArrayStack no lugar do Stack.
+    Aceita os mesmos argumentos do BaseDeck.
+    '''
+
+    def create_card_stack(self, random: Optional[Random]) -> ArrayStack:
+        return ArrayStack(random=random)
+
+    def add_new_cards(
+        self,
+        card_class: Type[Card],
+        name: Names,
+        suit: Suits,
+        quantity: int,
+    ):
+        code = get_card_code(card_class=card_class, name=name, suit=suit)
+        self.card_stack.push_codes(*[code] * quantity)
+
+    def draw_codes(self, quantity: int = 1) -> array:
+        '''Compra as cartas sem criá-las, retornando os seus códigos.
+        '''
+
+        return self.card_stack.pop_codes(quantity=quantity)
+
+    def count_codes(self) -> Counter:
+        return Counter(self.card_stack.items)
+
+    def count_names(self) -> Counter:
+        result = Counter()
+        for code, quantity in self.count_codes().items():
+            result[CARD_CODE_FACE_LIST[code].name] += quantity
+
+        return result
+
+    def count_suits(self) -> Counter:
+        result = Counter()
+        for code, quantity in self.count_codes().items():
+            result[CARD_CODE_FACE_LIST[code].suit] += quantity
+
+        return result
+
+    @property
+    def total_value(self) -> int:
+        return sum(
+            CARD_CODE_VALUE_LIST[code] * quantity
+            for code, quantity in self.count_codes().items()
+        )
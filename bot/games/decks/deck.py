@@ -1,6 +1,8 @@
+from collections import Counter
 from collections.abc import Generator
 from itertools import product
-from typing import List, Type, Union
+from random import Random
+from typing import List, Optional, Type, Union
 
 from bot.games.cards.card import Card
 from bot.games.enums.card import Names, Suits
@@ -15,7 +17,8 @@ class BaseDeck:
         quantities: dict = None,
         is_shuffle: bool = True,
         total_decks: int = 1,
-        card_class: Type[Card] = Card
+        card_class: Type[Card] = Card,
+        random: Optional[Random] = None,
     ):
         """Se names ou suits for None, o deck será vazio.
 
@@ -40,6 +43,8 @@ class BaseDeck:
         - Não havera cartas BLACK e ZERO.
         - Haverá 1 carta ZERO de todas as cores (Suits), exceto BLACK.
         - Haverá 2 cartas BLACK de todos os valores (Names), exceto ZERO.
+
+        O random é usado nos embaralhamentos (o random global se for None).
         """
 
         self.names = names
@@ -48,7 +53,7 @@ class BaseDeck:
         self.is_shuffle = is_shuffle
         self.total_decks = total_decks
         self.card_class = card_class
-        self.card_stack = Stack()
+        self.card_stack = self.create_card_stack(random=random)
         if (
             quantities is None and
             suits is not None and
@@ -105,8 +110,12 @@ class BaseDeck:
                 card_qty = name_qty
             else:
                 card_qty = suit_qty
-            for _ in range(card_qty * total_decks):
-                self.card_stack.push(card_class(name=name, suit=suit))
+            self.add_new_cards(
+                card_class=card_class,
+                name=name,
+                suit=suit,
+                quantity=card_qty * total_decks,
+            )
 
         if is_shuffle is True:
             self.shuffle()
@@ -129,6 +138,19 @@ class BaseDeck:
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}({self.card_stack.text_horizontal})'
 
+    def create_card_stack(self, random: Optional[Random]) -> Stack:
+        return Stack(random=random)
+
+    def add_new_cards(
+        self,
+        card_class: Type[Card],
+        name: Names,
+        suit: Suits,
+        quantity: int,
+    ):
+        for _ in range(quantity):
+            self.card_stack.push(card_class(name=name, suit=suit))
+
     def draw(self, quantity: int = 1) -> List[Card]:
         card_list = self.card_stack.pop(quantity=quantity)
         card_list = self.make_card_list(card_list=card_list)
@@ -156,6 +178,9 @@ class BaseDeck:
     def add_bottom(self, *cards: Card):
         self.card_stack.push_bottom(*cards)
 
+    def set_random(self, random: Optional[Random]):
+        self.card_stack.set_random(random)
+
     def shuffle(self):
         self.card_stack.shuffle()
 
@@ -167,6 +192,16 @@ class BaseDeck:
 
         return card_list
 
+    def count_names(self) -> Counter:
+        return Counter(card.name for card in self.card_stack)
+
+    def count_suits(self) -> Counter:
+        return Counter(card.suit for card in self.card_stack)
+
+    @property
+    def total_value(self) -> int:
+        return sum(card.value for card in self.card_stack)
+
     @property
     def is_empty(self) -> bool:
         return self.card_stack.is_empty
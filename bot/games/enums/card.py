@@ -1,11 +1,13 @@
-from enum import Enum
+from enum import Enum, IntFlag, auto
 
+from bot.functions.enumeration import IndexedEnumMeta
 
-class Suits(Enum):
+
+class Suits(Enum, metaclass=IndexedEnumMeta):
     ...
 
 
-class Names(Enum):
+class Names(Enum, metaclass=IndexedEnumMeta):
     ...
 
 
@@ -180,6 +182,24 @@ class NineNineNames(Names):
     MINUS_TEN = "-10"
 
 
+# Traits
+class CardTraitEnum(IntFlag):
+    '''Características de uma carta (ver bot.games.cards.card_face).
+    Podem ser combinadas para testar várias características de uma vez, ex:
+    card.traits & (CardTraitEnum.WILD | CardTraitEnum.PLUS).
+    '''
+
+    WILD = auto()
+    BLACK = auto()
+    RED = auto()
+    NUMBER = auto()
+    FIGURE = auto()
+    SPECIAL = auto()
+    EXTRA = auto()
+    ACTION = auto()
+    PLUS = auto()
+
+
 # Constants
 WILD_SUITS = [
     FullRoyalSuits.JOKER,
@@ -0,0 +1,163 @@
+'''Gerador de IDs de partida no estilo snowflake.
+
+Formato (bits, do mais significativo para o menos significativo):
+    TIMESTAMP (segundos desde GAME_ID_EPOCH) | WORKER | SEQUÊNCIA
+
+Os IDs são inteiros crescentes, não se repetem depois que a partida é
+removida (como acontecia com id(self)) e o WORKER permite que vários
+processos criem partidas sem colisão. Quando mais de MAX_SEQUENCE + 1
+partidas são criadas no mesmo segundo, o gerador avança o timestamp
+lógico em vez de esperar o relógio.
+
+Nos textos (convites e botões de menu) o ID é mostrado em base 62
+(encode_game_id), o que deixa o ID com cerca de 7 caracteres.
+'''
+
+from datetime import datetime, timezone
+from threading import Lock
+from time import time
+from typing import Callable, Union
+
+
+GAME_ID_EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp()
+GAME_ID_ALPHABET = (
+    '0123456789'
+    'abcdefghijklmnopqrstuvwxyz'
+    'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+)
+GAME_ID_BASE = len(GAME_ID_ALPHABET)
+CHAR_TO_GAME_ID_DIGIT = {
+    char: index
+    for index, char in enumerate(GAME_ID_ALPHABET)
+}
+WORKER_BITS = 5
+SEQUENCE_BITS = 10
+MAX_WORKER_ID = (1 << WORKER_BITS) - 1
+MAX_SEQUENCE = (1 << SEQUENCE_BITS) - 1
+WORKER_SHIFT = SEQUENCE_BITS
+TIMESTAMP_SHIFT = WORKER_BITS + SEQUENCE_BITS
+# Os IDs são guardados como inteiros de 64 bits com sinal (ex: MongoDB).
+MAX_GAME_ID = (1 << 63) - 1
+
+
+class GameIdGenerator:
+    def __init__(
+        self,
+        worker_id: int = 0,
+        time_function: Callable[[], float] = time,
+    ):
+        self.time_function = time_function
+        self.last_timestamp = -1
+        self.sequence = 0
+        self.lock = Lock()
+        self.set_worker_id(worker_id)
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'worker_id={self.worker_id}, '
+            f'last_timestamp={self.last_timestamp}, '
+            f'sequence={self.sequence})'
+        )
+
+    def set_worker_id(self, worker_id: int):
+        '''Define o WORKER usado nos próximos IDs. Cada processo que cria
+        partidas deve usar um worker_id diferente.
+        '''
+
+        if not isinstance(worker_id, int):
+            raise TypeError(
+                f'worker_id precisa ser um inteiro ({type(worker_id)}).'
+            )
+        if not 0 <= worker_id <= MAX_WORKER_ID:
+            raise ValueError(
+                f'worker_id precisa estar entre 0 e {MAX_WORKER_ID} '
+                f'({worker_id}).'
+            )
+
+        with self.lock:
+            self.worker_id = worker_id
+
+    def get_timestamp(self) -> int:
+        return max(int(self.time_function() - GAME_ID_EPOCH), 0)
+
+    def next_id(self) -> int:
+        with self.lock:
+            timestamp = max(self.get_timestamp(), self.last_timestamp)
+            if timestamp == self.last_timestamp:
+                self.sequence += 1
+                if self.sequence > MAX_SEQUENCE:
+                    timestamp += 1
+                    self.sequence = 0
+            else:
+                self.sequence = 0
+            self.last_timestamp = timestamp
+
+            return (
+                (timestamp << TIMESTAMP_SHIFT) |
+                (self.worker_id << WORKER_SHIFT) |
+                self.sequence
+            )
+
+
+GAME_ID_GENERATOR = GameIdGenerator()
+
+
+def new_game_id() -> int:
+    return GAME_ID_GENERATOR.next_id()
+
+
+def encode_game_id(game_id: int) -> str:
+    '''Transforma o ID da partida em um texto curto em base 62.
+    '''
+
+    if not isinstance(game_id, int) or game_id < 0:
+        raise ValueError(
+            f'game_id precisa ser um inteiro não negativo ({game_id}).'
+        )
+
+    digits = []
+    while True:
+        game_id, digit = divmod(game_id, GAME_ID_BASE)
+        digits.append(GAME_ID_ALPHABET[digit])
+        if game_id == 0:
+            break
+
+    return ''.join(reversed(digits))
+
+
+def decode_game_id(game_id: Union[int, str]) -> int:
+    '''Transforma de volta o texto criado por encode_game_id no ID da
+    partida. Inteiros são retornados sem alteração.
+    Levanta ValueError se o texto for vazio, tiver caracteres fora do
+    GAME_ID_ALPHABET ou passar de MAX_GAME_ID.
+    '''
+
+    if isinstance(game_id, int):
+        return game_id
+    if not game_id:
+        raise ValueError('game_id vazio.')
+
+    number = 0
+    for char in game_id:
+        digit = CHAR_TO_GAME_ID_DIGIT.get(char)
+        if digit is None:
+            raise ValueError(f'game_id inválido: "{game_id}".')
+        number = number * GAME_ID_BASE + digit
+        if number > MAX_GAME_ID:
+            raise ValueError(f'game_id muito grande: "{game_id}".')
+
+    return number
+
+
+def get_game_id_timestamp(game_id: int) -> datetime:
+    '''Retorna a data de criação (UTC) de um ID de partida.
+    '''
+
+    timestamp = game_id >> TIMESTAMP_SHIFT
+
+    return datetime.fromtimestamp(GAME_ID_EPOCH + timestamp, tz=timezone.utc)
+
+
+def get_game_id_worker(game_id: int) -> int:
+    return (game_id >> WORKER_SHIFT) & MAX_WORKER_ID
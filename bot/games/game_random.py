@@ -0,0 +1,109 @@
+'''Gerador de números aleatórios de cada partida.
+
+Cada board tem o seu GameRandom, criado com uma seed própria e repassado
+para as pilhas (BaseDeck/Stack/Queue) e mãos (BaseHand) dela. Assim as
+partidas não dividem o estado do random global e podem ser reproduzidas
+a partir da seed (ver bot.games.journal).
+
+O gerador é o SplitMix64: o estado é um único inteiro de 64 bits, então
+ele cabe em poucos bytes no snapshot, ao contrário do Mersenne Twister do
+random.Random (624 inteiros).
+'''
+
+from os import urandom
+from random import Random
+from typing import List, MutableSequence, Optional, Tuple
+
+
+UINT64_MASK = (1 << 64) - 1
+SPLITMIX64_GAMMA = 0x9E3779B97F4A7C15
+SPLITMIX64_MULTIPLIER1 = 0xBF58476D1CE4E5B9
+SPLITMIX64_MULTIPLIER2 = 0x94D049BB133111EB
+FLOAT_MULTIPLIER = 1.0 / (1 << 53)
+
+
+def new_game_seed() -> int:
+    '''Retorna uma seed de 64 bits sorteada pelo sistema operacional.
+    '''
+
+    return int.from_bytes(urandom(8), 'big')
+
+
+class GameRandom(Random):
+    '''random.Random com o SplitMix64 no lugar do Mersenne Twister.
+
+    Os métodos herdados (randint, choice, sample...) usam o getrandbits
+    abaixo. O shuffle e o permutation, que sorteiam muitos índices de uma
+    vez, usam um random.Random (implementado em C) criado com o próximo
+    número do SplitMix64: é mais rápido que sortear cada índice em Python
+    e o estado da partida avança um único passo por embaralhamento.
+    '''
+
+    def __init__(self, seed: Optional[int] = None):
+        self.seed_value = 0
+        self.state = 0
+        super().__init__(seed)
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'seed={self.seed_value}, '
+            f'state={self.state})'
+        )
+
+    def seed(self, a: Optional[int] = None, version: int = 2):
+        if a is None:
+            a = new_game_seed()
+        if not isinstance(a, int):
+            raise TypeError(f'seed precisa ser um inteiro ({type(a)}).')
+
+        self.seed_value = a & UINT64_MASK
+        self.state = self.seed_value
+        self.gauss_next = None
+
+    def getstate(self) -> Tuple[int, int]:
+        return self.seed_value, self.state
+
+    def setstate(self, state: Tuple[int, int]):
+        self.seed_value, self.state = state
+        self.gauss_next = None
+
+    def next_uint64(self) -> int:
+        self.state = (self.state + SPLITMIX64_GAMMA) & UINT64_MASK
+        state = self.state
+        state = (state ^ (state >> 30)) * SPLITMIX64_MULTIPLIER1
+        state &= UINT64_MASK
+        state = (state ^ (state >> 27)) * SPLITMIX64_MULTIPLIER2
+        state &= UINT64_MASK
+
+        return state ^ (state >> 31)
+
+    def random(self) -> float:
+        return (self.next_uint64() >> 11) * FLOAT_MULTIPLIER
+
+    def getrandbits(self, k: int) -> int:
+        if k < 0:
+            raise ValueError('k precisa ser positivo.')
+
+        result = 0
+        bits = 0
+        while bits < k:
+            result |= self.next_uint64() << bits
+            bits += 64
+
+        return result & ((1 << k) - 1)
+
+    def shuffle(self, x: MutableSequence):
+        '''Embaralha x no lugar.
+        '''
+
+        Random(self.next_uint64()).shuffle(x)
+
+    def permutation(self, n: int) -> List[int]:
+        '''Retorna os inteiros de 0 a n - 1 embaralhados.
+        '''
+
+        index_list = list(range(n))
+        self.shuffle(index_list)
+
+        return index_list
@@ -1,13 +1,19 @@
 from collections.abc import Generator
-from random import randint
-from typing import List
+from random import Random, randint
+from typing import List, Optional
 from bot.games.cards.card import Card
 
 
 class BaseHand:
-    def __init__(self, *cards: Card, max_size: int = 0):
+    def __init__(
+        self,
+        *cards: Card,
+        max_size: int = 0,
+        random: Optional[Random] = None
+    ):
         self.max_size = max_size
         self.card_list = []
+        self.random = random
 
         self.add_card(*cards)
 
@@ -51,7 +57,7 @@ class BaseHand:
         card_list = []
         for _ in range(quantity):
             if index < 0 or quantity > 1:
-                index = randint(0, len(self) - 1)
+                index = self.randint(0, len(self) - 1)
 
             if len(self) > 0:
                 card = self.card_list.pop(index)
@@ -61,6 +67,19 @@ class BaseHand:
 
         return card_list
 
+    def set_random(self, random: Optional[Random]):
+        '''Define o Random usado nos descartes aleatórios. Se for None, usa
+        o random global.
+        '''
+
+        self.random = random
+
+    def randint(self, a: int, b: int) -> int:
+        if self.random is not None:
+            return self.random.randint(a, b)
+
+        return randint(a, b)
+
     def play(self, *indexes: int) -> List[Card]:
         cards = []
         indexes = sorted(indexes, reverse=True)
@@ -0,0 +1,207 @@
+'''Diário (journal) das ações de uma partida, usado para refazer a partida.
+
+O PlayJournal guarda o snapshot da partida no momento em que foi aberto
+(ver bot.games.snapshot) e, depois dele, cada ação aplicada na board:
+    ADD_PLAYER + ID + NOME + MESSAGE_ID
+    START
+    PLAY + JOGADOR + PLAY_DICT
+
+O JOGADOR é o índice dele na player_list + 1 ou 0 seguido do ID e do nome
+quando ele não está na partida (a jogada é recusada, mas o log precisa do
+nome). O PLAY_DICT é gravado com o callback_codec.
+
+A jogada só é gravada depois que o board.play retorna, então uma jogada
+que levanta um erro não entra no diário. As jogadas recusadas pelo
+board.play (ex: fora da vez) são gravadas, pois elas adicionam um registro
+ao log da partida, que faz parte do snapshot. No replay, elas alteram
+somente o log.
+
+O replay restaura o snapshot, que inclui a seed e o estado do GameRandom
+da partida, e aplica as ações de novo, sem o Telegram, recriando o mesmo
+estado da partida para recuperar partidas, reproduzir bugs e gerar dados
+para benchmarks.
+'''
+
+from typing import Callable, Iterator, Optional, Tuple
+
+from bot.games.boards import snapshot_board_factory
+from bot.games.boards.board import BaseBoard
+from bot.games.buttons.callback_codec import (
+    decode_callback_data,
+    encode_callback_data
+)
+from bot.games.player import Player
+from bot.games.snapshot import BinaryReader, BinaryWriter
+
+
+JOURNAL_VERSION = 1
+JOURNAL_ADD_PLAYER = 1
+JOURNAL_START = 2
+JOURNAL_PLAY = 3
+
+
+class PlayJournal:
+    '''Diário só de inclusão (append-only) das ações de uma partida.
+    '''
+
+    def __init__(self, base: bytes, entries: bytes = b'', total: int = 0):
+        self.base = bytes(base)
+        self.writer = BinaryWriter()
+        self.writer.buffer.extend(entries)
+        self.total = total
+
+    def __len__(self) -> int:
+        return self.total
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}('
+            f'total={self.total}, '
+            f'size={len(self.base) + len(self.writer)})'
+        )
+
+    @classmethod
+    def from_board(cls, board: BaseBoard) -> 'PlayJournal':
+        '''Abre um diário a partir do estado atual da partida.
+        '''
+
+        return cls(base=board.to_snapshot())
+
+    def append_add_player(self, player: Player):
+        self.writer.write_uint(JOURNAL_ADD_PLAYER)
+        self.writer.write_player_id(player.id)
+        self.writer.write_str(player.name)
+        self.writer.write_optional_uint(player.message_id)
+        self.total += 1
+
+    def append_start(self):
+        self.writer.write_uint(JOURNAL_START)
+        self.total += 1
+
+    def encode_play(
+        self,
+        board: BaseBoard,
+        player: Player,
+        play_dict: dict
+    ) -> bytes:
+        '''Retorna a jogada no formato do diário, sem gravá-la. Deve ser
+        chamada antes do board.play, pois o índice do jogador é o da
+        player_list no momento da jogada (ver append_encoded_play).
+        '''
+
+        writer = BinaryWriter()
+        board_player = board.get_player(player)
+        writer.write_uint(JOURNAL_PLAY)
+        if board_player is not None:
+            writer.write_uint(board.player_list.index(board_player) + 1)
+        else:
+            writer.write_uint(0)
+            writer.write_player_id(player.id)
+            writer.write_str(player.name)
+        writer.write_str(encode_callback_data(play_dict))
+
+        return writer.getvalue()
+
+    def append_encoded_play(self, entry: bytes):
+        '''Grava uma jogada criada pelo encode_play. Deve ser chamada depois
+        que o board.play retornar.
+        '''
+
+        self.writer.buffer.extend(entry)
+        self.total += 1
+
+    def append_play(self, board: BaseBoard, player: Player, play_dict: dict):
+        '''Grava a jogada. Deve ser chamada antes do board.play, pois o
+        índice do jogador é o da player_list no momento da jogada.
+        '''
+
+        self.append_encoded_play(
+            self.encode_play(board=board, player=player, play_dict=play_dict)
+        )
+
+    def iter_entries(self) -> Iterator[Tuple[int, Optional[tuple]]]:
+        '''Retorna as ações gravadas como (tipo, argumentos).
+        '''
+
+        reader = BinaryReader(self.writer.getvalue())
+        while not reader.is_finished:
+            kind = reader.read_uint()
+            if kind == JOURNAL_ADD_PLAYER:
+                player_id = reader.read_player_id()
+                name = reader.read_str()
+                message_id = reader.read_optional_uint()
+                yield kind, (player_id, name, message_id)
+            elif kind == JOURNAL_START:
+                yield kind, None
+            elif kind == JOURNAL_PLAY:
+                player_index = reader.read_uint()
+                if player_index == 0:
+                    player = (reader.read_player_id(), reader.read_str())
+                else:
+                    player = player_index - 1
+                yield kind, (player, decode_callback_data(reader.read_str()))
+            else:
+                raise ValueError(f'Tipo de ação inválido no diário: {kind}.')
+
+    def replay(
+        self,
+        limit: int = None,
+        board_factory: Callable[[bytes], BaseBoard] = snapshot_board_factory,
+    ) -> BaseBoard:
+        '''Recria a partida aplicando as primeiras limit ações (todas se
+        limit for None) sobre o snapshot inicial, criado com o
+        board_factory (ex: o restore_game, que também define as funções
+        formatadoras da partida).
+        '''
+
+        board = board_factory(self.base)
+        for index, (kind, args) in enumerate(self.iter_entries()):
+            if limit is not None and index >= limit:
+                break
+
+            if kind == JOURNAL_ADD_PLAYER:
+                player_id, name, message_id = args
+                board.add_player(Player(
+                    player_id=player_id,
+                    name=name,
+                    message_id=message_id,
+                ))
+            elif kind == JOURNAL_START:
+                board.start()
+            elif kind == JOURNAL_PLAY:
+                player, play_dict = args
+                if isinstance(player, int):
+                    player = board.player_list[player]
+                else:
+                    player = Player(player_id=player[0], name=player[1])
+                board.play(player=player, play_dict=play_dict)
+
+        return board
+
+    def to_bytes(self) -> bytes:
+        writer = BinaryWriter()
+        writer.write_uint(JOURNAL_VERSION)
+        writer.write_uint(len(self.base))
+        writer.buffer.extend(self.base)
+        writer.write_uint(self.total)
+        writer.buffer.extend(self.writer.buffer)
+
+        return writer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'PlayJournal':
+        '''Carrega um diário gravado pelo to_bytes.
+        Levanta ValueError se os dados forem inválidos.
+        '''
+
+        reader = BinaryReader(data)
+        version = reader.read_uint()
+        if version != JOURNAL_VERSION:
+            raise ValueError(
+                f'Versão de diário não suportada: {version} '
+                f'(esperada: {JOURNAL_VERSION}).'
+            )
+        base = reader.read_bytes(reader.read_uint())
+        total = reader.read_uint()
+
+        return cls(base=base, entries=reader.data[reader.index:], total=total)
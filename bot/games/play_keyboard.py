@@ -1,8 +1,9 @@
 from operator import attrgetter
-from typing import List
+from typing import List, Optional
 
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 
+from bot.games.buttons.payload_store import CallbackPayloadStore
 from bot.games.buttons.play_button import PlayButton
 
 
@@ -45,7 +46,10 @@ class PlayKeyBoard:
             )
         self.play_button_list.append(button)
 
-    def make_buttons(self) -> List[List[InlineKeyboardButton]]:
+    def make_buttons(
+        self,
+        payload_store: Optional[CallbackPayloadStore] = None,
+    ) -> List[List[InlineKeyboardButton]]:
         button_lists = []
         sorted_play_button_list = sorted(
             self.play_button_list,
@@ -61,13 +65,16 @@ class PlayKeyBoard:
                 row = []
                 button_lists.append(row)
 
-            row.append(play_button.make_button())
+            row.append(play_button.make_button(payload_store=payload_store))
             i += 1
 
         return button_lists
 
-    def make_keyboard(self) -> InlineKeyboardMarkup:
-        button_lists = self.make_buttons()
+    def make_keyboard(
+        self,
+        payload_store: Optional[CallbackPayloadStore] = None,
+    ) -> InlineKeyboardMarkup:
+        button_lists = self.make_buttons(payload_store=payload_store)
 
         return InlineKeyboardMarkup(button_lists)
 
@@ -79,5 +86,8 @@ class InviteKeyBoard(PlayKeyBoard):
     def __str__(self) -> str:
         return f'{self.keyboard}'
 
-    def make_keyboard(self) -> InlineKeyboardMarkup:
+    def make_keyboard(
+        self,
+        payload_store: Optional[CallbackPayloadStore] = None,
+    ) -> InlineKeyboardMarkup:
         return self.keyboard
@@ -0,0 +1,391 @@
+'''Formato binário compacto usado para salvar o estado das partidas.
+
+Formato (versão 2, a versão 1 não tinha o estado do GameRandom):
+    VERSÃO + SNAPSHOT_ID DA BOARD + CAMPOS DA BOARD
+
+Os campos são gravados na ordem definida pelos métodos write_snapshot e
+read_snapshot de cada board. Inteiros são varints (LEB128, com zigzag
+quando aceitam negativos) e strings são o tamanho em bytes seguido do
+texto em UTF-8.
+
+Cada carta é gravada como:
+    CABEÇALHO + ÍNDICE DO NAME + ÍNDICE DO SUIT [+ WILD NAME + WILD SUIT]
+
+O cabeçalho é 0 para posições vazias (ex: buracos do Golf Solitaire) ou
+o índice da classe da carta em CARD_CLASS_LIST + 1, deslocado 1 bit para
+a esquerda, com o bit menor indicando se a carta tem valores wild. Os
+índices de Names e Suits são posições em NAME_LIST e SUIT_LIST, que
+juntam os membros de todas as classes de NAMES_CLASS_LIST e
+SUITS_CLASS_LIST. Novas classes devem ser adicionadas no FINAL dessas
+listas; qualquer outra alteração de ordem exige um novo SNAPSHOT_VERSION.
+'''
+
+from typing import Dict, List, Optional, Sequence, Type
+
+from bot.games.cards.card import Card
+from bot.games.cards.nine_nine import NineNineCard
+from bot.games.cards.scoundrel import ScoundrelCard
+from bot.games.enums.card import (
+    ColorNames,
+    ColorSuits,
+    ElementalSuits,
+    FlipColorNames,
+    FlipColorSuits,
+    FullRoyalNames,
+    FullRoyalSuits,
+    Names,
+    NineNineNames,
+    NineNineSuits,
+    RoyalNames,
+    RoyalSuits,
+    SpanishNames,
+    SpanishSuits,
+    StrippedSpanishNames,
+    Suits
+)
+from bot.games.hands.hand import BaseHand
+from bot.games.player import Player
+from bot.games.report import Report
+
+
+SNAPSHOT_VERSION = 2
+CARD_CLASS_LIST: List[Type[Card]] = [
+    Card,
+    ScoundrelCard,
+    NineNineCard,
+]
+NAMES_CLASS_LIST: List[Type[Names]] = [
+    RoyalNames,
+    FullRoyalNames,
+    ColorNames,
+    FlipColorNames,
+    SpanishNames,
+    StrippedSpanishNames,
+    NineNineNames,
+]
+SUITS_CLASS_LIST: List[Type[Suits]] = [
+    RoyalSuits,
+    FullRoyalSuits,
+    SpanishSuits,
+    ColorSuits,
+    FlipColorSuits,
+    ElementalSuits,
+    NineNineSuits,
+]
+NAME_LIST: List[Names] = [
+    name
+    for names_class in NAMES_CLASS_LIST
+    for name in names_class
+]
+SUIT_LIST: List[Suits] = [
+    suit
+    for suits_class in SUITS_CLASS_LIST
+    for suit in suits_class
+]
+CARD_CLASS_TO_INDEX: Dict[Type[Card], int] = {
+    card_class: index
+    for index, card_class in enumerate(CARD_CLASS_LIST)
+}
+NAME_TO_INDEX: Dict[Names, int] = {
+    name: index
+    for index, name in enumerate(NAME_LIST)
+}
+SUIT_TO_INDEX: Dict[Suits, int] = {
+    suit: index
+    for index, suit in enumerate(SUIT_LIST)
+}
+EMPTY_CARD_HEADER = 0
+WILD_CARD_FLAG = 1
+
+
+class BinaryWriter:
+    '''Escreve varints, strings, cartas e jogadores em um bytearray.
+    '''
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    def getvalue(self) -> bytes:
+        return bytes(self.buffer)
+
+    def write_uint(self, value: int):
+        if value < 0:
+            raise ValueError(f'value precisa ser positivo ({value}).')
+
+        while value >= 0x80:
+            self.buffer.append((value & 0x7F) | 0x80)
+            value >>= 7
+        self.buffer.append(value)
+
+    def write_int(self, value: int):
+        self.write_uint(value * 2 if value >= 0 else -value * 2 - 1)
+
+    def write_bool(self, value: bool):
+        self.buffer.append(1 if value else 0)
+
+    def write_optional_uint(self, value: Optional[int]):
+        self.write_uint(0 if value is None else value + 1)
+
+    def write_str(self, value: str):
+        data = value.encode('utf-8')
+        self.write_uint(len(data))
+        self.buffer.extend(data)
+
+    def write_uint_list(self, value_list: Sequence[int]):
+        self.write_uint(len(value_list))
+        for value in value_list:
+            self.write_uint(value)
+
+    def write_card(self, card: Optional[Card]):
+        if card is None:
+            self.buffer.append(EMPTY_CARD_HEADER)
+            return
+
+        card_class_index = CARD_CLASS_TO_INDEX.get(card.__class__)
+        if card_class_index is None:
+            raise TypeError(
+                f'{card.__class__.__name__} não pode ser gravada no snapshot.'
+            )
+
+        is_wild = card.wild_name is not None or card.wild_suit is not None
+        self.write_uint((card_class_index + 1) << 1 | is_wild)
+        self.write_uint(NAME_TO_INDEX[card.real_name])
+        self.write_uint(SUIT_TO_INDEX[card.real_suit])
+        if is_wild:
+            self.write_optional_uint(
+                None if card.wild_name is None
+                else NAME_TO_INDEX[card.wild_name]
+            )
+            self.write_optional_uint(
+                None if card.wild_suit is None
+                else SUIT_TO_INDEX[card.wild_suit]
+            )
+
+    def write_cards(self, card_list: Sequence[Optional[Card]]):
+        self.write_uint(len(card_list))
+        for card in card_list:
+            self.write_card(card)
+
+    def write_player_id(self, player_id: str):
+        '''Grava os IDs numéricos (IDs do Telegram) como varint e os outros
+        como string. O bit menor indica qual dos dois foi usado.
+        '''
+
+        if player_id.isdigit() and str(int(player_id)) == player_id:
+            self.write_uint(int(player_id) << 1)
+        else:
+            data = player_id.encode('utf-8')
+            self.write_uint(len(data) << 1 | 1)
+            self.buffer.extend(data)
+
+    def write_player(self, player: Player):
+        self.write_player_id(player.id)
+        self.write_str(player.name)
+        self.write_optional_uint(player.message_id)
+        self.write_uint(player.hand.max_size)
+        self.write_cards(player.hand.card_list)
+
+    def write_report(self, report: Report, player_list: List[Player]):
+        '''Grava o Report. O jogador do Report é gravado como o índice dele
+        em player_list + 1, 0 para None ou, se ele não estiver mais na
+        partida, len(player_list) + 1 seguido do ID e do nome.
+        '''
+
+        self.write_str(report.action)
+        self.write_int(report.turn)
+        player = report.player
+        if player is None:
+            self.write_uint(0)
+        else:
+            index = next(
+                (
+                    index
+                    for index, board_player in enumerate(player_list)
+                    if board_player is player
+                ),
+                None
+            )
+            if index is not None:
+                self.write_uint(index + 1)
+            else:
+                self.write_uint(len(player_list) + 1)
+                self.write_player_id(player.id)
+                self.write_str(player.name)
+
+        hours, minutes, seconds = report.created_at.split(':')
+        self.write_uint(int(hours) * 3600 + int(minutes) * 60 + int(seconds))
+
+
+class SnapshotWriter(BinaryWriter):
+    '''Escreve os campos de um snapshot depois do cabeçalho.
+    '''
+
+    def __init__(self, board_id: int):
+        super().__init__()
+        self.write_uint(SNAPSHOT_VERSION)
+        self.write_uint(board_id)
+
+
+class BinaryReader:
+    '''Lê os campos gravados pelo BinaryWriter.
+    Levanta ValueError se os dados forem inválidos.
+    '''
+
+    def __init__(self, data: bytes):
+        self.data = bytes(data)
+        self.index = 0
+
+    @property
+    def is_finished(self) -> bool:
+        return self.index >= len(self.data)
+
+    def read_byte(self) -> int:
+        if self.index >= len(self.data):
+            raise ValueError('Dados incompletos.')
+
+        byte = self.data[self.index]
+        self.index += 1
+
+        return byte
+
+    def read_uint(self) -> int:
+        value = 0
+        shift = 0
+        while True:
+            byte = self.read_byte()
+            value |= (byte & 0x7F) << shift
+            shift += 7
+            if not byte & 0x80:
+                return value
+
+    def read_int(self) -> int:
+        value = self.read_uint()
+
+        return value >> 1 if not value & 1 else -(value >> 1) - 1
+
+    def read_bool(self) -> bool:
+        return self.read_byte() != 0
+
+    def read_optional_uint(self) -> Optional[int]:
+        value = self.read_uint()
+
+        return None if value == 0 else value - 1
+
+    def read_bytes(self, size: int) -> bytes:
+        end = self.index + size
+        if end > len(self.data):
+            raise ValueError('Dados incompletos.')
+
+        data = self.data[self.index:end]
+        self.index = end
+
+        return data
+
+    def read_str(self) -> str:
+        size = self.read_uint()
+
+        return self.read_bytes(size).decode('utf-8')
+
+    def read_uint_list(self) -> List[int]:
+        return [self.read_uint() for _ in range(self.read_uint())]
+
+    def read_card(self) -> Optional[Card]:
+        header = self.read_uint()
+        if header == EMPTY_CARD_HEADER:
+            return None
+
+        try:
+            card_class = CARD_CLASS_LIST[(header >> 1) - 1]
+            name = NAME_LIST[self.read_uint()]
+            suit = SUIT_LIST[self.read_uint()]
+        except IndexError as error:
+            raise ValueError(f'Carta inválida ({error}).')
+
+        card = card_class(name=name, suit=suit)
+        if header & WILD_CARD_FLAG:
+            wild_name_index = self.read_optional_uint()
+            wild_suit_index = self.read_optional_uint()
+            if wild_name_index is not None:
+                card.wild_name = NAME_LIST[wild_name_index]
+            if wild_suit_index is not None:
+                card.wild_suit = SUIT_LIST[wild_suit_index]
+
+        return card
+
+    def read_cards(self) -> List[Optional[Card]]:
+        return [self.read_card() for _ in range(self.read_uint())]
+
+    def read_player_id(self) -> str:
+        value = self.read_uint()
+        if not value & 1:
+            return str(value >> 1)
+
+        return self.read_bytes(value >> 1).decode('utf-8')
+
+    def read_player(self) -> Player:
+        player_id = self.read_player_id()
+        name = self.read_str()
+        message_id = self.read_optional_uint()
+        hand = BaseHand(max_size=self.read_uint())
+        hand.card_list = self.read_cards()
+
+        return Player(
+            player_id=player_id,
+            name=name,
+            hand=hand,
+            message_id=message_id,
+        )
+
+    def read_report(self, player_list: List[Player]) -> Report:
+        action = self.read_str()
+        turn = self.read_int()
+        player_index = self.read_uint()
+        if player_index == 0:
+            player = None
+        elif player_index <= len(player_list):
+            player = player_list[player_index - 1]
+        else:
+            player = Player(
+                player_id=self.read_player_id(),
+                name=self.read_str(),
+            )
+
+        report = Report(action=action, turn=turn, player=player)
+        minutes, seconds = divmod(self.read_uint(), 60)
+        hours, minutes = divmod(minutes, 60)
+        report.created_at = f'{hours:02}:{minutes:02}:{seconds:02}'
+
+        return report
+
+    def check_end(self):
+        if self.index != len(self.data):
+            raise ValueError(
+                f'Dados com {len(self.data) - self.index} bytes extras.'
+            )
+
+
+class SnapshotReader(BinaryReader):
+    '''Lê os campos de um snapshot criado pelo SnapshotWriter.
+    Levanta ValueError se o snapshot for inválido.
+    '''
+
+    def __init__(self, data: bytes):
+        super().__init__(data)
+
+        version = self.read_uint()
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(
+                f'Versão de snapshot não suportada: {version} '
+                f'(esperada: {SNAPSHOT_VERSION}).'
+            )
+        self.board_id = self.read_uint()
+
+
+def get_snapshot_board_id(data: bytes) -> int:
+    '''Retorna o SNAPSHOT_ID da board gravada no snapshot.
+    '''
+
+    return SnapshotReader(data).board_id
@@ -0,0 +1,120 @@
+from array import array
+from collections.abc import Generator
+from random import Random, shuffle
+from typing import List, Optional, Union
+
+from bot.games.cards.card import Card
+from bot.games.cards.card_code import (
+    CARD_CODE_FACE_LIST,
+    CARD_CODE_TYPECODE,
+    decode_card,
+    encode_card
+)
+from bot.games.structure.linear_data import LinearDataStructure
+
+
+class ArrayStack(LinearDataStructure):
+    '''Pilha com as cartas guardadas como códigos (ver
+    bot.games.cards.card_code) em um array de uint16.
+    O topo é o final do array, como no Stack.
+
+    As cartas só são criadas quando saem da pilha (pop, peek, iteração),
+    os métodos *_codes trabalham direto com os códigos.
+    '''
+
+    def __init__(self, *cards: Card, random: Optional[Random] = None):
+        super().__init__(random=random)
+        self.items = array(CARD_CODE_TYPECODE)
+
+        self.push(*cards)
+
+    def __iter__(self) -> Generator[Card]:
+        for code in reversed(self.items):
+            yield decode_card(code)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Card, List[Card]]:
+        reversed_items = self.items[::-1]
+        if isinstance(index, slice):
+            return [decode_card(code) for code in reversed_items[index]]
+
+        return decode_card(reversed_items[index])
+
+    def shuffle(self):
+        '''Embaralha uma lista com os códigos, que é mais rápido que
+        trocar os itens do array um a um (o Fisher-Yates do Random.shuffle
+        roda em Python e cada acesso ao array cria um int). A ordem é a
+        mesma do Stack com o mesmo random.
+        '''
+
+        code_list = self.items.tolist()
+        if self.random is not None:
+            self.random.shuffle(code_list)
+        else:
+            shuffle(code_list)
+        self.items = array(CARD_CODE_TYPECODE, code_list)
+
+    def push(self, *cards: Card):
+        self.items.extend([encode_card(card) for card in cards])
+
+    def push_bottom(self, *cards: Card):
+        self.items[0:0] = array(
+            CARD_CODE_TYPECODE,
+            [encode_card(card) for card in cards],
+        )
+
+    def push_codes(self, *codes: int):
+        self.items.extend(codes)
+
+    def pop(self, quantity: int = 1) -> Union[Card, List[Card]]:
+        if quantity == 1 and not self.is_empty:
+            return decode_card(self.items.pop())
+        elif quantity > 1 and not self.is_empty:
+            return list(map(decode_card, self.pop_codes(quantity)))
+        else:
+            return None
+
+    def pop_codes(self, quantity: int = 1) -> array:
+        '''Remove e retorna os códigos das quantity cartas do topo, na
+        ordem em que sairiam da pilha.
+        '''
+
+        if quantity < 1:
+            return array(CARD_CODE_TYPECODE)
+
+        popped_codes = self.items[-quantity:]
+        del self.items[-quantity:]
+        popped_codes.reverse()
+
+        return popped_codes
+
+    def peek(self, quantity: int = 1) -> Union[Card, List[Card]]:
+        if quantity == 1 and not self.is_empty:
+            return decode_card(self.items[-1])
+        elif quantity > 1 and not self.is_empty:
+            peeked_codes = self.items[-quantity:]
+            return [decode_card(code) for code in reversed(peeked_codes)]
+        else:
+            return None
+
+    def peek_bottom(self, quantity: int = 1) -> Union[Card, List[Card]]:
+        if quantity == 1 and not self.is_empty:
+            return decode_card(self.items[0])
+        elif quantity > 1 and not self.is_empty:
+            return [decode_card(code) for code in self.items[:quantity]]
+        else:
+            return None
+
+    @property
+    def text_horizontal(self) -> str:
+        return ' '.join(self.text_lazy)
+
+    @property
+    def text_vertical(self) -> str:
+        return '\n'.join(self.text_lazy)
+
+    @property
+    def text_lazy(self) -> Generator[str]:
+        return (
+            CARD_CODE_FACE_LIST[code].text
+            for code in reversed(self.items)
+        )
@@ -1,14 +1,15 @@
 from abc import ABC, abstractmethod
 from collections.abc import Generator
-from random import shuffle
-from typing import List, Union
+from random import Random, shuffle
+from typing import List, Optional, Union
 
 from bot.games.cards.card import Card
 
 
 class LinearDataStructure(ABC):
-    def __init__(self, *cards: Card):
+    def __init__(self, *cards: Card, random: Optional[Random] = None):
         self.items = []
+        self.random = random
 
         for card in cards:
             self.push(card)
@@ -25,8 +26,18 @@ class LinearDataStructure(ABC):
     def __len__(self) -> int:
         return len(self.items)
 
+    def set_random(self, random: Optional[Random]):
+        '''Define o Random usado no shuffle. Se for None, usa o random
+        global.
+        '''
+
+        self.random = random
+
     def shuffle(self):
-        shuffle(self.items)
+        if self.random is not None:
+            self.random.shuffle(self.items)
+        else:
+            shuffle(self.items)
 
     @abstractmethod
     def push(self, *cards: Card):
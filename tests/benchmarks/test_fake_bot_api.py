@@ -0,0 +1,86 @@
+import unittest
+
+from telegram import Bot, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.error import BadRequest, RetryAfter
+
+from benchmarks.fake_bot_api import FAKE_BOT_USERNAME, FakeBotApiRequest
+
+
+class TestFakeBotApiRequest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.request = FakeBotApiRequest(seed=1)
+        self.bot = Bot(
+            token='123:FAKE',
+            request=self.request,
+            get_updates_request=self.request,
+        )
+        await self.bot.initialize()
+
+    async def asyncTearDown(self):
+        await self.bot.shutdown()
+
+    def test_init_invalid_retry_after_rate(self):
+        with self.assertRaises(ValueError):
+            FakeBotApiRequest(retry_after_rate=2)
+
+    async def test_get_me(self):
+        self.assertEqual(self.bot.username, FAKE_BOT_USERNAME)
+
+    async def test_send_and_edit_message(self):
+        reply_markup = InlineKeyboardMarkup(
+            [[InlineKeyboardButton('A', callback_data='A')]]
+        )
+        message = await self.bot.send_message(
+            chat_id=1,
+            text='texto',
+            reply_markup=reply_markup,
+        )
+        self.assertEqual(message.text, 'texto')
+        self.assertEqual(
+            self.request.get_last_message(1)['message_id'],
+            message.message_id
+        )
+
+        message = await self.bot.edit_message_text(
+            chat_id=1,
+            message_id=message.message_id,
+            text='novo texto',
+        )
+        self.assertEqual(message.text, 'novo texto')
+        self.assertEqual(self.request.call_counter['editMessageText'], 1)
+
+    async def test_edit_message_not_modified(self):
+        '''Teste se editar uma mensagem sem mudanças gera BadRequest, como
+        no Telegram.
+        '''
+
+        message = await self.bot.send_message(chat_id=1, text='texto')
+        with self.assertRaises(BadRequest):
+            await self.bot.edit_message_text(
+                chat_id=1,
+                message_id=message.message_id,
+                text='texto',
+            )
+        with self.assertRaises(BadRequest):
+            await self.bot.edit_message_text(
+                chat_id=1,
+                message_id=999999,
+                text='texto',
+            )
+
+    async def test_delete_message_and_answer(self):
+        message = await self.bot.send_message(chat_id=1, text='texto')
+        self.assertTrue(
+            await self.bot.delete_message(
+                chat_id=1,
+                message_id=message.message_id
+            )
+        )
+        self.assertIsNone(self.request.get_last_message(1))
+        self.assertTrue(await self.bot.answer_callback_query('1'))
+
+    async def test_retry_after(self):
+        self.request.retry_after_rate = 1
+        with self.assertRaises(RetryAfter):
+            await self.bot.send_message(chat_id=1, text='texto')
+        self.assertEqual(self.request.retry_after_counter['sendMessage'], 1)
@@ -0,0 +1,89 @@
+import asyncio
+import unittest
+
+from unittest.mock import patch
+
+from benchmarks.load_driver import (
+    LoadDriver,
+    get_callback_data_list,
+    get_percentile,
+    has_game_buttons
+)
+
+
+class TestLoadDriverFunctions(unittest.TestCase):
+    def test_get_percentile(self):
+        value_list = list(range(1, 101))
+        self.assertEqual(get_percentile(value_list, 50), 50)
+        self.assertEqual(get_percentile(value_list, 99), 99)
+        self.assertEqual(get_percentile([], 50), 0)
+
+    def test_get_callback_data_list(self):
+        message = {
+            'reply_markup': {
+                'inline_keyboard': [
+                    [{'text': 'A', 'callback_data': '@start_1'}],
+                    [{'text': 'B', 'callback_data': '@close'}],
+                    [{'text': 'C', 'url': 'https://t.me'}],
+                ]
+            }
+        }
+        self.assertEqual(
+            get_callback_data_list(message, prefix='@start_'),
+            ['@start_1']
+        )
+        self.assertEqual(len(get_callback_data_list(message)), 2)
+        self.assertEqual(get_callback_data_list(None), [])
+
+    def test_has_game_buttons(self):
+        def make_message(callback_data: str) -> dict:
+            return {
+                'reply_markup': {
+                    'inline_keyboard': [
+                        [{'text': 'A', 'callback_data': callback_data}],
+                    ]
+                }
+            }
+
+        self.assertTrue(has_game_buttons(make_message('@start_1')))
+        self.assertFalse(has_game_buttons(make_message('@list_party_game')))
+        self.assertFalse(has_game_buttons({}))
+
+
+class TestLoadDriverWaitMessage(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.load_driver = LoadDriver(seed=1)
+        self.bot = self.load_driver.application.bot
+        await self.bot.initialize()
+
+    async def asyncTearDown(self):
+        await self.bot.shutdown()
+
+    async def test_wait_message(self):
+        '''Teste se a mensagem enviada depois do início da espera é
+        retornada.
+        '''
+
+        async def send_later():
+            await asyncio.sleep(0.05)
+            await self.bot.send_message(chat_id=1, text='ruim')
+            await asyncio.sleep(0.05)
+            await self.bot.send_message(chat_id=1, text='pronta')
+
+        task = asyncio.create_task(send_later())
+        message = await self.load_driver.wait_message(
+            1,
+            is_ready=lambda message: message['text'] == 'pronta',
+        )
+        await task
+
+        self.assertEqual(message['text'], 'pronta')
+
+    async def test_wait_message_timeout(self):
+        await self.bot.send_message(chat_id=1, text='ruim')
+        with patch('benchmarks.load_driver.MESSAGE_TIMEOUT', 0.05):
+            with self.assertRaises(TimeoutError):
+                await self.load_driver.wait_message(
+                    1,
+                    is_ready=lambda message: message['text'] == 'pronta',
+                )
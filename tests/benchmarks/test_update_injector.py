@@ -0,0 +1,111 @@
+import unittest
+
+from unittest.mock import patch
+
+from telegram import Bot, Update, User
+from telegram.ext import (
+    Application,
+    CallbackQueryHandler,
+    CommandHandler,
+    ContextTypes
+)
+
+from benchmarks.update_injector import (
+    create_callback_query_update,
+    create_command_update,
+    inject_update
+)
+
+
+class TestUpdateInjector(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.application = Application.builder().token('123:ABC').build()
+        self.received = []
+
+        async def callback(
+            update: Update,
+            context: ContextTypes.DEFAULT_TYPE
+        ):
+            self.received.append(update)
+
+        self.application.add_handler(CommandHandler('start', callback))
+        self.application.add_handler(
+            CallbackQueryHandler(callback, pattern='^PLAY')
+        )
+
+        # initialize chama get_me, então a chamada é simulada para que o
+        # teste não use a rede.
+        bot_user = User(
+            id=123,
+            first_name='Ludus',
+            is_bot=True,
+            username='ludus_bot'
+        )
+
+        async def get_me(bot: Bot, *args, **kwargs) -> User:
+            bot._bot_user = bot_user
+            return bot_user
+
+        with patch.object(Bot, 'get_me', new=get_me):
+            await self.application.initialize()
+
+    async def asyncTearDown(self):
+        await self.application.shutdown()
+
+    def test_create_command_update(self):
+        update = create_command_update(user_id=1, text='/start invite_1')
+        self.assertEqual(update.effective_user.id, 1)
+        self.assertEqual(update.effective_chat.id, 1)
+        self.assertEqual(update.effective_message.text, '/start invite_1')
+
+    def test_create_callback_query_update(self):
+        update = create_callback_query_update(
+            user_id=2,
+            data='PLAY',
+            message_id=10
+        )
+        self.assertEqual(update.callback_query.data, 'PLAY')
+        self.assertEqual(update.effective_message.message_id, 10)
+        self.assertNotEqual(
+            update.update_id,
+            create_callback_query_update(user_id=2, data='PLAY').update_id
+        )
+
+    def test_update_to_dict_roundtrip(self):
+        '''Teste se o update pode ser serializado como o servidor de
+        webhook recebe.
+        '''
+
+        update = create_callback_query_update(user_id=3, data='PLAY')
+        new_update = Update.de_json(update.to_dict(), bot=None)
+        self.assertEqual(new_update.callback_query.data, 'PLAY')
+
+    async def test_inject_update(self):
+        '''Teste se os updates injetados chegam aos handlers sem rede.
+        '''
+
+        await inject_update(
+            application=self.application,
+            update=create_command_update(user_id=1, text='/start'),
+        )
+        await inject_update(
+            application=self.application,
+            update=create_callback_query_update(user_id=1, data='PLAY'),
+        )
+        await inject_update(
+            application=self.application,
+            update=create_callback_query_update(user_id=1, data='OTHER'),
+        )
+        self.assertEqual(len(self.received), 2)
+
+    async def test_inject_update_queue(self):
+        update = create_command_update(user_id=1, text='/start')
+        await inject_update(
+            application=self.application,
+            update=update,
+            wait=False,
+        )
+        queued_update = await self.application.update_queue.get()
+        self.assertEqual(queued_update.update_id, update.update_id)
+        self.assertIs(queued_update.get_bot(), self.application.bot)
+        self.assertEqual(self.received, [])
@@ -0,0 +1,46 @@
+import os
+import unittest
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+os.environ.setdefault('BOT_USERNAME', 'ludus_bot')
+
+from bot.conversations.choice_game import invite_game  # noqa
+
+
+class TestInviteGame(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.context = MagicMock()
+        self.context.bot_data = {}
+        self.update = MagicMock()
+        self.update.effective_user.id = 1
+        self.update.effective_message.date = datetime.now(timezone.utc)
+
+    @patch(
+        'bot.conversations.choice_game.send_private_message',
+        new_callable=AsyncMock,
+    )
+    async def test_invalid_game_id(self, send_private_message_mock):
+        '''Teste se um convite com um ID inválido ou adulterado responde que
+        a partida não foi encontrada.
+        '''
+
+        for arg_text in ('invite_abc-1', 'invite_', 'invite_' + 'z' * 20):
+            self.context.args = [arg_text]
+            await invite_game(self.update, self.context)
+
+            send_private_message_mock.assert_awaited_once()
+            self.assertEqual(
+                send_private_message_mock.call_args.kwargs['function_caller'],
+                'INVITE_GAME(GAME_NOT_FOUND)',
+            )
+            self.assertEqual(
+                send_private_message_mock.call_args.kwargs['text'],
+                'Partida não encontrada.',
+            )
+            send_private_message_mock.reset_mock()
+
+
+if __name__ == '__main__':
+    unittest.main()
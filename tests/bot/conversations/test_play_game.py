@@ -0,0 +1,72 @@
+import os
+import unittest
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+os.environ.setdefault('BOT_USERNAME', 'ludus_bot')
+
+from bot.conversations.play_game import (  # noqa
+    EXPIRED_BUTTON_TEXT,
+    get_play_dict
+)
+from bot.functions.buttons import get_callback_payload_store  # noqa
+from bot.games.buttons.play_button import PlayButton  # noqa
+from bot.games.enums.command import CallbackKeyEnum, CommandEnum  # noqa
+
+
+GAME_ID = 140_234_567_890_123
+
+
+def create_update(data: str):
+    return SimpleNamespace(callback_query=SimpleNamespace(data=data))
+
+
+class TestGetPlayDict(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.context = MagicMock()
+        self.context.bot_data = {}
+        self.callback_data = {
+            CallbackKeyEnum.COMMAND: CommandEnum.SELECT_COLOR.name,
+            CallbackKeyEnum.GAME_ID: GAME_ID,
+            CallbackKeyEnum.SELECTED_COLOR: 'A' * 80,
+        }
+        self.data = PlayButton.callback_data_to_string(
+            self.callback_data,
+            payload_store=get_callback_payload_store(context=self.context),
+        )
+
+    @patch('bot.conversations.play_game.send_alert', new_callable=AsyncMock)
+    async def test_get_play_dict(self, send_alert_mock: AsyncMock):
+        play_dict = await get_play_dict(
+            function_caller='TEST',
+            update=create_update(self.data),
+            context=self.context,
+        )
+
+        self.assertEqual(play_dict, self.callback_data)
+        send_alert_mock.assert_not_called()
+
+    @patch('bot.conversations.play_game.send_alert', new_callable=AsyncMock)
+    async def test_expired_button(self, send_alert_mock: AsyncMock):
+        '''Teste se um token desconhecido (ex: depois de reiniciar o bot)
+        responde com o alerta de botão expirado.
+        '''
+
+        self.context.bot_data.clear()
+        play_dict = await get_play_dict(
+            function_caller='TEST',
+            update=create_update(self.data),
+            context=self.context,
+        )
+
+        self.assertIsNone(play_dict)
+        send_alert_mock.assert_awaited_once()
+        self.assertEqual(
+            send_alert_mock.call_args.kwargs['text'],
+            EXPIRED_BUTTON_TEXT
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
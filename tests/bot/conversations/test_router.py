@@ -0,0 +1,106 @@
+import asyncio
+import os
+import unittest
+
+from types import SimpleNamespace
+
+os.environ.setdefault('BOT_USERNAME', 'ludus_bot')
+
+from bot.conversations.choice_game import select_game, start_game  # noqa
+from bot.conversations.close import close  # noqa
+from bot.conversations.play_game import play_game  # noqa
+from bot.conversations.router import (  # noqa
+    CALLBACK_QUERY_ROUTER,
+    UNKNOWN_ROUTE_KEY,
+    CallbackQueryRouter
+)
+from bot.functions.buttons import dict_to_callback_data  # noqa
+from bot.games.buttons.play_button import PlayButton  # noqa
+from bot.games.enums.command import CallbackKeyEnum, CommandEnum  # noqa
+
+
+def create_update(data: str):
+    return SimpleNamespace(callback_query=SimpleNamespace(data=data))
+
+
+class TestCallbackQueryRouter(unittest.TestCase):
+    def test_get_route_key(self):
+        play_data = PlayButton.callback_data_to_string({
+            CallbackKeyEnum.COMMAND: CommandEnum.PLAY,
+            CallbackKeyEnum.GAME_ID: 123,
+        })
+        close_data = dict_to_callback_data({'command': '@close', 'id': 1})
+        get_route_key = CallbackQueryRouter.get_route_key
+
+        self.assertEqual(get_route_key(play_data), CommandEnum.PLAY)
+        self.assertEqual(get_route_key('@main'), '@main')
+        self.assertEqual(get_route_key('@game_ColorsGameBoard'), '@game_')
+        self.assertEqual(get_route_key('@start_123'), '@start_')
+        self.assertEqual(get_route_key(close_data), '@close')
+        self.assertIsNone(get_route_key(''))
+        self.assertIsNone(get_route_key('INVALID'))
+        self.assertIsNone(get_route_key('{invalid'))
+
+    def test_callback_query_router_routes(self):
+        play_data = PlayButton.callback_data_to_string({
+            CallbackKeyEnum.COMMAND: CommandEnum.DRAW,
+        })
+        close_data = dict_to_callback_data({'command': '@close', 'id': 1})
+        route_dict = CALLBACK_QUERY_ROUTER.route_dict
+
+        self.assertIs(route_dict[CommandEnum.DRAW], play_game)
+        self.assertIs(route_dict['@game_'], select_game)
+        self.assertIs(route_dict['@start_'], start_game)
+        self.assertIs(
+            route_dict[CallbackQueryRouter.get_route_key(close_data)],
+            close
+        )
+        self.assertIs(
+            route_dict[CallbackQueryRouter.get_route_key(play_data)],
+            play_game
+        )
+
+    def test_add_routes_duplicated(self):
+        async def callback(update, context):
+            ...
+
+        router = CallbackQueryRouter({'@main': callback})
+        with self.assertRaises(ValueError):
+            router.add_routes({'@main': callback})
+
+    def test_route_and_counter(self):
+        called_list = []
+
+        async def main_callback(update, context):
+            called_list.append(('main', update.callback_query.data))
+
+        async def play_callback(update, context):
+            called_list.append(('play', update.callback_query.data))
+
+        router = CallbackQueryRouter(
+            {'@main': main_callback},
+            {CommandEnum.PLAY: play_callback},
+        )
+        play_data = PlayButton.callback_data_to_string({
+            CallbackKeyEnum.COMMAND: CommandEnum.PLAY,
+        })
+
+        async def run():
+            await router.route(create_update('@main'), None)
+            await router.route(create_update(play_data), None)
+            await router.route(create_update(play_data), None)
+            await router.route(create_update('@unknown'), None)
+
+        asyncio.run(run())
+
+        self.assertEqual(
+            called_list,
+            [('main', '@main'), ('play', play_data), ('play', play_data)]
+        )
+        self.assertEqual(router.counter['@main'], 1)
+        self.assertEqual(router.counter['PLAY'], 2)
+        self.assertEqual(router.counter[UNKNOWN_ROUTE_KEY], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
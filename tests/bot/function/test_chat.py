@@ -0,0 +1,267 @@
+import asyncio
+import unittest
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from telegram import (
+    Chat,
+    InlineKeyboardButton,
+    InlineKeyboardMarkup,
+    Message
+)
+from telegram.error import BadRequest, RetryAfter
+
+from bot.functions.chat import (
+    UPDATE_STATUS_DEFERRED,
+    UPDATE_STATUS_EDITED,
+    UPDATE_STATUS_ERROR,
+    UPDATE_STATUS_MARKUP_EDITED,
+    UPDATE_STATUS_RESENT,
+    UPDATE_STATUS_SENT,
+    UPDATE_STATUS_SKIPPED,
+    update_all_player_messages,
+    update_player_message
+)
+from bot.functions.message_cache import get_cached_message_hash
+from bot.games.player import Player
+
+
+class FakeBot:
+    '''Bot falso que registra as chamadas e o número máximo de chamadas
+    simultâneas. As chamadas para os chats de error_dict levantam o erro.
+    '''
+
+    def __init__(self, delay: float = 0.01, error_dict: dict = None):
+        self.delay = delay
+        self.error_dict = error_dict if error_dict is not None else {}
+        self.call_list = []
+        self.active_calls = 0
+        self.max_active_calls = 0
+        self.next_message_id = 100
+
+    async def call(self, method_name: str, chat_id: str):
+        self.call_list.append((method_name, chat_id))
+        self.active_calls += 1
+        self.max_active_calls = max(self.max_active_calls, self.active_calls)
+        try:
+            await asyncio.sleep(self.delay)
+            error = self.error_dict.get((method_name, chat_id))
+            if error is not None:
+                raise error
+        finally:
+            self.active_calls -= 1
+
+    async def send_message(self, chat_id: str, **kwargs) -> Message:
+        await self.call('send_message', chat_id)
+        self.next_message_id += 1
+
+        return Message(
+            message_id=self.next_message_id,
+            date=datetime.now(),
+            chat=Chat(id=int(chat_id), type=Chat.PRIVATE),
+        )
+
+    async def edit_message_text(self, chat_id: str, **kwargs) -> bool:
+        await self.call('edit_message_text', chat_id)
+        return True
+
+    async def edit_message_reply_markup(self, chat_id: str, **kwargs) -> bool:
+        await self.call('edit_message_reply_markup', chat_id)
+        return True
+
+
+def make_game(player_list: list) -> MagicMock:
+    game = MagicMock(id=1)
+    game.player_list = player_list
+    game.current_player = player_list[-1]
+    game.show_board.side_effect = lambda player: f'Tabuleiro de {player}'
+    game.player_keyboard.return_value.make_keyboard.return_value = None
+
+    return game
+
+
+class TestUpdateAllPlayerMessages(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.context = MagicMock()
+        self.context.bot_data = {}
+        self.player_list = [
+            Player(player_id=str(i), name=f'Jogador{i}', message_id=i)
+            for i in range(1, 7)
+        ]
+        self.game = make_game(self.player_list)
+
+    async def test_max_concurrent_updates(self):
+        '''Teste se os envios simultâneos respeitam o limite do semáforo.
+        '''
+
+        self.context.bot = FakeBot()
+        summary = await update_all_player_messages(
+            function_caller='TEST',
+            game=self.game,
+            context=self.context,
+            max_concurrent_updates=2,
+        )
+
+        self.assertEqual(self.context.bot.max_active_calls, 2)
+        self.assertEqual(len(self.context.bot.call_list), 6)
+        self.assertEqual(
+            summary,
+            {player.id: UPDATE_STATUS_EDITED for player in self.player_list},
+        )
+
+    async def test_sequential_updates(self):
+        self.context.bot = FakeBot()
+        await update_all_player_messages(
+            function_caller='TEST',
+            game=self.game,
+            context=self.context,
+            max_concurrent_updates=1,
+        )
+
+        self.assertEqual(self.context.bot.max_active_calls, 1)
+        # O jogador da vez é atualizado primeiro.
+        self.assertEqual(self.context.bot.call_list[0][1], '6')
+
+    async def test_summary(self):
+        '''Teste se o erro de um jogador não impede a atualização dos outros
+        e se o resumo tem o resultado de cada jogador.
+        '''
+
+        self.player_list[2].message_id = None
+        self.context.bot = FakeBot(
+            error_dict={
+                ('edit_message_text', '1'): BadRequest(
+                    'Message to edit not found'
+                ),
+                ('edit_message_text', '2'): BadRequest('Chat not found'),
+                ('send_message', '2'): BadRequest('Chat not found'),
+            }
+        )
+        summary = await update_all_player_messages(
+            function_caller='TEST',
+            game=self.game,
+            context=self.context,
+        )
+
+        self.assertEqual(
+            summary,
+            {
+                '1': UPDATE_STATUS_RESENT,
+                '2': UPDATE_STATUS_ERROR,
+                '3': UPDATE_STATUS_SENT,
+                '4': UPDATE_STATUS_EDITED,
+                '5': UPDATE_STATUS_EDITED,
+                '6': UPDATE_STATUS_EDITED,
+            },
+        )
+        # A mensagem reenviada substitui a antiga.
+        self.assertGreater(self.player_list[0].message_id, 100)
+        self.assertGreater(self.player_list[2].message_id, 100)
+        self.assertEqual(self.player_list[1].message_id, 2)
+        self.assertIn(('send_message', '1'), self.context.bot.call_list)
+
+    async def test_invalid_max_concurrent_updates(self):
+        self.context.bot = FakeBot()
+        with self.assertRaises(ValueError):
+            await update_all_player_messages(
+                function_caller='TEST',
+                game=self.game,
+                context=self.context,
+                max_concurrent_updates=0,
+            )
+
+
+class TestUpdatePlayerMessage(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.context = MagicMock()
+        self.context.bot_data = {}
+        self.context.bot = FakeBot(delay=0)
+        self.player = Player(player_id='1', name='Jogador1', message_id=10)
+        self.game = make_game([self.player])
+
+    async def update(self) -> str:
+        return await update_player_message(
+            function_caller='TEST',
+            game=self.game,
+            player=self.player,
+            context=self.context,
+            semaphore=asyncio.Semaphore(1),
+        )
+
+    def get_cached_message_hash(self) -> tuple:
+        return get_cached_message_hash(
+            game_id=self.game.id,
+            player_id=self.player.id,
+            context=self.context,
+        )
+
+    def set_keyboard(self, text: str):
+        self.game.player_keyboard.return_value.make_keyboard.return_value = (
+            InlineKeyboardMarkup(
+                [[InlineKeyboardButton(text, callback_data=text)]]
+            )
+        )
+
+    async def test_skip_unchanged_message(self):
+        self.assertEqual(await self.update(), UPDATE_STATUS_EDITED)
+        self.assertEqual(await self.update(), UPDATE_STATUS_SKIPPED)
+        self.assertEqual(
+            self.context.bot.call_list,
+            [('edit_message_text', '1')],
+        )
+
+    async def test_markup_only_changed(self):
+        self.set_keyboard('A')
+        self.assertEqual(await self.update(), UPDATE_STATUS_EDITED)
+        self.set_keyboard('B')
+        self.assertEqual(await self.update(), UPDATE_STATUS_MARKUP_EDITED)
+        self.assertEqual(
+            self.context.bot.call_list[-1],
+            ('edit_message_reply_markup', '1'),
+        )
+
+        # Se a mensagem mudar, o texto é editado novamente.
+        self.player.set_message_id(message_id=11)
+        self.assertEqual(await self.update(), UPDATE_STATUS_EDITED)
+
+    async def test_message_not_modified(self):
+        '''Teste se o erro "message is not modified" não reenvia a mensagem
+        e guarda o hash, já que o conteúdo da mensagem é o renderizado.
+        '''
+
+        self.context.bot.error_dict[('edit_message_text', '1')] = BadRequest(
+            'Message is not modified: specified new message content and '
+            'reply markup are exactly the same'
+        )
+
+        self.assertEqual(await self.update(), UPDATE_STATUS_SKIPPED)
+        self.assertIsNotNone(self.get_cached_message_hash())
+        self.assertEqual(self.player.message_id, 10)
+
+        self.assertEqual(await self.update(), UPDATE_STATUS_SKIPPED)
+        self.assertEqual(len(self.context.bot.call_list), 1)
+
+    async def test_deferred_edit(self):
+        '''Teste se a edição adiada para um job não guarda o hash, para
+        que uma falha do job não deixe a mensagem desatualizada.
+        '''
+
+        self.assertEqual(await self.update(), UPDATE_STATUS_EDITED)
+        self.game.show_board.side_effect = lambda player: 'Novo tabuleiro'
+        self.context.bot.error_dict[('edit_message_text', '1')] = RetryAfter(
+            retry_after=0
+        )
+
+        self.assertEqual(await self.update(), UPDATE_STATUS_DEFERRED)
+        self.context.job_queue.run_once.assert_called_once()
+        self.assertIsNone(self.get_cached_message_hash())
+
+        # A próxima renderização edita a mensagem, mesmo sem mudanças.
+        self.context.bot.error_dict.clear()
+        self.assertEqual(await self.update(), UPDATE_STATUS_EDITED)
+        self.assertIsNotNone(self.get_cached_message_hash())
+
+
+if __name__ == '__main__':
+    unittest.main()
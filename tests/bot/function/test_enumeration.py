@@ -0,0 +1,55 @@
+import unittest
+
+from enum import Enum
+
+from bot.functions.enumeration import (
+    ENUM_INDEX_DICT,
+    ENUM_MEMBERS_DICT,
+    get_enum_by_index,
+    get_enum_index
+)
+from bot.games.enums.card import ColorNames, RoyalNames, RoyalSuits
+from bot.games.enums.warfare import TerritoryNames
+
+
+class TestEnumerationFunctions(unittest.TestCase):
+    def test_get_enum_index(self):
+        for enum_class in (RoyalNames, RoyalSuits, TerritoryNames):
+            for index, member in enumerate(enum_class):
+                self.assertEqual(get_enum_index(member), index)
+
+    def test_get_enum_by_index(self):
+        for enum_class in (RoyalNames, ColorNames, TerritoryNames):
+            for index, member in enumerate(enum_class):
+                self.assertIs(get_enum_by_index(enum_class, index), member)
+        self.assertIs(get_enum_by_index(RoyalNames, -1), RoyalNames.KING)
+        self.assertRaises(IndexError, get_enum_by_index, RoyalSuits, 4)
+
+    def test_tables_created_with_class(self):
+        '''Teste se as tabelas das classes Names e Suits são criadas quando
+        a classe é definida.
+        '''
+
+        self.assertIn(TerritoryNames, ENUM_INDEX_DICT)
+        self.assertEqual(
+            ENUM_MEMBERS_DICT[ColorNames],
+            tuple(ColorNames),
+        )
+
+    def test_other_enum(self):
+        '''Teste se as tabelas de outras classes Enum são criadas no
+        primeiro uso.
+        '''
+
+        class TestEnum(Enum):
+            A = 1
+            B = 2
+            C = 3
+
+        self.assertNotIn(TestEnum, ENUM_INDEX_DICT)
+        self.assertEqual(get_enum_index(TestEnum.C), 2)
+        self.assertIs(get_enum_by_index(TestEnum, 1), TestEnum.B)
+
+    def test_invalid_arguments(self):
+        self.assertRaises(TypeError, get_enum_index, 'A')
+        self.assertRaises(TypeError, get_enum_by_index, RoyalNames, '1')
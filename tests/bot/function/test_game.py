@@ -0,0 +1,367 @@
+import asyncio
+import unittest
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from telegram.error import Forbidden
+
+from bot.functions.buttons import get_callback_payload_store
+from bot.functions.game import (
+    GAME_ACTORS_KEY,
+    GAME_LOCKS_KEY,
+    GAME_REGISTRY_KEY,
+    acquire_game_lock,
+    add_game,
+    get_game,
+    get_game_actor_stats,
+    get_game_journal,
+    get_game_lock,
+    get_game_registry,
+    is_game_removed,
+    journal_add_player,
+    journal_start,
+    load_game,
+    remove_game,
+    request_game_render,
+    submit_play,
+    sweep_games
+)
+from bot.functions.game_registry import GameRegistry
+from bot.games.boards import ColorsGameBoard
+from bot.games.enums.command import CallbackKeyEnum
+from bot.games.journal import JOURNAL_ADD_PLAYER, JOURNAL_START
+from bot.games.player import Player
+
+
+class TestGameFunctions(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.context = MagicMock()
+        self.context.bot_data = {}
+        self.context.job_queue.jobs.return_value = []
+        self.game = MagicMock(id=1)
+
+    def test_add_get_remove_game(self):
+        add_game(game=self.game, context=self.context)
+        self.assertIs(get_game(game_id='1', context=self.context), self.game)
+        payload_store = get_callback_payload_store(context=self.context)
+        payload_store.store(game_id=1, payload='payload')
+        remove_game(game_id='1', context=self.context)
+        self.assertIsNone(get_game(game_id=1, context=self.context))
+        self.assertEqual(len(payload_store), 0)
+
+    async def test_invalid_game_id(self):
+        self.assertIsNone(get_game(game_id='abc-1', context=self.context))
+        self.assertIsNone(
+            await load_game(game_id='abc-1', context=self.context)
+        )
+        self.assertIsNone(
+            await load_game(game_id='z' * 20, context=self.context)
+        )
+
+    def test_game_journal(self):
+        game = ColorsGameBoard(Player(player_id='1', name='Ana'))
+        player = Player(player_id='2', name='Bia')
+        add_game(game=game, context=self.context)
+        game.add_player(player)
+        journal_add_player(game=game, player=player, context=self.context)
+        game.start()
+        journal_start(game=game, context=self.context)
+
+        journal = get_game_journal(game_id=game.id, context=self.context)
+        self.assertEqual(
+            [kind for kind, _ in journal.iter_entries()],
+            [JOURNAL_ADD_PLAYER, JOURNAL_START],
+        )
+        self.assertEqual(journal.replay().player_list, game.player_list)
+
+        remove_game(game_id=game.id, context=self.context)
+        self.assertIsNone(
+            get_game_journal(game_id=game.id, context=self.context)
+        )
+
+    def test_get_game_lock(self):
+        '''Teste se cada partida tem o seu próprio Lock e se ele é removido
+        junto com a partida.
+        '''
+
+        lock = get_game_lock(game_id=1, context=self.context)
+        self.assertIs(get_game_lock(game_id='1', context=self.context), lock)
+        self.assertIsNot(get_game_lock(game_id=2, context=self.context), lock)
+
+        remove_game(game_id=1, context=self.context)
+        self.assertIsNot(get_game_lock(game_id=1, context=self.context), lock)
+
+    async def test_remove_game_inside_lock(self):
+        '''Teste se o Lock de uma partida removida dentro do Lock só é
+        descartado quando for liberado, para que os handlers que aguardam
+        continuem serializados.
+        '''
+
+        add_game(game=self.game, context=self.context)
+        order = []
+
+        async def close():
+            async with acquire_game_lock(game_id=1, context=self.context):
+                remove_game(game_id=1, context=self.context)
+                await asyncio.sleep(0.01)
+                self.assertIs(
+                    get_game_lock(game_id=1, context=self.context),
+                    lock,
+                )
+                order.append('close')
+
+        async def play():
+            await asyncio.sleep(0)
+            async with acquire_game_lock(game_id=1, context=self.context):
+                order.append(
+                    'removed'
+                    if is_game_removed(game=self.game, context=self.context)
+                    else 'play'
+                )
+
+        lock = get_game_lock(game_id=1, context=self.context)
+        await asyncio.gather(close(), play())
+
+        self.assertEqual(order, ['close', 'removed'])
+        self.assertNotIn(1, self.context.bot_data[GAME_LOCKS_KEY])
+
+    def test_is_game_removed(self):
+        add_game(game=self.game, context=self.context)
+        self.assertFalse(
+            is_game_removed(game=self.game, context=self.context)
+        )
+
+        remove_game(game_id=1, context=self.context)
+        self.assertTrue(is_game_removed(game=self.game, context=self.context))
+
+        # Outra partida com o mesmo id (ex: carregada do MongoDB).
+        add_game(game=MagicMock(id=1), context=self.context)
+        self.assertTrue(is_game_removed(game=self.game, context=self.context))
+
+    async def test_game_lock_order(self):
+        '''Teste se as ações de uma partida ficam em ordem enquanto outra
+        partida progride em paralelo.
+        '''
+
+        order = []
+
+        async def action(game_id, name, sleep_time):
+            async with get_game_lock(game_id=game_id, context=self.context):
+                await asyncio.sleep(sleep_time)
+                order.append(name)
+
+        await asyncio.gather(
+            action(1, 'game1-play1', 0.03),
+            action(1, 'game1-play2', 0),
+            action(2, 'game2-play1', 0.01),
+        )
+        self.assertEqual(order, ['game2-play1', 'game1-play1', 'game1-play2'])
+
+    @patch(
+        'bot.functions.game.update_all_player_messages',
+        new_callable=AsyncMock,
+    )
+    async def test_submit_play(self, update_all_player_messages_mock):
+        '''Teste se a jogada é aplicada e gravada no diário pelo GameActor
+        da partida e se o actor é parado junto com a partida.
+        '''
+
+        host = Player(player_id='1', name='Ana')
+        game = ColorsGameBoard(host, Player(player_id='2', name='Bia'))
+        add_game(game=game, context=self.context)
+        game.start()
+        play_dict = {
+            CallbackKeyEnum.COMMAND: 'DRAW',
+            CallbackKeyEnum.GAME_ID: game.id,
+        }
+
+        play_response = await submit_play(
+            game=game,
+            player=Player(player_id='9', name='Intruso'),
+            play_dict=play_dict,
+            context=self.context,
+        )
+        self.assertIsInstance(play_response, str)
+        journal = get_game_journal(game_id=game.id, context=self.context)
+        self.assertEqual(len(journal), 1)
+
+        actor = self.context.bot_data[GAME_ACTORS_KEY][game.id]
+        await actor.join()
+        update_all_player_messages_mock.assert_awaited_once()
+        self.assertEqual(
+            get_game_actor_stats(context=self.context)[game.id]['items'],
+            1,
+        )
+
+        remove_game(game_id=game.id, context=self.context)
+        self.assertFalse(actor.is_running)
+        self.assertEqual(get_game_actor_stats(context=self.context), {})
+
+        # Uma jogada tardia não recria o actor da partida removida.
+        play_response = await submit_play(
+            game=game,
+            player=host,
+            play_dict=play_dict,
+            context=self.context,
+        )
+        self.assertIsNone(play_response)
+        self.assertEqual(get_game_actor_stats(context=self.context), {})
+        self.assertEqual(len(journal), 1)
+
+    @patch(
+        'bot.functions.game.update_all_player_messages',
+        new_callable=AsyncMock,
+    )
+    async def test_submit_play_error(self, update_all_player_messages_mock):
+        '''Teste se a jogada que levanta um erro não é gravada no diário.
+        '''
+
+        game = ColorsGameBoard(
+            Player(player_id='1', name='Ana'),
+            Player(player_id='2', name='Bia'),
+        )
+        add_game(game=game, context=self.context)
+        game.start()
+        play_dict = {
+            CallbackKeyEnum.COMMAND: 'DRAW',
+            CallbackKeyEnum.GAME_ID: game.id,
+        }
+
+        with patch.object(game, 'play', side_effect=ValueError('Erro')):
+            with self.assertRaises(ValueError):
+                await submit_play(
+                    game=game,
+                    player=game.current_player,
+                    play_dict=play_dict,
+                    context=self.context,
+                )
+        journal = get_game_journal(game_id=game.id, context=self.context)
+        self.assertEqual(len(journal), 0)
+
+        await submit_play(
+            game=game,
+            player=game.current_player,
+            play_dict=play_dict,
+            context=self.context,
+        )
+        self.assertEqual(len(journal), 1)
+        remove_game(game_id=game.id, context=self.context)
+
+    @patch(
+        'bot.functions.game.update_all_player_messages',
+        new_callable=AsyncMock,
+    )
+    async def test_request_game_render(self, update_all_player_messages_mock):
+        '''Teste se as renderizações pedidas fora do GameActor (select,
+        invite, start) são agrupadas com as das jogadas.
+        '''
+
+        game = ColorsGameBoard(
+            Player(player_id='1', name='Ana'),
+            Player(player_id='2', name='Bia'),
+        )
+        add_game(game=game, context=self.context)
+        request_game_render(game=game, context=self.context)
+        game.start()
+        request_game_render(game=game, context=self.context)
+        await submit_play(
+            game=game,
+            player=game.current_player,
+            play_dict={
+                CallbackKeyEnum.COMMAND: 'DRAW',
+                CallbackKeyEnum.GAME_ID: game.id,
+            },
+            context=self.context,
+        )
+
+        actor = self.context.bot_data[GAME_ACTORS_KEY][game.id]
+        await actor.join()
+        update_all_player_messages_mock.assert_awaited_once()
+
+        remove_game(game_id=game.id, context=self.context)
+        request_game_render(game=game, context=self.context)
+        self.assertEqual(get_game_actor_stats(context=self.context), {})
+
+    @patch('bot.functions.game.edit_message_text', new_callable=AsyncMock)
+    async def test_sweep_games_telegram_error(self, edit_message_text_mock):
+        '''Teste se o erro do Telegram ao avisar um jogador (ex: ele
+        bloqueou o bot) não impede a remoção das outras partidas.
+        '''
+
+        now_list = [0.0]
+        self.context.bot_data[GAME_REGISTRY_KEY] = GameRegistry(
+            idle_ttl=60,
+            finished_ttl=10,
+            time_function=lambda: now_list[0],
+        )
+        blocked_player = MagicMock(message_id=10, user_id=100)
+        player = MagicMock(message_id=20, user_id=200)
+        game_list = [
+            MagicMock(
+                id=game_id,
+                game_over=False,
+                player_list=[blocked_player, player],
+                play_text_formatter=None,
+                DISPLAY_NAME='Idle',
+                short_id=str(game_id),
+            )
+            for game_id in (1, 2)
+        ]
+        for game in game_list:
+            add_game(game=game, context=self.context)
+
+        async def edit_message_text(**kwargs):
+            if kwargs['chat_id'] == 100:
+                raise Forbidden('Forbidden: bot was blocked by the user')
+
+        edit_message_text_mock.side_effect = edit_message_text
+        now_list[0] = 60
+        await sweep_games(self.context)
+
+        registry = get_game_registry(self.context)
+        self.assertEqual(list(registry), [])
+        self.assertEqual(registry.get_stats()['evicted_idle'], 2)
+        self.assertEqual(edit_message_text_mock.await_count, 4)
+
+    @patch('bot.functions.game.edit_message_text', new_callable=AsyncMock)
+    async def test_sweep_games(self, edit_message_text_mock):
+        '''Teste se as partidas abandonadas e terminadas são removidas e se
+        somente os jogadores das abandonadas são avisados.
+        '''
+
+        now_list = [0.0]
+        self.context.bot_data[GAME_REGISTRY_KEY] = GameRegistry(
+            idle_ttl=60,
+            finished_ttl=10,
+            time_function=lambda: now_list[0],
+        )
+        player = MagicMock(message_id=10, user_id=100)
+        idle_game = MagicMock(
+            id=1,
+            game_over=False,
+            player_list=[player],
+            play_text_formatter=None,
+            DISPLAY_NAME='Idle',
+            short_id='1',
+        )
+        finished_game = MagicMock(id=2, game_over=True, player_list=[player])
+        active_game = MagicMock(id=3, game_over=False, player_list=[player])
+        for game in (idle_game, finished_game, active_game):
+            add_game(game=game, context=self.context)
+
+        now_list[0] = 30
+        get_game(game_id=3, context=self.context)
+        now_list[0] = 60
+        await sweep_games(self.context)
+
+        registry = get_game_registry(self.context)
+        self.assertEqual(list(registry), [active_game])
+        self.assertEqual(
+            registry.get_stats(),
+            {'live': 1, 'evicted': 2, 'evicted_idle': 1, 'evicted_finished': 1}
+        )
+        edit_message_text_mock.assert_awaited_once()
+        self.assertEqual(
+            edit_message_text_mock.await_args.kwargs['message_id'],
+            10
+        )
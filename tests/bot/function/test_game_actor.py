@@ -0,0 +1,181 @@
+import asyncio
+import unittest
+
+from bot.functions.game_actor import GameActor
+
+
+class TestGameActor(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.applied_list = []
+        self.render_list = []
+        self.render_event = asyncio.Event()
+        self.lock = asyncio.Lock()
+
+    def apply_function(self, item):
+        if item == 'error':
+            raise ValueError('Jogada inválida.')
+        self.applied_list.append(item)
+
+        return f'{item}-ok'
+
+    async def render_function(self):
+        self.render_list.append(list(self.applied_list))
+        await self.render_event.wait()
+
+    def create_actor(self, **kwargs) -> GameActor:
+        return GameActor(
+            game_id=1,
+            apply_function=self.apply_function,
+            render_function=self.render_function,
+            **kwargs
+        )
+
+    async def test_submit(self):
+        self.render_event.set()
+        actor = self.create_actor()
+        result = await actor.submit('play1')
+
+        self.assertEqual(result, 'play1-ok')
+        await actor.join()
+        self.assertEqual(self.render_list, [['play1']])
+        self.assertEqual(actor.get_stats()['items'], 1)
+        self.assertEqual(actor.get_stats()['renders'], 1)
+        actor.stop()
+
+    async def test_batch_during_render(self):
+        '''Teste se as jogadas feitas durante a renderização são aplicadas
+        em ordem, sem aguardar o envio, e geram uma única nova
+        renderização.
+        '''
+
+        actor = self.create_actor()
+        await actor.submit('play1')
+        await asyncio.sleep(0)
+        self.assertTrue(actor.is_rendering)
+        result_list = await asyncio.gather(*(
+            actor.submit(f'play{i}')
+            for i in range(2, 6)
+        ))
+        self.assertEqual(
+            result_list,
+            ['play2-ok', 'play3-ok', 'play4-ok', 'play5-ok'],
+        )
+        self.assertEqual(actor.get_stats()['max_depth'], 4)
+
+        self.render_event.set()
+        await actor.join()
+        self.assertEqual(
+            self.render_list,
+            [['play1'], ['play1', 'play2', 'play3', 'play4', 'play5']],
+        )
+        self.assertEqual(actor.get_stats()['renders'], 2)
+        self.assertEqual(actor.depth, 0)
+        actor.stop()
+
+    async def test_max_batch_size(self):
+        async with self.lock:
+            actor = self.create_actor(max_batch_size=2, lock=self.lock)
+            task_list = [
+                asyncio.create_task(actor.submit(f'play{i}'))
+                for i in range(1, 6)
+            ]
+            await asyncio.sleep(0)
+        self.render_event.set()
+        await asyncio.gather(*task_list)
+        await actor.join()
+
+        self.assertEqual(actor.get_stats()['batches'], 3)
+        self.assertEqual(actor.get_stats()['renders'], 1)
+        actor.stop()
+
+    async def test_render_delay(self):
+        '''Teste se as jogadas feitas dentro do render_delay são agrupadas
+        em uma única renderização.
+        '''
+
+        self.render_event.set()
+        actor = self.create_actor(render_delay=0.01)
+        for i in range(3):
+            await actor.submit(f'play{i}')
+        await actor.join()
+
+        self.assertEqual(self.render_list, [['play0', 'play1', 'play2']])
+        self.assertEqual(actor.get_stats()['batches'], 3)
+        actor.stop()
+
+    async def test_apply_error(self):
+        '''Teste se o erro de uma jogada é levantado no submit sem parar o
+        worker.
+        '''
+
+        self.render_event.set()
+        actor = self.create_actor()
+        with self.assertRaises(ValueError):
+            await actor.submit('error')
+        self.assertEqual(await actor.submit('play1'), 'play1-ok')
+        self.assertTrue(actor.is_running)
+        actor.stop()
+
+    async def test_games_are_isolated(self):
+        '''Teste se uma partida travada na renderização não atrasa as
+        jogadas dela nem as de outra partida.
+        '''
+
+        stuck_actor = self.create_actor()
+        await stuck_actor.submit('play1')
+
+        other_actor = GameActor(
+            game_id=2,
+            apply_function=lambda item: item,
+            render_function=lambda: asyncio.sleep(0),
+        )
+        result = await asyncio.wait_for(other_actor.submit(0), timeout=1)
+        self.assertEqual(result, 0)
+        result = await asyncio.wait_for(stuck_actor.submit('play2'), 1)
+        self.assertEqual(result, 'play2-ok')
+        stuck_actor.stop()
+        other_actor.stop()
+
+    async def test_stop(self):
+        '''Teste se o stop libera as jogadas que ainda estão na fila.
+        '''
+
+        actor = self.create_actor(lock=self.lock)
+        await actor.submit('play1')
+        async with self.lock:
+            task = asyncio.create_task(actor.submit('play2'))
+            await asyncio.sleep(0)
+            actor.stop()
+
+        self.assertIsNone(await task)
+        self.assertEqual(self.applied_list, ['play1'])
+        self.assertFalse(actor.is_running)
+        self.assertFalse(actor.is_rendering)
+
+    async def test_stop_join(self):
+        '''Teste se a fila é liberada no stop, tanto para a jogada que o
+        worker estava processando quanto para as que ainda estavam na fila.
+        '''
+
+        actor = self.create_actor(lock=self.lock)
+        async with self.lock:
+            task_list = [
+                asyncio.create_task(actor.submit(item))
+                for item in ('play1', 'play2', 'play3')
+            ]
+            await asyncio.sleep(0)
+            task_list.append(asyncio.create_task(actor.submit('play4')))
+            await asyncio.sleep(0)
+            self.assertEqual(actor.depth, 1)
+            actor.stop()
+
+        self.assertEqual(await asyncio.gather(*task_list), [None] * 4)
+        await asyncio.wait_for(actor.queue.join(), timeout=1)
+        self.assertEqual(self.applied_list, [])
+
+    def test_max_batch_size_invalid(self):
+        self.assertRaises(ValueError, self.create_actor, max_batch_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+
+from unittest.mock import MagicMock
+
+from bot.functions.game_registry import (
+    EVICTION_REASON_FINISHED,
+    EVICTION_REASON_IDLE,
+    GameRegistry
+)
+
+
+class TestGameRegistry(unittest.TestCase):
+    def setUp(self):
+        self.now = 1000.0
+        self.registry = GameRegistry(
+            idle_ttl=60,
+            finished_ttl=10,
+            time_function=lambda: self.now,
+        )
+        self.game = MagicMock(id=1, game_over=False)
+        self.finished_game = MagicMock(id=2, game_over=True)
+
+    def test_add_get_remove(self):
+        self.registry.add(self.game)
+
+        self.assertIn(1, self.registry)
+        self.assertIs(self.registry.get(1), self.game)
+        self.assertEqual(list(self.registry), [self.game])
+        self.assertIs(self.registry.remove(1), self.game)
+        self.assertIsNone(self.registry.get(1))
+        self.assertIsNone(self.registry.remove(1))
+        self.assertEqual(len(self.registry), 0)
+
+    def test_get_touches_activity(self):
+        self.registry.add(self.game)
+        self.now += 50
+        self.registry.get(1)
+        self.now += 50
+
+        self.assertEqual(self.registry.get_idle_time(1), 50)
+        self.assertEqual(self.registry.get_expired_games(), [])
+
+        self.registry.get(1, touch=False)
+        self.now += 10
+        self.assertEqual(
+            self.registry.get_expired_games(),
+            [(self.game, EVICTION_REASON_IDLE)]
+        )
+
+    def test_finished_games_expire_first(self):
+        self.registry.add(self.game)
+        self.registry.add(self.finished_game)
+        self.now += 10
+
+        self.assertEqual(
+            self.registry.get_expired_games(),
+            [(self.finished_game, EVICTION_REASON_FINISHED)]
+        )
+
+    def test_stats(self):
+        self.registry.add(self.game)
+        self.registry.add_eviction(EVICTION_REASON_IDLE)
+        self.registry.add_eviction(EVICTION_REASON_IDLE)
+        self.registry.add_eviction(EVICTION_REASON_FINISHED)
+
+        self.assertEqual(self.registry.live_count, 1)
+        self.assertEqual(self.registry.evicted_count, 3)
+        self.assertEqual(
+            self.registry.get_stats(),
+            {
+                'live': 1,
+                'evicted': 3,
+                'evicted_idle': 2,
+                'evicted_finished': 1,
+            }
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
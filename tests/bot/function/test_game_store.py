@@ -0,0 +1,248 @@
+import unittest
+
+from random import Random
+from unittest.mock import MagicMock
+
+from pymongo import DeleteOne, ReplaceOne
+
+from bot.functions.game import (
+    GAME_STORE_KEY,
+    add_game,
+    get_game,
+    get_game_journal,
+    get_game_registry,
+    journal_add_player,
+    journal_start,
+    load_game,
+    play_and_journal,
+    remove_game,
+    save_game
+)
+from bot.functions.game_store import MongoGameStore
+from bot.games.boards import board_factory
+from bot.games.buttons.play_button import PlayButton
+from bot.games.player import Player
+
+
+class FakeCollection:
+    '''Coleção do MongoDB em memória com bulk_write e find_one.
+    '''
+
+    name = 'games'
+
+    def __init__(self):
+        self.document_dict = {}
+        self.bulk_write_list = []
+        self.fail = False
+
+    def bulk_write(self, operation_list, ordered=True):
+        if self.fail:
+            raise ConnectionError('MongoDB fora do ar.')
+
+        self.bulk_write_list.append(operation_list)
+        for operation in operation_list:
+            if isinstance(operation, ReplaceOne):
+                document = operation._doc
+                self.document_dict[document['_id']] = document
+            elif isinstance(operation, DeleteOne):
+                self.document_dict.pop(operation._filter['_id'], None)
+
+    def find_one(self, query):
+        return self.document_dict.get(query['_id'])
+
+
+class TestMongoGameStore(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.collection = FakeCollection()
+        self.store = MongoGameStore(collection=self.collection, batch_size=2)
+        self.game_list = [
+            board_factory('ColorsGameBoard')(
+                Player(player_id=i, name=f'Player{i}')
+            )
+            for i in range(3)
+        ]
+
+    def tearDown(self):
+        self.store.close()
+
+    async def test_flush_in_batches(self):
+        for game in self.game_list:
+            self.store.mark_dirty(game)
+        self.store.mark_dirty(self.game_list[0])
+
+        self.assertEqual(await self.store.flush(), 3)
+        self.assertEqual(len(self.collection.bulk_write_list), 2)
+        self.assertEqual(len(self.collection.document_dict), 3)
+        self.assertEqual(await self.store.flush(), 0)
+
+    async def test_flush_remove(self):
+        game = self.game_list[0]
+        self.store.mark_dirty(game)
+        await self.store.flush()
+        self.store.mark_removed(game.id)
+
+        self.assertIsNone(await self.store.load(game.id))
+        await self.store.flush()
+        self.assertEqual(self.collection.document_dict, {})
+
+    async def test_flush_error_requeue(self):
+        game = self.game_list[0]
+        self.store.mark_dirty(game)
+        self.collection.fail = True
+
+        self.assertEqual(await self.store.flush(), 0)
+        self.assertEqual(self.store.counter['errors'], 1)
+        self.assertIn(game.id, self.store.dirty_game_dict)
+
+        self.collection.fail = False
+        self.assertEqual(await self.store.flush(), 1)
+        self.assertIn(game.id, self.collection.document_dict)
+
+    async def test_load(self):
+        game = self.game_list[0]
+        game.add_player(Player(player_id=10, name='Guest'))
+        self.store.mark_dirty(game)
+        await self.store.flush()
+
+        loaded_game = await self.store.load(game.id)
+        self.assertIsNot(loaded_game, game)
+        self.assertEqual(loaded_game.id, game.id)
+        self.assertEqual(loaded_game.player_list, game.player_list)
+        self.assertIsNone(await self.store.load(12345))
+
+
+class TestGameStoreFunctions(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.collection = FakeCollection()
+        self.store = MongoGameStore(collection=self.collection)
+        self.context = MagicMock()
+        self.context.bot_data = {GAME_STORE_KEY: self.store}
+        self.game = board_factory('ColorsGameBoard')(
+            Player(player_id=1, name='Player1')
+        )
+
+    def tearDown(self):
+        self.store.close()
+
+    async def test_load_game_after_restart(self):
+        '''Teste se a partida é carregada do MongoDB quando não está na
+        memória, como depois de reiniciar o bot.
+        '''
+
+        add_game(game=self.game, context=self.context)
+        save_game(game=self.game, context=self.context)
+        await self.store.flush()
+        get_game_registry(self.context).remove(self.game.id)
+
+        game_id = self.game.id
+        self.assertIsNone(get_game(game_id=game_id, context=self.context))
+        game = await load_game(
+            game_id=self.game.short_id,
+            context=self.context
+        )
+        self.assertEqual(game.id, game_id)
+        self.assertIs(get_game(game_id=game_id, context=self.context), game)
+
+    def play_game(self, total_plays: int):
+        '''Adiciona um jogador, inicia a partida e faz total_plays jogadas
+        gravando as ações no diário, como os handlers.
+        '''
+
+        player = Player(player_id=2, name='Player2')
+        self.game.add_player(player)
+        journal_add_player(game=self.game, player=player, context=self.context)
+        self.game.start()
+        journal_start(game=self.game, context=self.context)
+        random = Random(0)
+        for _ in range(total_plays):
+            current_player = self.game.current_player
+            button_list = self.game.player_keyboard(
+                player=current_player
+            ).play_button_list
+            button = random.choice(button_list)
+            play_and_journal(
+                game=self.game,
+                player=current_player,
+                play_dict=PlayButton.callback_data_to_dict(button.data_to_str),
+                context=self.context,
+            )
+        # O message_id muda fora do diário (ver bot.functions.chat).
+        for index, game_player in enumerate(self.game.player_list):
+            game_player.set_message_id(500 + index)
+        save_game(game=self.game, context=self.context)
+
+    def restart(self) -> MagicMock:
+        '''Retorna o context de um bot reiniciado, com um novo store sobre
+        a mesma coleção.
+        '''
+
+        store = MongoGameStore(collection=self.collection)
+        self.addCleanup(store.close)
+        context = MagicMock()
+        context.bot_data = {GAME_STORE_KEY: store}
+
+        return context
+
+    async def test_load_game_journal_after_restart(self):
+        '''Teste se o diário é gravado junto com a partida e se, depois de
+        reiniciar o bot, a partida é refeita a partir dele e o diário
+        continua com as ações já gravadas.
+        '''
+
+        add_game(game=self.game, context=self.context)
+        self.play_game(total_plays=5)
+        await self.store.flush()
+        journal = get_game_journal(game_id=self.game.id, context=self.context)
+        self.assertIn('journal', self.collection.document_dict[self.game.id])
+
+        context = self.restart()
+        game = await load_game(game_id=self.game.id, context=context)
+        loaded_journal = get_game_journal(game_id=game.id, context=context)
+
+        self.assertIsNot(game, self.game)
+        self.assertEqual(game.to_snapshot(), self.game.to_snapshot())
+        self.assertEqual(
+            [player.message_id for player in game.player_list],
+            [500, 501],
+        )
+        self.assertEqual(len(loaded_journal), len(journal))
+        self.assertEqual(loaded_journal.to_bytes(), journal.to_bytes())
+        self.assertEqual(
+            loaded_journal.replay().to_snapshot(),
+            journal.replay().to_snapshot(),
+        )
+
+    async def test_load_game_invalid_journal(self):
+        '''Teste se a partida do snapshot é usada, com um novo diário,
+        quando o diário gravado não pode ser refeito.
+        '''
+
+        add_game(game=self.game, context=self.context)
+        self.play_game(total_plays=5)
+        journal = get_game_journal(game_id=self.game.id, context=self.context)
+        # A última jogada do diário fica incompleta.
+        journal.writer.buffer = journal.writer.buffer[:-1]
+        await self.store.flush()
+
+        context = self.restart()
+        game = await load_game(game_id=self.game.id, context=context)
+
+        self.assertEqual(game.to_snapshot(), self.game.to_snapshot())
+        self.assertEqual(
+            len(get_game_journal(game_id=game.id, context=context)), 0
+        )
+
+    async def test_remove_game(self):
+        add_game(game=self.game, context=self.context)
+        await self.store.flush()
+        remove_game(game_id=self.game.id, context=self.context)
+        await self.store.flush()
+
+        self.assertIsNone(
+            await load_game(game_id=self.game.id, context=self.context)
+        )
+        self.assertEqual(self.collection.document_dict, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+
+from unittest.mock import MagicMock
+
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+
+from bot.functions.message_cache import (
+    clear_cached_message_hash,
+    clear_game_message_cache,
+    get_cached_message_hash,
+    get_message_hash,
+    set_cached_message_hash
+)
+
+
+class TestMessageCache(unittest.TestCase):
+    def setUp(self):
+        self.context = MagicMock()
+        self.context.bot_data = {}
+
+    def test_get_message_hash(self):
+        '''Teste se mensagens iguais geram o mesmo hash e se o hash do
+        teclado é independente do hash do texto.
+        '''
+
+        markup1 = InlineKeyboardMarkup(
+            [[InlineKeyboardButton('A', callback_data='A')]]
+        )
+        markup2 = InlineKeyboardMarkup(
+            [[InlineKeyboardButton('A', callback_data='A')]]
+        )
+        markup3 = InlineKeyboardMarkup(
+            [[InlineKeyboardButton('B', callback_data='B')]]
+        )
+        hash1 = get_message_hash(text='texto', reply_markup=markup1)
+        hash2 = get_message_hash(text='texto', reply_markup=markup2)
+        hash3 = get_message_hash(text='texto', reply_markup=markup3)
+
+        self.assertEqual(hash1, hash2)
+        self.assertEqual(hash1[0], hash3[0])
+        self.assertNotEqual(hash1[1], hash3[1])
+
+    def test_set_and_get_cached_message_hash(self):
+        message_hash = get_message_hash(text='texto')
+        self.assertIsNone(
+            get_cached_message_hash(
+                game_id=1, player_id='1', context=self.context
+            )
+        )
+
+        set_cached_message_hash(
+            game_id=1,
+            player_id='1',
+            message_id=10,
+            message_hash=message_hash,
+            context=self.context,
+        )
+        self.assertEqual(
+            get_cached_message_hash(
+                game_id=1, player_id='1', context=self.context
+            ),
+            (10, *message_hash)
+        )
+
+    def test_clear_game_message_cache(self):
+        message_hash = get_message_hash(text='texto')
+        for game_id in (1, 2):
+            set_cached_message_hash(
+                game_id=game_id,
+                player_id='1',
+                message_id=10,
+                message_hash=message_hash,
+                context=self.context,
+            )
+
+        clear_game_message_cache(game_id=1, context=self.context)
+        self.assertIsNone(
+            get_cached_message_hash(
+                game_id=1, player_id='1', context=self.context
+            )
+        )
+        self.assertIsNotNone(
+            get_cached_message_hash(
+                game_id=2, player_id='1', context=self.context
+            )
+        )
+
+    def test_clear_cached_message_hash(self):
+        message_hash = get_message_hash(text='texto')
+        for player_id in ('1', '2'):
+            set_cached_message_hash(
+                game_id=1,
+                player_id=player_id,
+                message_id=10,
+                message_hash=message_hash,
+                context=self.context,
+            )
+
+        clear_cached_message_hash(
+            game_id=1, player_id='1', context=self.context
+        )
+        clear_cached_message_hash(
+            game_id=2, player_id='1', context=self.context
+        )
+        self.assertIsNone(
+            get_cached_message_hash(
+                game_id=1, player_id='1', context=self.context
+            )
+        )
+        self.assertIsNotNone(
+            get_cached_message_hash(
+                game_id=1, player_id='2', context=self.context
+            )
+        )
@@ -0,0 +1,205 @@
+import asyncio
+import unittest
+
+from time import monotonic
+from unittest.mock import MagicMock, patch
+
+from bot.functions.enums.priority import OutboxPriorityEnum
+from bot.functions.rate_limiter import (
+    OutboundRateLimiter,
+    TokenBucket,
+    get_rate_limiter
+)
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_init_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0, capacity=1)
+
+    def test_init_invalid_capacity(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=1, capacity=0)
+
+    def test_wait_time(self):
+        '''Teste se o bucket só pede espera depois de consumir a capacidade.
+        '''
+
+        bucket = TokenBucket(rate=1, capacity=2)
+        now = bucket.updated_at
+        self.assertEqual(bucket.get_wait_time(now), 0)
+        bucket.consume()
+        self.assertEqual(bucket.get_wait_time(now), 0)
+        bucket.consume()
+        self.assertAlmostEqual(bucket.get_wait_time(now), 1)
+
+    def test_refill(self):
+        '''Teste se o bucket recupera tokens com o tempo sem passar da
+        capacidade.
+        '''
+
+        bucket = TokenBucket(rate=10, capacity=2)
+        bucket.consume()
+        bucket.consume()
+        bucket.refill(bucket.updated_at + 0.1)
+        self.assertAlmostEqual(bucket.tokens, 1)
+        bucket.refill(bucket.updated_at + 10)
+        self.assertEqual(bucket.tokens, 2)
+
+
+class TestOutboundRateLimiter(unittest.IsolatedAsyncioTestCase):
+    async def test_acquire_chat_limit(self):
+        '''Teste se acquire respeita o limite de cada chat sem atrasar
+        outros chats.
+        '''
+
+        limiter = OutboundRateLimiter(chat_rate=20, chat_burst=1)
+        start = monotonic()
+        await limiter.acquire(chat_id=1)
+        await limiter.acquire(chat_id=2)
+        self.assertLess(monotonic() - start, 0.04)
+        await limiter.acquire(chat_id=1)
+        self.assertGreaterEqual(monotonic() - start, 0.04)
+
+    async def test_acquire_global_limit(self):
+        '''Teste se acquire respeita o limite global.
+        '''
+
+        limiter = OutboundRateLimiter(global_rate=1)
+        self.assertEqual(limiter.get_wait_time(), 0)
+        await limiter.acquire()
+        self.assertGreater(limiter.get_wait_time(), 0)
+
+    async def test_acquire_priority(self):
+        '''Teste se, sob disputa pelo limite global, as chamadas de maior
+        prioridade são liberadas primeiro.
+        '''
+
+        limiter = OutboundRateLimiter(global_rate=50)
+        limiter.global_bucket.tokens = 0
+        order = []
+
+        async def acquire(name, priority):
+            await limiter.acquire(chat_id=name, priority=priority)
+            order.append(name)
+
+        await asyncio.gather(
+            acquire(1, OutboxPriorityEnum.PLAYER),
+            acquire(2, OutboxPriorityEnum.DEFAULT),
+            acquire(3, OutboxPriorityEnum.CURRENT_PLAYER),
+            acquire(4, OutboxPriorityEnum.ANSWER),
+        )
+        self.assertEqual(order, [4, 3, 1, 2])
+
+    async def test_acquire_priority_chat_paused(self):
+        '''Teste se uma chamada de maior prioridade presa pelo limite do
+        próprio chat não bloqueia as demais.
+        '''
+
+        limiter = OutboundRateLimiter()
+        limiter.pause(seconds=10, chat_id=1)
+        task = asyncio.create_task(
+            limiter.acquire(chat_id=1, priority=OutboxPriorityEnum.ANSWER)
+        )
+        await asyncio.sleep(0)
+        await asyncio.wait_for(
+            limiter.acquire(chat_id=2, priority=OutboxPriorityEnum.PLAYER),
+            timeout=1
+        )
+        self.assertFalse(task.done())
+        task.cancel()
+
+    async def test_acquire_waiters_heap(self):
+        '''Teste se as chamadas em espera são acordadas pelo dispatch, na
+        ordem do heap, sem consultar o limiter periodicamente.
+        '''
+
+        limiter = OutboundRateLimiter(global_rate=200)
+        limiter.global_bucket.tokens = 0
+        order = []
+
+        async def acquire(name, priority):
+            await limiter.acquire(priority=priority)
+            order.append(name)
+
+        with patch(
+            'bot.functions.rate_limiter.asyncio.sleep',
+            side_effect=AssertionError('O limiter não deve usar sleep.'),
+        ):
+            await asyncio.gather(*(
+                acquire(
+                    name,
+                    OutboxPriorityEnum.PLAYER
+                    if name % 2 else
+                    OutboxPriorityEnum.CURRENT_PLAYER
+                )
+                for name in range(10)
+            ))
+
+        self.assertEqual(order, [0, 2, 4, 6, 8, 1, 3, 5, 7, 9])
+        self.assertEqual(limiter.waiter_heap, [])
+        self.assertIsNone(limiter.dispatch_handle)
+
+    async def test_acquire_canceled_waiter(self):
+        '''Teste se uma chamada cancelada no heap não bloqueia as demais.
+        '''
+
+        limiter = OutboundRateLimiter(global_rate=50)
+        limiter.global_bucket.tokens = 0
+        task = asyncio.create_task(
+            limiter.acquire(priority=OutboxPriorityEnum.ANSWER)
+        )
+        await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.wait_for(
+            limiter.acquire(priority=OutboxPriorityEnum.PLAYER),
+            timeout=1
+        )
+        self.assertTrue(task.cancelled())
+
+    def test_pause_chat(self):
+        '''Teste se pause bloqueia somente o chat informado.
+        '''
+
+        limiter = OutboundRateLimiter()
+        limiter.pause(seconds=10, chat_id=1)
+        self.assertGreater(limiter.get_wait_time(chat_id=1), 9)
+        self.assertEqual(limiter.get_wait_time(chat_id=2), 0)
+
+    def test_pause_global(self):
+        '''Teste se pause sem chat_id bloqueia todos os chats.
+        '''
+
+        limiter = OutboundRateLimiter()
+        limiter.pause(seconds=10)
+        self.assertGreater(limiter.get_wait_time(chat_id=1), 9)
+        self.assertGreater(limiter.get_wait_time(), 9)
+
+    def test_group_bucket(self):
+        '''Teste se chats de grupo usam o limite de grupo.
+        '''
+
+        limiter = OutboundRateLimiter(group_rate=0.5, chat_rate=2)
+        self.assertEqual(limiter.get_chat_bucket(-100).rate, 0.5)
+        self.assertEqual(limiter.get_chat_bucket('100').rate, 2)
+
+    def test_prune(self):
+        '''Teste se prune remove buckets ociosos.
+        '''
+
+        limiter = OutboundRateLimiter()
+        limiter.get_chat_bucket(1)
+        limiter.get_chat_bucket(2).consume()
+        limiter.prune()
+        self.assertNotIn('1', limiter.chat_buckets)
+        self.assertIn('2', limiter.chat_buckets)
+
+    def test_get_rate_limiter(self):
+        '''Teste se get_rate_limiter retorna sempre o mesmo limitador.
+        '''
+
+        context = MagicMock()
+        context.bot_data = {}
+        limiter = get_rate_limiter(context)
+        self.assertIsInstance(limiter, OutboundRateLimiter)
+        self.assertIs(get_rate_limiter(context), limiter)
@@ -0,0 +1,117 @@
+import asyncio
+import unittest
+
+from unittest.mock import MagicMock
+
+from telegram.error import RetryAfter, TimedOut
+
+from bot.functions.game_registry import GAME_REGISTRY_KEY, GameRegistry
+from bot.functions.retry import (
+    RETRY_CANCEL_EVENTS_KEY,
+    RETRY_MAX_TIME,
+    RETRY_TIMED_OUT_TIME,
+    cancel_game_retries,
+    get_retry_time,
+    wait_retry
+)
+
+
+class TestRetryFunctions(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.context = MagicMock()
+        self.context.bot_data = {}
+        self.context.job_queue.jobs.return_value = []
+        registry = GameRegistry(idle_ttl=60, finished_ttl=60)
+        registry.add(game=MagicMock(id=1))
+        self.context.bot_data[GAME_REGISTRY_KEY] = registry
+
+    def test_get_retry_time_retry_after(self):
+        '''Teste se get_retry_time nunca espera menos que o retry_after.
+        '''
+
+        error = RetryAfter(retry_after=10)
+        for attempt in range(3):
+            sleep_time = get_retry_time(error=error, attempt=attempt)
+            self.assertGreaterEqual(sleep_time, 10)
+            self.assertLessEqual(sleep_time, 20)
+
+    def test_get_retry_time_timed_out_backoff(self):
+        '''Teste se get_retry_time cresce exponencialmente para TimedOut.
+        '''
+
+        error = TimedOut()
+        for attempt in range(3):
+            min_time = RETRY_TIMED_OUT_TIME * 2 ** attempt
+            sleep_time = get_retry_time(error=error, attempt=attempt)
+            self.assertGreaterEqual(sleep_time, min_time)
+            self.assertLessEqual(sleep_time, min_time * 2)
+
+    def test_get_retry_time_max_time(self):
+        '''Teste se o backoff de TimedOut é limitado por RETRY_MAX_TIME.
+        '''
+
+        sleep_time = get_retry_time(error=TimedOut(), attempt=20)
+        self.assertLessEqual(sleep_time, RETRY_MAX_TIME * 2)
+
+    async def test_wait_retry_without_game(self):
+        '''Teste se wait_retry retorna True após a espera.
+        '''
+
+        result = await wait_retry(sleep_time=0, context=self.context)
+        self.assertTrue(result)
+
+    async def test_wait_retry_timeout(self):
+        '''Teste se wait_retry retorna True quando a partida não é removida.
+        '''
+
+        result = await wait_retry(
+            sleep_time=0.01,
+            context=self.context,
+            game_id=1
+        )
+        self.assertTrue(result)
+
+    async def test_wait_retry_canceled(self):
+        '''Teste se wait_retry retorna False quando a partida é removida
+        durante a espera.
+        '''
+
+        task = asyncio.create_task(
+            wait_retry(sleep_time=60, context=self.context, game_id=1)
+        )
+        await asyncio.sleep(0)
+        cancel_game_retries(game_id=1, context=self.context)
+        result = await asyncio.wait_for(task, timeout=1)
+        self.assertFalse(result)
+
+    async def test_wait_retry_removed_game(self):
+        '''Teste se a nova tentativa que começa depois da partida ser
+        removida é cancelada sem guardar um evento no bot_data.
+        '''
+
+        self.context.bot_data[GAME_REGISTRY_KEY].remove(game_id=1)
+        cancel_game_retries(game_id=1, context=self.context)
+
+        result = await wait_retry(
+            sleep_time=60,
+            context=self.context,
+            game_id=1,
+        )
+        self.assertFalse(result)
+        self.assertEqual(
+            self.context.bot_data.get(RETRY_CANCEL_EVENTS_KEY, {}),
+            {},
+        )
+
+    def test_cancel_game_retries_jobs(self):
+        '''Teste se cancel_game_retries remove somente os jobs da partida.
+        '''
+
+        game_job = MagicMock(data={'game_id': 1})
+        other_job = MagicMock(data={'game_id': 2})
+        self.context.job_queue.jobs.return_value = [game_job, other_job]
+
+        cancel_game_retries(game_id=1, context=self.context)
+
+        game_job.schedule_removal.assert_called_once()
+        other_job.schedule_removal.assert_not_called()
@@ -0,0 +1,127 @@
+import unittest
+
+from inspect import isabstract
+
+from bot.games.boards import get_board_list
+from bot.games.buttons.callback_codec import (
+    CALLBACK_CODEC_HEADER,
+    decode_callback_data,
+    decode_varint,
+    encode_callback_data,
+    encode_varint,
+    get_callback_data_command,
+    get_callback_data_pattern
+)
+from bot.games.enums.command import CallbackKeyEnum, CommandEnum
+from bot.games.player import Player
+
+
+class TestCallbackCodec(unittest.TestCase):
+    def test_varint_roundtrip(self):
+        for number in (0, 1, -1, 30, 31, 61, 62, 12345, -12345, 2 ** 63):
+            text = encode_varint(number)
+            self.assertEqual(decode_varint(text, 0), (number, len(text)))
+
+    def test_varint_size(self):
+        self.assertEqual(len(encode_varint(0)), 1)
+        self.assertEqual(len(encode_varint(15)), 1)
+        self.assertEqual(len(encode_varint(140_000_000_000_000)), 10)
+
+    def test_roundtrip_all_keys(self):
+        '''Teste se todos os tipos de valores aceitos voltam iguais.
+        '''
+
+        callback_data = {
+            CallbackKeyEnum.COMMAND: 'SELECT_COLOR',
+            CallbackKeyEnum.GAME_ID: 140_234_567_890_123,
+            CallbackKeyEnum.HAND_POSITION: 0,
+            CallbackKeyEnum.DISCARD_POSITION: -3,
+            CallbackKeyEnum.SELECTED_COLOR: 'RED',
+            CallbackKeyEnum.ROW_INDEX: 4,
+            CallbackKeyEnum.CARD_INDEX: 'çã#1',
+        }
+        text = encode_callback_data(callback_data)
+        self.assertTrue(text.startswith(CALLBACK_CODEC_HEADER))
+        self.assertEqual(decode_callback_data(text), callback_data)
+
+    def test_roundtrip_board_buttons(self):
+        '''Teste se todos os botões das boards sobrevivem à ida e volta e
+        cabem no limite de 64 bytes do Telegram.
+        '''
+
+        for board_class in get_board_list():
+            if isabstract(board_class):
+                continue
+            player_list = [
+                Player(player_id=i, name=f'Player{i}')
+                for i in range(4)
+            ]
+            board = board_class(player_list[0])
+            for player in player_list[1:board.max_total_players]:
+                board.add_player(player)
+            board.start()
+            for player in board.player_list:
+                keyboard = board.player_keyboard(player)
+                for button in keyboard.play_button_list:
+                    text = button.data_to_str
+                    data = decode_callback_data(text)
+                    self.assertEqual(
+                        data[CallbackKeyEnum.COMMAND],
+                        button.command.name
+                    )
+                    self.assertEqual(data[CallbackKeyEnum.GAME_ID], board.id)
+                    for key, value in button.callback_data.items():
+                        self.assertEqual(data[CallbackKeyEnum[key]], value)
+                    self.assertLessEqual(len(text.encode('utf-8')), 64)
+
+    def test_encode_invalid_value(self):
+        with self.assertRaises(TypeError):
+            encode_callback_data({
+                CallbackKeyEnum.COMMAND: 'PLAY',
+                CallbackKeyEnum.GAME_ID: None,
+            })
+        with self.assertRaises(TypeError):
+            encode_callback_data({
+                CallbackKeyEnum.COMMAND: 'PLAY',
+                CallbackKeyEnum.GAME_ID: True,
+            })
+
+    def test_decode_invalid(self):
+        invalid_text_list = [
+            '{0:"PLAY",1:123}',
+            CALLBACK_CODEC_HEADER,
+            f'{CALLBACK_CODEC_HEADER}Z',
+            f'{CALLBACK_CODEC_HEADER}0?1',
+            f'{CALLBACK_CODEC_HEADER}01A',
+            f'{CALLBACK_CODEC_HEADER}0Ca',
+        ]
+        for text in invalid_text_list:
+            with self.assertRaises(ValueError, msg=text):
+                decode_callback_data(text)
+
+    def test_pattern(self):
+        for command in CommandEnum:
+            text = encode_callback_data({
+                CallbackKeyEnum.COMMAND: command.name,
+                CallbackKeyEnum.GAME_ID: 1,
+            })
+            for other_command in CommandEnum:
+                pattern = get_callback_data_pattern(other_command)
+                if other_command == command:
+                    self.assertRegex(text, pattern)
+                else:
+                    self.assertNotRegex(text, pattern)
+
+    def test_get_callback_data_command(self):
+        for command in CommandEnum:
+            text = encode_callback_data({
+                CallbackKeyEnum.COMMAND: command.name,
+                CallbackKeyEnum.GAME_ID: 1,
+            })
+            self.assertIs(get_callback_data_command(text), command)
+
+        self.assertIsNone(get_callback_data_command('@close'))
+        self.assertIsNone(get_callback_data_command(CALLBACK_CODEC_HEADER))
+        self.assertIsNone(
+            get_callback_data_command(f'{CALLBACK_CODEC_HEADER}?')
+        )
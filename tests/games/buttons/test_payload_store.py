@@ -0,0 +1,123 @@
+import unittest
+
+from bot.games.buttons.callback_codec import (
+    CALLBACK_CODEC_HEADER,
+    CALLBACK_TOKEN_HEADER,
+    get_callback_data_command,
+    get_callback_data_pattern
+)
+from bot.games.buttons.payload_store import (
+    CallbackPayloadStore,
+    ExpiredPayloadError,
+    clear_game_payloads,
+    decode_callback_payload,
+    encode_callback_payload
+)
+from bot.games.enums.command import CallbackKeyEnum, CommandEnum
+from bot.games.game_id import encode_game_id
+
+
+GAME_ID = 140_234_567_890_123
+
+
+def create_callback_data(text: str = 'A' * 80) -> dict:
+    return {
+        CallbackKeyEnum.COMMAND: CommandEnum.SELECT_COLOR.name,
+        CallbackKeyEnum.GAME_ID: GAME_ID,
+        CallbackKeyEnum.SELECTED_COLOR: text,
+    }
+
+
+class TestCallbackPayloadStore(unittest.TestCase):
+    def test_store_and_load(self):
+        store = CallbackPayloadStore(max_size=4)
+        token = store.store(game_id=1, payload='payload')
+
+        self.assertEqual(store.load(game_id=1, token=token), 'payload')
+        self.assertEqual(store.store(game_id=1, payload='payload'), token)
+        self.assertNotEqual(store.store(game_id=2, payload='other'), None)
+        self.assertEqual(len(store), 2)
+
+    def test_lru_eviction(self):
+        store = CallbackPayloadStore(max_size=2)
+        token_a = store.store(game_id=1, payload='a')
+        token_b = store.store(game_id=1, payload='b')
+        store.load(game_id=1, token=token_a)
+        token_c = store.store(game_id=1, payload='c')
+
+        self.assertEqual(store.load(game_id=1, token=token_a), 'a')
+        self.assertEqual(store.load(game_id=1, token=token_c), 'c')
+        with self.assertRaises(KeyError):
+            store.load(game_id=1, token=token_b)
+        self.assertNotEqual(store.store(game_id=1, payload='b'), token_b)
+
+    def test_max_size_invalid(self):
+        with self.assertRaises(ValueError):
+            CallbackPayloadStore(max_size=0)
+
+    def test_encode_short_payload(self):
+        store = CallbackPayloadStore()
+        callback_data = create_callback_data(text='RED')
+        text = encode_callback_payload(callback_data, store=store)
+
+        self.assertTrue(text.startswith(CALLBACK_CODEC_HEADER))
+        self.assertEqual(len(store), 0)
+        self.assertEqual(
+            decode_callback_payload(text, store=store),
+            callback_data
+        )
+
+    def test_encode_long_payload(self):
+        store = CallbackPayloadStore()
+        callback_data = create_callback_data()
+        text = encode_callback_payload(callback_data, store=store)
+
+        self.assertTrue(text.startswith(CALLBACK_TOKEN_HEADER))
+        self.assertLessEqual(len(text.encode('utf-8')), 16)
+        self.assertEqual(len(store), 1)
+        self.assertEqual(
+            decode_callback_payload(text, store=store),
+            callback_data
+        )
+        self.assertEqual(
+            get_callback_data_command(text),
+            CommandEnum.SELECT_COLOR
+        )
+        self.assertRegex(
+            text,
+            get_callback_data_pattern(CommandEnum.SELECT_COLOR)
+        )
+        self.assertNotRegex(text, get_callback_data_pattern(CommandEnum.PLAY))
+
+    def test_decode_expired_token(self):
+        store = CallbackPayloadStore()
+        text = encode_callback_payload(create_callback_data(), store=store)
+        clear_game_payloads(game_id=encode_game_id(GAME_ID), store=store)
+
+        self.assertEqual(len(store), 0)
+        with self.assertRaises(ExpiredPayloadError):
+            decode_callback_payload(text, store=store)
+        with self.assertRaises(ExpiredPayloadError):
+            decode_callback_payload(f'{CALLBACK_TOKEN_HEADER}', store=store)
+        with self.assertRaises(ExpiredPayloadError):
+            decode_callback_payload(f'{text}0', store=store)
+
+    def test_without_store(self):
+        '''Teste se, sem store, o payload longo não é trocado por um token
+        e se um token não pode ser decodificado.
+        '''
+
+        callback_data = create_callback_data()
+        text = encode_callback_payload(callback_data)
+
+        self.assertTrue(text.startswith(CALLBACK_CODEC_HEADER))
+        self.assertEqual(decode_callback_payload(text), callback_data)
+
+        store = CallbackPayloadStore()
+        token_text = encode_callback_payload(callback_data, store=store)
+        with self.assertRaises(ExpiredPayloadError):
+            decode_callback_payload(token_text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,7 @@ from unittest.mock import Mock
 
 from telegram import InlineKeyboardButton
 
+from bot.games.buttons.callback_codec import CALLBACK_CODEC_HEADER
 from bot.games.buttons.play_button import PlayButton
 from bot.games.enums.command import CallbackKeyEnum, CommandEnum
 
@@ -110,10 +111,11 @@ class TestPlayButton(unittest.TestCase):
         data = {CallbackKeyEnum.COMMAND: "PLAY", CallbackKeyEnum.GAME_ID: 123}
         result = PlayButton.callback_data_to_string(data)
 
-        self.assertIn("0:", result)  # COMMAND index
-        self.assertIn('"PLAY"', result)  # COMMAND index
-        self.assertIn("1:", result)  # GAME_ID index
-        self.assertIn("123", result)  # GAME_ID index
+        self.assertTrue(result.startswith(CALLBACK_CODEC_HEADER))
+        self.assertEqual(
+            PlayButton.callback_data_to_dict(result),
+            {CallbackKeyEnum.COMMAND: "PLAY", CallbackKeyEnum.GAME_ID: 123}
+        )
 
     def test_callback_data_to_dict(self):
         original_data = {
@@ -128,15 +130,21 @@ class TestPlayButton(unittest.TestCase):
 
     def test_callback_data_to_pattern(self):
         pattern = PlayButton.callback_data_to_pattern(CommandEnum.PLAY)
+        play_button = PlayButton("Test", self.mock_game, CommandEnum.PLAY)
+        draw_button = PlayButton("Test", self.mock_game, CommandEnum.DRAW)
 
         self.assertIsInstance(pattern, str)
-        self.assertIn("0:", pattern)
+        self.assertRegex(play_button.data_to_str, pattern)
+        self.assertNotRegex(draw_button.data_to_str, pattern)
 
     def test_callback_data_to_pattern_with_string(self):
         pattern = PlayButton.callback_data_to_pattern("PLAY")
 
         self.assertIsInstance(pattern, str)
-        self.assertIn("0:", pattern)
+        self.assertEqual(
+            pattern,
+            PlayButton.callback_data_to_pattern(CommandEnum.PLAY)
+        )
 
     def test_callback_data_to_pattern_invalid_type(self):
         msg_error = (
@@ -153,10 +161,11 @@ class TestPlayButton(unittest.TestCase):
         result = button.data_to_str
 
         self.assertIsInstance(result, str)
-        self.assertIn("{", result)
-        self.assertIn("}", result)
-        self.assertIn("PLAY", result)
-        self.assertIn("12345", result)
+        self.assertTrue(result.startswith(CALLBACK_CODEC_HEADER))
+        self.assertEqual(
+            PlayButton.callback_data_to_dict(result),
+            {CallbackKeyEnum.COMMAND: "PLAY", CallbackKeyEnum.GAME_ID: 12345}
+        )
 
     def test_make_button(self):
         button = PlayButton("Test", self.mock_game, CommandEnum.PLAY)
@@ -0,0 +1,97 @@
+import unittest
+
+from bot.games.cards.card import Card
+from bot.games.cards.card_category import (
+    CARD_CATEGORY_DICT,
+    NAME_CATEGORY_DICT,
+    get_category_names,
+    get_name_category,
+    register_card_category
+)
+from bot.games.cards.nine_nine import NineNineCard
+from bot.games.enums.card import (
+    CardTraitEnum,
+    ElementalSuits,
+    Names,
+    NineNineNames,
+    NineNineSuits,
+    SpanishNames,
+    SpanishSuits
+)
+
+
+class RuneNames(Names):
+    ONE = '1'
+    TWO = '2'
+    DRAGON = '🐉'
+    SWAP = '⇄'
+
+
+class TestCardCategory(unittest.TestCase):
+    def tearDown(self):
+        CARD_CATEGORY_DICT.pop(RuneNames, None)
+        for name in RuneNames:
+            NAME_CATEGORY_DICT.pop(name, None)
+
+    def test_category(self):
+        card = Card(SpanishNames.KING, SpanishSuits.CUPS)
+
+        self.assertEqual(
+            card.category,
+            CardTraitEnum.NUMBER | CardTraitEnum.FIGURE,
+        )
+        self.assertIsInstance(card.figure_card_names, frozenset)
+        self.assertIn(SpanishNames.KING, card.figure_card_names)
+
+    def test_nine_nine(self):
+        card = NineNineCard(NineNineNames.NINE_NINE, NineNineSuits.BLACK)
+
+        self.assertEqual(card.category, CardTraitEnum.ACTION)
+        self.assertIn(NineNineNames.TEN, card.number_card_names)
+
+    def test_register_card_category(self):
+        '''Teste se uma nova classe Names pode ser registrada sem alterar a
+        classe Card.
+        '''
+
+        register_card_category(
+            RuneNames,
+            number=(RuneNames.ONE, RuneNames.TWO),
+            extra=(RuneNames.DRAGON,),
+            action=(RuneNames.SWAP,),
+        )
+        card = Card(RuneNames.DRAGON, ElementalSuits.FIRE)
+
+        self.assertEqual(card.category, CardTraitEnum.EXTRA)
+        self.assertIn(CardTraitEnum.EXTRA, card.traits)
+        self.assertEqual(
+            card.number_card_names,
+            frozenset((RuneNames.ONE, RuneNames.TWO)),
+        )
+        self.assertEqual(
+            get_category_names(RuneNames, CardTraitEnum.FIGURE),
+            frozenset(),
+        )
+
+    def test_unregistered_names(self):
+        self.assertEqual(get_name_category(RuneNames.ONE), CardTraitEnum(0))
+        self.assertRaises(
+            ValueError,
+            get_category_names,
+            RuneNames,
+            CardTraitEnum.NUMBER,
+        )
+
+    def test_register_invalid_names(self):
+        self.assertRaises(
+            TypeError,
+            register_card_category,
+            ElementalSuits,
+        )
+        self.assertRaises(
+            TypeError,
+            register_card_category,
+            RuneNames,
+            number=(SpanishNames.ONE,),
+        )
+        self.assertNotIn(RuneNames, CARD_CATEGORY_DICT)
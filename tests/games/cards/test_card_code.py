@@ -0,0 +1,51 @@
+import unittest
+
+from bot.games.cards.card import Card
+from bot.games.cards.card_code import decode_card, encode_card, get_card_code
+from bot.games.cards.flip import FlipCard
+from bot.games.cards.nine_nine import NineNineCard
+from bot.games.cards.scoundrel import ScoundrelCard
+from bot.games.enums.card import (
+    NineNineNames,
+    NineNineSuits,
+    RoyalNames,
+    RoyalSuits
+)
+
+
+class TestCardCode(unittest.TestCase):
+    def test_encode_decode(self):
+        card_list = [
+            Card(RoyalNames.ACE, RoyalSuits.SPADES),
+            ScoundrelCard(RoyalNames.KING, RoyalSuits.HEARTS),
+            NineNineCard(NineNineNames.NINE_NINE, NineNineSuits.BLACK),
+        ]
+        for card in card_list:
+            decoded_card = decode_card(encode_card(card))
+
+            self.assertIs(type(decoded_card), type(card))
+            self.assertEqual(decoded_card, card)
+            self.assertEqual(decoded_card.value, card.value)
+            self.assertIsNone(decoded_card.wild_name)
+            self.assertIsNone(decoded_card.wild_suit)
+            self.assertIsNot(decode_card(encode_card(card)), decoded_card)
+
+    def test_same_code(self):
+        self.assertEqual(
+            get_card_code(Card, RoyalNames.ACE, RoyalSuits.SPADES),
+            encode_card(Card(RoyalNames.ACE, RoyalSuits.SPADES)),
+        )
+        self.assertNotEqual(
+            get_card_code(Card, RoyalNames.ACE, RoyalSuits.SPADES),
+            get_card_code(ScoundrelCard, RoyalNames.ACE, RoyalSuits.SPADES),
+        )
+
+    def test_encode_invalid(self):
+        with self.assertRaises(TypeError):
+            encode_card('A')
+        with self.assertRaises(TypeError):
+            get_card_code(FlipCard, RoyalNames.ACE, RoyalSuits.SPADES)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+import copy
+import pickle
+import unittest
+
+from bot.functions.enumeration import get_enum_index
+from bot.games.cards.card import Card
+from bot.games.cards.card_face import (
+    CardFace,
+    get_card_face,
+    get_name_traits,
+    get_suit_traits
+)
+from bot.games.enums.card import (
+    CardTraitEnum,
+    ColorNames,
+    ColorSuits,
+    FullRoyalNames,
+    FullRoyalSuits,
+    RoyalNames,
+    RoyalSuits
+)
+
+
+class TestCardFace(unittest.TestCase):
+    def test_get_card_face(self):
+        '''Teste se as cartas com o mesmo nome e naipe compartilham a face.
+        '''
+
+        face = get_card_face(RoyalNames.ACE, RoyalSuits.CLUBS)
+        card1 = Card(RoyalNames.ACE, RoyalSuits.CLUBS)
+        card2 = Card(RoyalNames.ACE, RoyalSuits.CLUBS)
+
+        self.assertIs(card1.face, face)
+        self.assertIs(card2.face, face)
+        self.assertIsNot(
+            get_card_face(RoyalNames.ACE, RoyalSuits.HEARTS),
+            face,
+        )
+
+    def test_values(self):
+        face = get_card_face(ColorNames.PLUS_TWO, ColorSuits.RED)
+
+        self.assertEqual(face.value, get_enum_index(ColorNames.PLUS_TWO))
+        self.assertEqual(face.suit_value, get_enum_index(ColorSuits.RED))
+        self.assertEqual(
+            face.text,
+            f'{ColorSuits.RED.value}{ColorNames.PLUS_TWO.value}',
+        )
+        self.assertEqual(face.plus_value, 2)
+        self.assertFalse(face.is_wild)
+
+        joker_face = get_card_face(FullRoyalNames.JOKER, FullRoyalSuits.JOKER)
+        self.assertTrue(joker_face.is_wild)
+        self.assertTrue(joker_face.is_black)
+        self.assertTrue(joker_face.is_red)
+
+    def test_traits(self):
+        self.assertEqual(
+            get_name_traits(ColorNames.PLUS_FOUR),
+            CardTraitEnum.ACTION | CardTraitEnum.PLUS,
+        )
+        self.assertEqual(
+            get_name_traits(RoyalNames.ACE),
+            CardTraitEnum.SPECIAL,
+        )
+        self.assertEqual(
+            get_name_traits(FullRoyalNames.QUEEN),
+            CardTraitEnum.FIGURE,
+        )
+        self.assertEqual(
+            get_suit_traits(FullRoyalSuits.JOKER),
+            CardTraitEnum.WILD | CardTraitEnum.BLACK | CardTraitEnum.RED,
+        )
+        self.assertEqual(get_suit_traits(ColorSuits.RED), CardTraitEnum(0))
+
+        card = Card(ColorNames.SEVEN, ColorSuits.BLACK)
+        self.assertEqual(
+            card.traits,
+            CardTraitEnum.NUMBER | CardTraitEnum.WILD,
+        )
+        self.assertTrue(
+            card.traits & (CardTraitEnum.WILD | CardTraitEnum.PLUS)
+        )
+        self.assertFalse(card.traits & CardTraitEnum.ACTION)
+
+    def test_traits_match_card_names(self):
+        '''Teste se as características batem com as listas de nomes de
+        cada categoria da carta.
+        '''
+
+        for names_class, suit in (
+            (RoyalNames, RoyalSuits.CLUBS),
+            (FullRoyalNames, FullRoyalSuits.HEARTS),
+            (ColorNames, ColorSuits.RED),
+        ):
+            for name in names_class:
+                card = Card(name, suit)
+                for card_names, trait in (
+                    (card.number_card_names, CardTraitEnum.NUMBER),
+                    (card.figure_card_names, CardTraitEnum.FIGURE),
+                    (card.special_card_names, CardTraitEnum.SPECIAL),
+                    (card.extra_card_names, CardTraitEnum.EXTRA),
+                    (card.action_card_names, CardTraitEnum.ACTION),
+                ):
+                    self.assertEqual(name in card_names, trait in card.traits)
+
+    def test_immutable(self):
+        face = get_card_face(RoyalNames.ACE, RoyalSuits.CLUBS)
+
+        with self.assertRaises(AttributeError):
+            face.value = 10
+        with self.assertRaises(AttributeError):
+            face.extra = 10
+
+    def test_copy(self):
+        face = get_card_face(RoyalNames.ACE, RoyalSuits.CLUBS)
+
+        self.assertIs(copy.copy(face), face)
+        self.assertIs(copy.deepcopy(face), face)
+        self.assertIs(pickle.loads(pickle.dumps(face)), face)
+
+    def test_wild_overlay(self):
+        '''Teste se os valores WILD usam a face do nome e naipe WILD sem
+        alterar a face da carta.
+        '''
+
+        card = Card(ColorNames.PLUS_FOUR, ColorSuits.BLACK)
+        face = card.face
+        card.set_wild(ColorNames.PLUS_FOUR, ColorSuits.BLUE)
+
+        self.assertIs(card.face, face)
+        self.assertIs(
+            card.active_face,
+            get_card_face(ColorNames.PLUS_FOUR, ColorSuits.BLUE),
+        )
+        self.assertEqual(card.suit_value, get_enum_index(ColorSuits.BLUE))
+        self.assertFalse(card.is_wild)
+
+        card.unset_wild()
+        self.assertIs(card.active_face, face)
+        self.assertTrue(card.is_wild)
+
+    def test_slots(self):
+        card = Card(RoyalNames.ACE, RoyalSuits.CLUBS)
+
+        self.assertFalse(hasattr(card, '__dict__'))
+        self.assertIsInstance(card.face, CardFace)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+import unittest
+
+from collections import Counter
+
+from bot.games.cards.card_code import decode_card, get_card_code
+from bot.games.cards.nine_nine import NineNineCard
+from bot.games.decks.array_deck import ArrayDeck
+from bot.games.decks.deck import BaseDeck
+from bot.games.decks.nine_nine import NineNineDeck
+from bot.games.enums.card import (
+    ColorNames,
+    ColorSuits,
+    NineNineNames,
+    NineNineSuits,
+    RoyalNames,
+    RoyalSuits
+)
+from bot.games.game_random import GameRandom
+
+
+class TestArrayDeck(unittest.TestCase):
+    def make_decks(self, **kwargs):
+        return (
+            ArrayDeck(random=GameRandom(7), **kwargs),
+            BaseDeck(random=GameRandom(7), **kwargs),
+        )
+
+    def test_same_as_base_deck(self):
+        '''Teste se o ArrayDeck cria e embaralha as mesmas cartas que o
+        BaseDeck.
+        '''
+
+        quantities = {
+            (ColorNames.ZERO, ColorSuits.BLACK): 0,
+            ColorNames.ZERO: 1,
+            ColorSuits.BLACK: 2,
+        }
+        array_deck, deck = self.make_decks(
+            names=ColorNames,
+            suits=ColorSuits,
+            quantities=quantities,
+            total_decks=2,
+        )
+
+        self.assertEqual(len(array_deck), len(deck))
+        self.assertEqual(list(array_deck), list(deck))
+        self.assertEqual(str(array_deck), str(deck))
+        self.assertEqual(array_deck.draw(3), deck.draw(3))
+        self.assertEqual(array_deck.draw(), deck.draw())
+        self.assertEqual(array_deck.peek_bottom(2), deck.peek_bottom(2))
+        self.assertEqual(array_deck.draw_all(), deck.draw_all())
+        self.assertEqual(array_deck.draw(), [])
+        self.assertTrue(array_deck.is_empty)
+
+    def test_counts(self):
+        array_deck, deck = self.make_decks(
+            names=NineNineNames,
+            suits=NineNineSuits,
+            total_decks=2,
+            card_class=NineNineCard,
+        )
+
+        self.assertEqual(array_deck.count_names(), deck.count_names())
+        self.assertEqual(array_deck.count_suits(), deck.count_suits())
+        self.assertEqual(array_deck.total_value, deck.total_value)
+        self.assertEqual(
+            array_deck.count_suits()[NineNineSuits.RED],
+            len(NineNineNames) * 2,
+        )
+
+    def test_total_value(self):
+        '''Teste se o total_value usa o value da classe da carta.
+        '''
+
+        deck = NineNineDeck()
+        array_deck = ArrayDeck(
+            names=NineNineNames,
+            suits=NineNineSuits,
+            quantities=deck.quantities,
+            card_class=NineNineCard,
+        )
+
+        self.assertEqual(
+            array_deck.total_value,
+            sum(NineNineCard(card.name, card.suit).value for card in deck),
+        )
+
+    def test_draw_codes(self):
+        deck = ArrayDeck(names=RoyalNames, suits=RoyalSuits, is_shuffle=False)
+        top_card = deck.peek()[0]
+        codes = deck.draw_codes(5)
+
+        self.assertEqual(len(codes), 5)
+        self.assertEqual(len(deck), 47)
+        self.assertEqual(decode_card(codes[0]), top_card)
+
+    def test_add(self):
+        deck = ArrayDeck()
+        card_list = [
+            NineNineCard(NineNineNames.TEN, NineNineSuits.ORAGE),
+            NineNineCard(NineNineNames.NINE, NineNineSuits.ORAGE),
+        ]
+        deck.add(*card_list)
+        deck.add_bottom(card_list[0])
+
+        self.assertEqual(
+            deck.count_names(),
+            Counter({NineNineNames.TEN: 2, NineNineNames.NINE: 1}),
+        )
+        self.assertEqual(deck.total_value, 10 + 10 + 9)
+        self.assertIsInstance(deck.draw()[0], NineNineCard)
+
+    def test_card_code(self):
+        code = get_card_code(
+            NineNineCard,
+            NineNineNames.TEN,
+            NineNineSuits.RED,
+        )
+
+        self.assertEqual(
+            get_card_code(NineNineCard, NineNineNames.TEN, NineNineSuits.RED),
+            code,
+        )
+        self.assertNotEqual(
+            get_card_code(
+                BaseDeck().card_class,
+                NineNineNames.TEN,
+                NineNineSuits.RED,
+            ),
+            code,
+        )
+        self.assertRaises(
+            TypeError,
+            get_card_code,
+            str,
+            NineNineNames.TEN,
+            NineNineSuits.RED,
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
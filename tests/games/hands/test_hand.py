@@ -3,6 +3,7 @@ import unittest
 from bot.games.hands.hand import BaseHand
 from bot.games.cards.card import Card
 from bot.games.enums.card import RoyalNames, RoyalSuits
+from bot.games.game_random import GameRandom
 
 
 class TestHand(unittest.TestCase):
@@ -81,6 +82,17 @@ class TestHand(unittest.TestCase):
         self.assertEqual(len(discarded), 1)
         self.assertIn(self.card1, discarded)
 
+    def test_discard_with_random(self):
+        hand1 = BaseHand(*self.sample_cards, random=GameRandom(1))
+        hand2 = BaseHand(*self.sample_cards)
+        hand2.set_random(GameRandom(1))
+
+        self.assertEqual(
+            hand1.discard(quantity=2),
+            hand2.discard(quantity=2),
+        )
+        self.assertEqual(list(hand1), list(hand2))
+
     def test_discard_empty_hand(self):
         hand = BaseHand()
         msg_error = "empty range for randrange() (0, 0, 0)"
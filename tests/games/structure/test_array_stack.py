@@ -0,0 +1,102 @@
+import unittest
+
+from array import array
+
+from bot.games.cards.card import Card
+from bot.games.cards.card_code import CARD_CODE_TYPECODE, encode_card
+from bot.games.cards.flip import FlipCard
+from bot.games.enums.card import RoyalNames, RoyalSuits
+from bot.games.game_random import GameRandom
+from bot.games.structure.array_stack import ArrayStack
+from bot.games.structure.stack import Stack
+
+
+class TestArrayStack(unittest.TestCase):
+    def setUp(self):
+        self.card1 = Card(RoyalNames.ACE, RoyalSuits.HEARTS)
+        self.card2 = Card(RoyalNames.KING, RoyalSuits.SPADES)
+        self.card3 = Card(RoyalNames.QUEEN, RoyalSuits.DIAMONDS)
+        self.card_list = [self.card1, self.card2, self.card3]
+
+    def test_items(self):
+        stack = ArrayStack(*self.card_list)
+
+        self.assertIsInstance(stack.items, array)
+        self.assertEqual(stack.items.typecode, CARD_CODE_TYPECODE)
+        self.assertEqual(
+            list(stack.items),
+            [encode_card(card) for card in self.card_list],
+        )
+
+    def test_same_as_stack(self):
+        '''Teste se o ArrayStack se comporta como o Stack.
+        '''
+
+        array_stack = ArrayStack(*self.card_list)
+        stack = Stack(*self.card_list)
+
+        self.assertEqual(list(array_stack), list(stack))
+        self.assertEqual(array_stack[0], stack[0])
+        self.assertEqual(array_stack[-1], stack[-1])
+        self.assertEqual(array_stack[0:2], stack[0:2])
+        self.assertEqual(array_stack.text_horizontal, stack.text_horizontal)
+        self.assertEqual(array_stack.text_vertical, stack.text_vertical)
+        self.assertEqual(array_stack.peek(), stack.peek())
+        self.assertEqual(array_stack.peek(2), stack.peek(2))
+        self.assertEqual(array_stack.peek_bottom(), stack.peek_bottom())
+        self.assertEqual(array_stack.peek_bottom(2), stack.peek_bottom(2))
+
+        card = Card(RoyalNames.TWO, RoyalSuits.CLUBS)
+        array_stack.push_bottom(card)
+        stack.push_bottom(card)
+        self.assertEqual(list(array_stack), list(stack))
+
+        self.assertEqual(array_stack.pop(), stack.pop())
+        self.assertEqual(array_stack.pop(2), stack.pop(2))
+        self.assertEqual(array_stack.pop(5), stack.pop(5))
+        self.assertIsNone(array_stack.pop())
+        self.assertIsNone(array_stack.peek())
+        self.assertIsNone(array_stack.peek_bottom())
+        self.assertFalse(array_stack)
+
+    def test_pop_codes(self):
+        stack = ArrayStack(*self.card_list)
+        codes = stack.pop_codes(2)
+
+        self.assertEqual(
+            list(codes),
+            [encode_card(self.card3), encode_card(self.card2)],
+        )
+        self.assertEqual(list(stack), [self.card1])
+        self.assertEqual(len(stack.pop_codes(0)), 0)
+
+    def test_shuffle(self):
+        '''Teste se o shuffle com a mesma seed gera a mesma ordem do Stack.
+        '''
+
+        card_list = [
+            Card(name, suit)
+            for name in RoyalNames
+            for suit in RoyalSuits
+        ]
+        array_stack = ArrayStack(*card_list, random=GameRandom(42))
+        stack = Stack(*card_list, random=GameRandom(42))
+        array_stack.shuffle()
+        stack.shuffle()
+
+        self.assertEqual(list(array_stack), list(stack))
+
+    def test_push_invalid(self):
+        stack = ArrayStack()
+        flip_card = FlipCard(
+            RoyalNames.ACE, RoyalSuits.HEARTS,
+            RoyalNames.TWO, RoyalSuits.SPADES,
+        )
+
+        self.assertRaises(TypeError, stack.push, 'card')
+        self.assertRaises(TypeError, stack.push, flip_card)
+        self.assertEqual(len(stack), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
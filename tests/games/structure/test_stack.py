@@ -5,6 +5,7 @@ from typing import Generator
 
 from bot.games.cards.card import Card
 from bot.games.enums.card import RoyalNames, RoyalSuits
+from bot.games.game_random import GameRandom
 from bot.games.structure.stack import Stack
 
 
@@ -110,6 +111,21 @@ class TestStack(unittest.TestCase):
         )
 
     # Tests Abstract Methods
+
+    def test_shuffle_with_random(self):
+        """
+        Teste se o shuffle com o mesmo Random (mesma seed) gera a mesma
+        ordem.
+        """
+
+        stack1 = Stack(*self.card_list, random=GameRandom(42))
+        stack2 = Stack(*self.card_list)
+        stack2.set_random(GameRandom(42))
+        stack1.shuffle()
+        stack2.shuffle()
+
+        self.assertEqual(stack1.items, stack2.items)
+
     def test_push_multiple_cards(self):
         """Teste push múltiplos Cards para a stack.
         """
@@ -0,0 +1,110 @@
+import unittest
+
+from datetime import datetime, timezone
+
+from bot.games.game_id import (
+    GAME_ID_EPOCH,
+    MAX_GAME_ID,
+    MAX_SEQUENCE,
+    MAX_WORKER_ID,
+    GameIdGenerator,
+    decode_game_id,
+    encode_game_id,
+    get_game_id_timestamp,
+    get_game_id_worker
+)
+
+
+class TestGameIdGenerator(unittest.TestCase):
+    def setUp(self):
+        self.now = datetime(2026, 10, 18, tzinfo=timezone.utc).timestamp()
+
+    def test_next_id_monotonic(self):
+        generator = GameIdGenerator(
+            worker_id=3,
+            time_function=lambda: self.now
+        )
+        id_list = [generator.next_id() for _ in range(MAX_SEQUENCE * 3)]
+
+        self.assertEqual(id_list, sorted(id_list))
+        self.assertEqual(len(set(id_list)), len(id_list))
+        for game_id in id_list:
+            self.assertEqual(get_game_id_worker(game_id), 3)
+
+    def test_next_id_clock_backwards(self):
+        now_list = [self.now, self.now - 10, self.now + 1]
+        generator = GameIdGenerator(time_function=lambda: now_list.pop(0))
+        id_list = [generator.next_id() for _ in range(3)]
+
+        self.assertEqual(id_list, sorted(id_list))
+        self.assertEqual(len(set(id_list)), 3)
+
+    def test_workers_do_not_collide(self):
+        generator1 = GameIdGenerator(
+            worker_id=1,
+            time_function=lambda: self.now
+        )
+        generator2 = GameIdGenerator(
+            worker_id=2,
+            time_function=lambda: self.now
+        )
+        id_set1 = {generator1.next_id() for _ in range(100)}
+        id_set2 = {generator2.next_id() for _ in range(100)}
+
+        self.assertFalse(id_set1 & id_set2)
+
+    def test_get_game_id_timestamp(self):
+        generator = GameIdGenerator(time_function=lambda: self.now)
+        game_id = generator.next_id()
+
+        self.assertEqual(
+            get_game_id_timestamp(game_id).timestamp(),
+            self.now
+        )
+        self.assertGreater(self.now, GAME_ID_EPOCH)
+
+    def test_short_id(self):
+        generator = GameIdGenerator(
+            worker_id=MAX_WORKER_ID,
+            time_function=lambda: self.now
+        )
+        game_id = generator.next_id()
+
+        self.assertLessEqual(len(encode_game_id(game_id)), 7)
+        self.assertLess(len(encode_game_id(game_id)), len(str(game_id)))
+
+    def test_worker_id_invalid(self):
+        with self.assertRaises(ValueError):
+            GameIdGenerator(worker_id=MAX_WORKER_ID + 1)
+        with self.assertRaises(ValueError):
+            GameIdGenerator(worker_id=-1)
+        with self.assertRaises(TypeError):
+            GameIdGenerator(worker_id='1')
+
+
+class TestGameIdEncoding(unittest.TestCase):
+    def test_roundtrip(self):
+        for game_id in (0, 1, 61, 62, 12345, 2 ** 41 + 7):
+            text = encode_game_id(game_id)
+            self.assertEqual(decode_game_id(text), game_id)
+
+    def test_decode_int(self):
+        self.assertEqual(decode_game_id(123), 123)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            encode_game_id(-1)
+        with self.assertRaises(ValueError):
+            decode_game_id('')
+        with self.assertRaises(ValueError):
+            decode_game_id('abc-1')
+        with self.assertRaises(ValueError):
+            decode_game_id('z' * 20)
+        self.assertEqual(
+            decode_game_id(encode_game_id(MAX_GAME_ID)),
+            MAX_GAME_ID
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
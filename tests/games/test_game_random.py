@@ -0,0 +1,77 @@
+import unittest
+
+from collections import Counter
+
+from bot.games.game_random import GameRandom
+
+
+class TestGameRandom(unittest.TestCase):
+    def test_same_seed_same_sequence(self):
+        random1 = GameRandom(42)
+        random2 = GameRandom(42)
+
+        self.assertEqual(
+            [random1.next_uint64() for _ in range(10)],
+            [random2.next_uint64() for _ in range(10)],
+        )
+        self.assertNotEqual(
+            GameRandom(1).next_uint64(),
+            GameRandom(2).next_uint64(),
+        )
+
+    def test_seed_none(self):
+        random = GameRandom()
+
+        self.assertIsInstance(random.seed_value, int)
+        self.assertNotEqual(random.seed_value, GameRandom().seed_value)
+
+    def test_seed_invalid(self):
+        self.assertRaises(TypeError, GameRandom, 'seed')
+
+    def test_getstate_setstate(self):
+        random = GameRandom(7)
+        random.random()
+        state = random.getstate()
+        value_list = [random.randint(0, 100) for _ in range(10)]
+        random.setstate(state)
+
+        self.assertEqual(state, (7, random.state))
+        self.assertEqual(
+            [random.randint(0, 100) for _ in range(10)],
+            value_list,
+        )
+
+    def test_shuffle(self):
+        random = GameRandom(3)
+        item_list = list(range(52))
+        random.shuffle(item_list)
+
+        self.assertEqual(sorted(item_list), list(range(52)))
+        self.assertNotEqual(item_list, list(range(52)))
+        self.assertEqual(GameRandom(3).permutation(52), item_list)
+
+    def test_randint_range(self):
+        random = GameRandom(5)
+        counter = Counter(random.randint(1, 6) for _ in range(6000))
+
+        self.assertEqual(sorted(counter), [1, 2, 3, 4, 5, 6])
+        for total in counter.values():
+            self.assertGreater(total, 800)
+
+    def test_random_range(self):
+        random = GameRandom(11)
+        for _ in range(1000):
+            value = random.random()
+            self.assertGreaterEqual(value, 0)
+            self.assertLess(value, 1)
+
+    def test_getrandbits(self):
+        random = GameRandom(13)
+
+        self.assertEqual(random.getrandbits(0), 0)
+        self.assertLess(random.getrandbits(3), 8)
+        self.assertLess(random.getrandbits(100), 2 ** 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,177 @@
+import unittest
+
+from random import Random
+
+from bot.games.boards import ColorsGameBoard, JokerJailBoard, ScoundrelBoard
+from bot.games.buttons.play_button import PlayButton
+from bot.games.enums.command import CallbackKeyEnum
+from bot.games.journal import (
+    JOURNAL_ADD_PLAYER,
+    JOURNAL_PLAY,
+    JOURNAL_START,
+    PlayJournal
+)
+from bot.games.player import Player
+
+
+def play_random_game(board, journal, total_plays: int, seed: int = 0):
+    random = Random(seed)
+    for _ in range(total_plays):
+        if board.game_over:
+            break
+        player = board.current_player
+        button_list = board.player_keyboard(player=player).play_button_list
+        button = random.choice(button_list)
+        play_dict = PlayButton.callback_data_to_dict(button.data_to_str)
+        journal.append_play(board=board, player=player, play_dict=play_dict)
+        board.play(player=player, play_dict=play_dict)
+
+
+class TestPlayJournal(unittest.TestCase):
+    def assert_same_state(self, restored, board):
+        self.assertEqual(restored.id, board.id)
+        self.assertEqual(restored.turn, board.turn)
+        self.assertEqual(restored.current_player, board.current_player)
+        self.assertEqual(restored.player_list, board.player_list)
+        for restored_player, player in zip(
+            restored.player_list, board.player_list
+        ):
+            self.assertEqual(list(restored_player.hand), list(player.hand))
+        self.assertEqual(list(restored.draw_pile), list(board.draw_pile))
+        self.assertEqual(
+            [list(pile) for pile in restored.discard_piles],
+            [list(pile) for pile in board.discard_piles],
+        )
+        self.assertEqual(
+            [report.action for report in restored.log],
+            [report.action for report in board.log],
+        )
+
+    def test_replay_colors(self):
+        board = ColorsGameBoard(Player(player_id='1', name='Ana'))
+        journal = PlayJournal.from_board(board=board)
+        for player in (
+            Player(player_id='2', name='Bia'),
+            Player(player_id='3', name='Caio'),
+        ):
+            journal.append_add_player(player=player)
+            board.add_player(player)
+        journal.append_start()
+        board.start()
+        play_random_game(board, journal, total_plays=15)
+
+        self.assertEqual(len(journal), 2 + 1 + 15)
+        self.assert_same_state(journal.replay(), board)
+
+    def test_replay_scoundrel(self):
+        '''Teste se o replay é idêntico em uma partida longa, com
+        descartes aleatórios feitos pelo Random da partida.
+        '''
+
+        board = ScoundrelBoard(Player(player_id='1', name='Ana'), seed=7)
+        journal = PlayJournal.from_board(board=board)
+        journal.append_start()
+        board.start()
+        play_random_game(board, journal, total_plays=200, seed=3)
+        restored = journal.replay()
+
+        self.assert_same_state(restored, board)
+        self.assertEqual(restored.hp, board.hp)
+        self.assertEqual(restored.random.getstate(), board.random.getstate())
+
+    def test_replay_limit(self):
+        board = JokerJailBoard(Player(player_id='1', name='Ana'))
+        journal = PlayJournal.from_board(board=board)
+        journal.append_start()
+        board.start()
+        before_plays = journal.replay()
+        play_random_game(board, journal, total_plays=5)
+
+        self.assert_same_state(journal.replay(limit=1), before_plays)
+        self.assert_same_state(journal.replay(), board)
+
+    def test_play_from_player_out_of_game(self):
+        board = ColorsGameBoard(
+            Player(player_id='1', name='Ana'),
+            Player(player_id='2', name='Bia'),
+        )
+        board.start()
+        journal = PlayJournal.from_board(board=board)
+        intruder = Player(player_id='9', name='Intruso')
+        play_dict = {
+            CallbackKeyEnum.COMMAND: 'PLAY',
+            CallbackKeyEnum.GAME_ID: board.id,
+            CallbackKeyEnum.HAND_POSITION: 0,
+        }
+        journal.append_play(board=board, player=intruder, play_dict=play_dict)
+        board.play(player=intruder, play_dict=play_dict)
+
+        kind, (player, entry_play_dict) = next(journal.iter_entries())
+        self.assertEqual(kind, JOURNAL_PLAY)
+        self.assertEqual(player, ('9', 'Intruso'))
+        self.assertEqual(entry_play_dict, play_dict)
+        self.assert_same_state(journal.replay(), board)
+
+    def test_replay_rejected_play(self):
+        '''Teste se refazer uma jogada recusada (fora da vez) altera somente
+        o log da partida.
+        '''
+
+        board = ColorsGameBoard(
+            Player(player_id='1', name='Ana'),
+            Player(player_id='2', name='Bia'),
+        )
+        board.start()
+        journal = PlayJournal.from_board(board=board)
+        player = next(
+            player
+            for player in board.player_list
+            if player != board.current_player
+        )
+        play_dict = {
+            CallbackKeyEnum.COMMAND: 'DRAW',
+            CallbackKeyEnum.GAME_ID: board.id,
+        }
+        entry = journal.encode_play(
+            board=board,
+            player=player,
+            play_dict=play_dict,
+        )
+        play_response = board.play(player=player, play_dict=play_dict)
+        journal.append_encoded_play(entry)
+        self.assertIsInstance(play_response, str)
+
+        before_play = journal.replay(limit=0)
+        restored = journal.replay()
+        self.assert_same_state(restored, board)
+        self.assertEqual(
+            len(list(restored.log)),
+            len(list(before_play.log)) + 1,
+        )
+        before_play.log = restored.log
+        self.assert_same_state(restored, before_play)
+        self.assertEqual(
+            restored.random.getstate(),
+            before_play.random.getstate(),
+        )
+
+    def test_to_bytes(self):
+        board = ColorsGameBoard(Player(player_id='1', name='Ana'))
+        journal = PlayJournal.from_board(board=board)
+        journal.append_add_player(Player(player_id='2', name='Bia'))
+        journal.append_start()
+        loaded = PlayJournal.from_bytes(journal.to_bytes())
+
+        self.assertEqual(len(loaded), 2)
+        self.assertEqual(loaded.base, journal.base)
+        self.assertEqual(
+            [kind for kind, _ in loaded.iter_entries()],
+            [JOURNAL_ADD_PLAYER, JOURNAL_START],
+        )
+
+    def test_from_bytes_invalid_version(self):
+        self.assertRaises(ValueError, PlayJournal.from_bytes, b'\x09')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,247 @@
+import pickle
+import unittest
+
+from unittest.mock import patch
+
+from bot.games.boards import (
+    ColorsGameBoard,
+    GolfSolitaireBoard,
+    JokerJailBoard,
+    ScoundrelBoard,
+    get_board_list,
+    snapshot_board_factory
+)
+from bot.games.cards.card import Card
+from bot.games.cards.flex import FlexCard
+from bot.games.enums.card import ColorNames, ColorSuits, RoyalNames, RoyalSuits
+from bot.games.player import Player
+from bot.games.snapshot import (
+    NAME_LIST,
+    SNAPSHOT_VERSION,
+    SUIT_LIST,
+    SnapshotReader,
+    SnapshotWriter,
+    get_snapshot_board_id
+)
+
+
+def make_players(total: int):
+    return [
+        Player(
+            player_id=str(1000000000 + index),
+            name=f'Jogador {index}',
+            message_id=100 + index,
+        )
+        for index in range(total)
+    ]
+
+
+class TestSnapshotCodec(unittest.TestCase):
+    def test_tables_fit_in_one_byte(self):
+        self.assertLess(len(NAME_LIST), 0x80)
+        self.assertLess(len(SUIT_LIST), 0x80)
+
+    def test_numbers_and_strings(self):
+        writer = SnapshotWriter(board_id=7)
+        for value in (0, 1, 127, 128, 2 ** 62):
+            writer.write_uint(value)
+        for value in (0, -1, 1, -300, 300):
+            writer.write_int(value)
+        writer.write_optional_uint(None)
+        writer.write_optional_uint(0)
+        writer.write_str('Ação 🃏')
+        writer.write_player_id('1234567890')
+        writer.write_player_id('0000000000')
+        reader = SnapshotReader(writer.getvalue())
+
+        self.assertEqual(reader.board_id, 7)
+        self.assertEqual(
+            [reader.read_uint() for _ in range(5)],
+            [0, 1, 127, 128, 2 ** 62]
+        )
+        self.assertEqual(
+            [reader.read_int() for _ in range(5)],
+            [0, -1, 1, -300, 300]
+        )
+        self.assertIsNone(reader.read_optional_uint())
+        self.assertEqual(reader.read_optional_uint(), 0)
+        self.assertEqual(reader.read_str(), 'Ação 🃏')
+        self.assertEqual(reader.read_player_id(), '1234567890')
+        self.assertEqual(reader.read_player_id(), '0000000000')
+        reader.check_end()
+
+    def test_cards(self):
+        wild_card = Card(ColorNames.PLUS_FOUR, ColorSuits.BLACK)
+        wild_card.set_wild_suit(ColorSuits.RED)
+        card_list = [Card(RoyalNames.ACE, RoyalSuits.SPADES), None, wild_card]
+        writer = SnapshotWriter(board_id=1)
+        writer.write_cards(card_list)
+        reader = SnapshotReader(writer.getvalue())
+        result = reader.read_cards()
+
+        self.assertEqual(result[0], card_list[0])
+        self.assertIsNone(result[1])
+        self.assertEqual(result[2].real_suit, ColorSuits.BLACK)
+        self.assertEqual(result[2].suit, ColorSuits.RED)
+
+    def test_unsupported_card(self):
+        writer = SnapshotWriter(board_id=1)
+        card = FlexCard(RoyalNames.ACE, RoyalSuits.SPADES)
+
+        self.assertRaises(TypeError, writer.write_card, card)
+
+    def test_invalid_version(self):
+        data = bytes([SNAPSHOT_VERSION + 1, 1])
+
+        self.assertRaises(ValueError, SnapshotReader, data)
+
+    def test_truncated(self):
+        writer = SnapshotWriter(board_id=1)
+        writer.write_str('texto')
+        reader = SnapshotReader(writer.getvalue()[:-1])
+
+        self.assertRaises(ValueError, reader.read_str)
+
+
+class TestBoardSnapshot(unittest.TestCase):
+    def assert_roundtrip(self, board):
+        data = board.to_snapshot()
+        restored = snapshot_board_factory(data)
+
+        self.assertIsInstance(restored, board.__class__)
+        self.assertEqual(restored.to_snapshot(), data)
+        self.assertEqual(restored.id, board.id)
+        self.assertEqual(restored.turn, board.turn)
+        self.assertEqual(restored.is_started, board.is_started)
+        self.assertEqual(restored.player_list, board.player_list)
+        self.assertEqual(str(restored.log), str(board.log))
+        for restored_player, player in zip(
+            restored.player_list, board.player_list
+        ):
+            self.assertEqual(restored_player.name, player.name)
+            self.assertEqual(restored_player.message_id, player.message_id)
+            self.assertEqual(list(restored_player.hand), list(player.hand))
+        self.assertEqual(list(restored.draw_pile), list(board.draw_pile))
+        self.assertEqual(
+            [list(pile) for pile in restored.discard_piles],
+            [list(pile) for pile in board.discard_piles],
+        )
+        self.assertLess(len(data), len(pickle.dumps(board)) // 4)
+
+        return restored
+
+    def test_snapshot_ids_unique(self):
+        snapshot_id_list = [
+            board_class.SNAPSHOT_ID
+            for board_class in get_board_list()
+        ]
+
+        self.assertNotIn(None, snapshot_id_list)
+        self.assertEqual(len(set(snapshot_id_list)), len(snapshot_id_list))
+
+    def test_colors(self):
+        board = ColorsGameBoard(*make_players(3))
+        board.start()
+        board.pending_draw = 4
+        board.selecting_color = True
+        restored = self.assert_roundtrip(board)
+
+        self.assertEqual(restored.pending_draw, 4)
+        self.assertIs(restored.selecting_color, True)
+        self.assertEqual(restored.current_player, board.current_player)
+
+    def test_colors_not_started(self):
+        board = ColorsGameBoard(*make_players(1))
+
+        self.assert_roundtrip(board)
+
+    def test_scoundrel(self):
+        board = ScoundrelBoard(*make_players(1))
+        board.start()
+        board.hp = 3
+        board.healed_this_turn = True
+        restored = self.assert_roundtrip(board)
+
+        self.assertEqual(restored.hp, 3)
+        self.assertEqual(restored.max_hp, board.max_hp)
+        self.assertIs(restored.healed_this_turn, True)
+        self.assertEqual(list(restored.field_pile), list(board.field_pile))
+
+    def test_jokerjail(self):
+        board = JokerJailBoard(*make_players(1))
+        board.start()
+        board.selected_card_indexes = [1, 3]
+        restored = self.assert_roundtrip(board)
+
+        self.assertEqual(restored.selected_card_indexes, [1, 3])
+        self.assertEqual(list(restored.joker_pile), list(board.joker_pile))
+
+    def test_golf_solitaire(self):
+        board = GolfSolitaireBoard(*make_players(1))
+        board.start()
+        board.board[4][0] = None
+        restored = self.assert_roundtrip(board)
+
+        self.assertEqual(restored.board, board.board)
+        self.assertIsNone(restored.board[4][0])
+
+    def test_seed(self):
+        board1 = ColorsGameBoard(*make_players(2), seed=123)
+        board2 = ColorsGameBoard(*make_players(2), seed=123)
+        board1.start()
+        board2.start()
+        restored = self.assert_roundtrip(board1)
+
+        self.assertEqual(list(board1.draw_pile), list(board2.draw_pile))
+        self.assertEqual(restored.seed, 123)
+        self.assertEqual(
+            restored.random.getstate(), board1.random.getstate()
+        )
+        self.assertIs(restored.draw_pile.card_stack.random, restored.random)
+        self.assertIs(restored.player_list[0].hand.random, restored.random)
+
+    def test_report_of_removed_player(self):
+        player_list = make_players(2)
+        board = ColorsGameBoard(*player_list)
+        board.add_log(action='Jogou.', player=player_list[1])
+        board.remove_player(player_list[1])
+        restored = self.assert_roundtrip(board)
+
+        self.assertEqual(len(restored.player_list), 1)
+        self.assertEqual(next(iter(restored.log)).player, player_list[1])
+
+    def test_from_snapshot_skips_init(self):
+        '''Teste se o from_snapshot não gera um novo id nem cria o deck da
+        board.
+        '''
+
+        board = ScoundrelBoard(*make_players(1), seed=123)
+        board.start()
+        deck_path = 'bot.games.boards.scoundrel_board.ScoundrelDeck'
+        with patch('bot.games.boards.board.new_game_id') as new_game_id_mock:
+            with patch(deck_path) as deck_mock:
+                restored = self.assert_roundtrip(board)
+
+        new_game_id_mock.assert_not_called()
+        deck_mock.assert_not_called()
+        self.assertIs(restored.is_loading_snapshot, False)
+        self.assertEqual(restored.seed, 123)
+
+    def test_from_snapshot_wrong_board(self):
+        data = ScoundrelBoard(*make_players(1)).to_snapshot()
+
+        self.assertEqual(
+            get_snapshot_board_id(data), ScoundrelBoard.SNAPSHOT_ID
+        )
+        self.assertRaises(ValueError, ColorsGameBoard.from_snapshot, data)
+
+    def test_from_snapshot_extra_bytes(self):
+        data = ScoundrelBoard(*make_players(1)).to_snapshot()
+
+        self.assertRaises(
+            ValueError, ScoundrelBoard.from_snapshot, data + b'\x00'
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()